@@ -0,0 +1,113 @@
+"""Measure the throughput of export downloads against a local HTTP server, from the former 1 KB chunks flushed one by
+one to Downloader with parallel range requests.
+
+    $ python -m benchmarks.download_throughput [size in MB]
+"""
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from tenable_io.client import TenableIOClient
+from tenable_io.downloader import Downloader
+from tenable_io.util import DOWNLOAD_CHUNK_SIZE, copy_stream
+
+SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+CONTENT = os.urandom(1024 * 1024) * SIZE
+URI = 'workbenches/export/%(file_id)s/download'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range') or '')
+        if match:
+            start, end = int(match.group(1)), min(int(match.group(2)), len(CONTENT) - 1)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, len(CONTENT)))
+        else:
+            start, end = 0, len(CONTENT) - 1
+            self.send_response(200)
+        self.send_header('ETag', '"benchmark"')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        view = memoryview(CONTENT)
+        for offset in range(start, end + 1, 1024 * 1024):
+            self.wfile.write(view[offset:min(offset + 1024 * 1024, end + 1)])
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def iter_content_flush(client, path):
+    response = client.get(URI, {'file_id': 1}, stream=True)
+    with open(path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=1024):
+            f.write(chunk)
+            f.flush()
+
+
+def iter_content(client, path):
+    response = client.get(URI, {'file_id': 1}, stream=True)
+    with open(path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+
+
+def readinto(client, path):
+    response = client.get(URI, {'file_id': 1}, stream=True)
+    response.raw.decode_content = True
+    with open(path, 'wb') as f:
+        copy_stream(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+
+
+def downloader(segments):
+    def download(client, path):
+        Downloader(client, segments=segments).download(URI, path, {'file_id': 1})
+    return download
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    client = TenableIOClient(endpoint='http://127.0.0.1:%s/' % server.server_port)
+    directory = tempfile.mkdtemp()
+
+    try:
+        print(u'%-36s %10s %10s' % (u'Method (%d MB)' % SIZE, u'time (s)', u'MB/s'))
+        for name, download in [
+            (u'iter_content(1 KB) + flush', iter_content_flush),
+            (u'iter_content(%d KB)' % (DOWNLOAD_CHUNK_SIZE // 1024), iter_content),
+            (u'readinto(%d KB)' % (DOWNLOAD_CHUNK_SIZE // 1024), readinto),
+            (u'Downloader, 1 segment', downloader(1)),
+            (u'Downloader, 4 segments', downloader(4)),
+        ]:
+            path = os.path.join(directory, name.replace(u' ', u'_'))
+            start = time.time()
+            download(client, path)
+            elapsed = time.time() - start
+            assert os.path.getsize(path) == len(CONTENT)
+            os.remove(path)
+            print(u'%-36s %10.2f %10.1f' % (name, elapsed, SIZE / elapsed))
+    finally:
+        shutil.rmtree(directory)
+        client._session.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Compare BaseModel.from_dict with the generic setattr based deserialization on large API payloads. The time spent in
+json.loads, which is the same for both, is reported separately.
+
+    $ python -m benchmarks.models_from_json
+"""
+import inspect
+import json
+import timeit
+
+from tenable_io.api import models
+from tenable_io.api.models import AssetList, BaseModel, ScanList, VulnerabilityList
+
+ROWS = 20000
+REPEAT = 3
+
+PAYLOADS = [
+    (AssetList, json.dumps({'assets': [{
+        'id': '0b1f3c7e-5f0d-4f6e-8f5a-%012d' % i, 'has_agent': False, 'last_seen': '2017-05-15T00:00:00.000Z',
+        'sources': [{'name': 'NESSUS_SCAN', 'first_seen': '2017-05-01T00:00:00.000Z'}],
+        'fqdn': ['host%d.example.com' % i], 'ipv4': ['10.0.%d.%d' % (i // 256 % 256, i % 256)], 'ipv6': [],
+        'mac_address': [], 'netbios_name': [], 'operating_system': ['Linux'],
+        'severities': [{'count': 1, 'level': level, 'name': name}
+                       for level, name in enumerate(['Info', 'Low', 'Medium', 'High', 'Critical'])],
+    } for i in range(ROWS)], 'total': ROWS})),
+    (VulnerabilityList, json.dumps({'vulnerabilities': [{
+        'count': 12, 'plugin_family': 'General', 'plugin_id': i, 'plugin_name': 'Plugin %d' % i,
+        'vulnerability_state': 'New', 'severity': i % 5,
+    } for i in range(ROWS)], 'total_vulnerability_count': ROWS})),
+    (ScanList, json.dumps({'folders': [], 'timestamp': 1494806400, 'scans': [{
+        'id': i, 'uuid': 'template-%d' % i, 'name': 'Scan %d' % i, 'type': 'remote', 'owner': 'admin',
+        'enabled': False, 'folder_id': 3, 'read': True, 'status': 'completed', 'shared': False,
+        'user_permissions': 128, 'creation_date': 1494806400, 'last_modification_date': 1494810000,
+        'control': True, 'starttime': None, 'timezone': None, 'rrules': None,
+    } for i in range(ROWS)]})),
+]
+
+
+def generic(cls):
+    def deserializer(dict_):
+        instance = cls()
+        for key in dict_:
+            setattr(instance, key, dict_[key])
+        return instance
+    return deserializer
+
+
+def model_classes():
+    return [cls for _, cls in inspect.getmembers(models, inspect.isclass) if issubclass(cls, BaseModel)]
+
+
+def best_time(f):
+    return min(timeit.repeat(f, number=1, repeat=REPEAT))
+
+
+def main():
+    print(u'%-20s %12s %12s %12s %10s' % (u'Model (%d rows)' % ROWS, u'loads (s)', u'generic (s)', u'compiled (s)',
+                                          u'speedup'))
+    for model, payload in PAYLOADS:
+        loads_time = best_time(lambda: json.loads(payload))
+        dict_ = json.loads(payload)
+
+        models._deserializers.clear()
+        models._deserializers.update({cls: generic(cls) for cls in model_classes()})
+        generic_time = best_time(lambda: model.from_dict(dict_))
+
+        models._deserializers.clear()
+        compiled_time = best_time(lambda: model.from_dict(dict_))
+
+        print(u'%-20s %12.3f %12.3f %12.3f %9.1fx' % (model.__name__, loads_time, generic_time, compiled_time,
+                                                      generic_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Measure the memory used per model instance, compared to an equivalent model storing its attributes in a __dict__.
+
+    $ python -m benchmarks.models_memory
+"""
+import gc
+import tracemalloc
+
+from tenable_io.api.models import Agent, Asset, ScanHistory, Vulnerability
+
+INSTANCES = 100000
+
+SAMPLES = [
+    (Vulnerability, {
+        'count': 12, 'plugin_family': 'General', 'plugin_id': 19506, 'plugin_name': 'Nessus Scan Information',
+        'vulnerability_state': 'New', 'severity': 0,
+    }),
+    (Asset, {
+        'id': '0b1f3c7e-5f0d-4f6e-8f5a-2f0c9c4a1b2c', 'fqdn': ['host.example.com'], 'ipv4': ['10.0.0.1'],
+        'ipv6': [], 'last_seen': '2017-05-15T00:00:00.000Z', 'netbios_name': [], 'severities': [],
+    }),
+    (ScanHistory, {
+        'name': 'Nightly', 'object_id': 42, 'owner': 'admin', 'owner_id': 1, 'owner_uuid': 'u', 'schedule_uuid': 's',
+        'scan_start': 1494806400, 'scan_end': 1494810000, 'scanner_name': 'US Cloud Scanner', 'status': 'completed',
+        'targets': '10.0.0.0/24', 'uuid': 'h',
+    }),
+    (Agent, {
+        'distro': 'es7-x86-64', 'id': 1, 'ip': '10.0.0.1', 'last_scanned': 1494806400, 'name': 'agent',
+        'platform': 'LINUX', 'token': 't', 'uuid': 'u',
+    }),
+]
+
+
+def dict_model(dict_):
+    instance = DictModel()
+    for key in dict_:
+        setattr(instance, key, dict_[key])
+    return instance
+
+
+class DictModel(object):
+    pass
+
+
+def bytes_per_instance(factory, dict_):
+    gc.collect()
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    instances = [factory(dict_) for _ in range(INSTANCES)]
+    size = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+    tracemalloc.stop()
+    del instances
+    # Remove the list holding the instances (one pointer per instance).
+    return float(size) / INSTANCES - 8
+
+
+def main():
+    print(u'%-15s %15s %15s' % (u'Model', u'__dict__ bytes', u'slots bytes'))
+    for model, dict_ in SAMPLES:
+        print(u'%-15s %15.1f %15.1f' % (
+            model.__name__,
+            bytes_per_instance(dict_model, dict_),
+            bytes_per_instance(model.from_dict, dict_),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+"""Time and measure the peak memory of the parser, model hydration, parameter flattening and helper flows on synthetic
+data of 1k and 10k hosts, and compare the results with a saved baseline. Helper flows run against a
+:class:`tests.mock_server.MockServer`, offline.
+
+    $ python -m benchmarks.suite                      # Run and compare with benchmarks/baseline.json.
+    $ python -m benchmarks.suite --save               # Run and save the results as the new baseline.
+    $ python -m benchmarks.suite --sizes 1000 --check # Exit with status 1 on regressions.
+    $ python -m benchmarks.suite --sizes 100000       # Also available, not part of the default sizes.
+
+Timings are the best of --repeat runs. The peak memory is measured with tracemalloc in a separate run, as tracing slows
+down allocations. The peak memory of helper flows includes the allocations of the mock server thread.
+
+The committed benchmarks/baseline.json is a reference of the default sizes measured on a single CPU machine. Timings
+depend on the hardware, run with --save first to compare with a baseline of the same machine.
+"""
+import argparse
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from tenable_io.api.models import AssetList, VulnerabilityList
+from tenable_io.client import TenableIOClient
+from tenable_io.helpers.workbench import AssetVulnerabilities, Vulnerability
+from tenable_io.parser.workbenches import WorkbenchParser
+from tenable_io.util import PollingPolicy
+from tests import synthetic
+from tests.mock_server import MockServer
+from tests.synthetic import SyntheticData
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SIZES = [1000, 10000, 100000]
+ITEMS_PER_HOST = 10
+PLUGINS = 1000
+# Number of hosts per scan of the mock server.
+HOSTS_PER_SCAN = 100
+POLLING_POLICY = PollingPolicy(initial=0.01)
+
+
+class Data(object):
+    """Synthetic data of a number of hosts, generated on first use and shared by the benchmarks of the same size.
+    """
+
+    def __init__(self, hosts, temp_dir):
+        self.hosts = hosts
+        self.synthetic = SyntheticData(hosts, ITEMS_PER_HOST, PLUGINS)
+        self._temp_dir = temp_dir
+        self._cache = {}
+
+    def _get(self, name, factory):
+        if name not in self._cache:
+            self._cache[name] = factory()
+        return self._cache[name]
+
+    @property
+    def nessus_path(self):
+        def write():
+            path = os.path.join(self._temp_dir, 'report-%d.nessus' % self.hosts)
+            synthetic.write(self.synthetic.iter_nessus(), path)
+            return path
+        return self._get('nessus_path', write)
+
+    @property
+    def reports(self):
+        return self._get('reports', lambda: list(WorkbenchParser.parse(self.nessus_path)))
+
+    @property
+    def report_items(self):
+        return self._get('report_items', lambda: [item for report in self.reports for item in report['report_items']])
+
+    @property
+    def assets_json(self):
+        return self._get('assets_json', lambda: self.synthetic.json('assets'))
+
+    @property
+    def vulnerabilities_json(self):
+        # One vulnerability per finding.
+        return self._get('vulnerabilities_json', lambda: SyntheticData(
+            self.hosts, ITEMS_PER_HOST, self.hosts * ITEMS_PER_HOST).json('vulnerabilities'))
+
+    @property
+    def client(self):
+        def start():
+            server = MockServer(scans=self.hosts // HOSTS_PER_SCAN, hosts=self.hosts, items_per_host=ITEMS_PER_HOST,
+                                plugins=PLUGINS).start()
+            return server, server.client()
+        return self._get('client', start)[1]
+
+    def close(self):
+        """Stop the mock server, if started.
+        """
+        if 'client' in self._cache:
+            server, client = self._cache.pop('client')
+            client._session.close()
+            server.stop()
+
+    @property
+    def filters(self):
+        return self._get('filters', lambda: {'filter': [{
+            'quality': 'eq', 'filter': 'host.target', 'value': ['10.0.0.%d' % (i % 256), {'nested': [i, {'deep': i}]}],
+        } for i in range(self.hosts)], 'search_type': 'and'})
+
+
+def parse(data):
+    path = data.nessus_path
+    return lambda: sum(1 for _ in WorkbenchParser.parse(path))
+
+
+def parse_items(data):
+    path = data.nessus_path
+    return lambda: sum(1 for _ in WorkbenchParser.parse(path, tag=WorkbenchParser.REPORT_ITEM))
+
+
+def asset_vulnerabilities_from_report(data):
+    reports = data.reports
+    return lambda: [AssetVulnerabilities().from_report(report) for report in reports]
+
+
+def vulnerability_from_report_item(data):
+    items = data.report_items
+    return lambda: [Vulnerability().from_report_item(item) for item in items]
+
+
+def asset_list_from_json(data):
+    payload = data.assets_json
+    return lambda: AssetList.from_json(payload)
+
+
+def vulnerability_list_from_json(data):
+    payload = data.vulnerabilities_json
+    return lambda: VulnerabilityList.from_json(payload)
+
+
+def flatten_param(data):
+    filters = data.filters
+    return lambda: TenableIOClient._flatten_param(filters)
+
+
+def workbench_vulnerabilities(data):
+    client = data.client
+    return lambda: sum(len(page) for page in client.workbench_helper.vulnerabilities(polling_policy=POLLING_POLICY))
+
+
+def scan_launch_many(data):
+    client = data.client
+    scans = client.scan_helper.scans()
+    return lambda: len(client.scan_helper.launch_many(scans, polling_policy=POLLING_POLICY))
+
+
+BENCHMARKS = [
+    parse,
+    parse_items,
+    asset_vulnerabilities_from_report,
+    vulnerability_from_report_item,
+    asset_list_from_json,
+    vulnerability_list_from_json,
+    flatten_param,
+    workbench_vulnerabilities,
+    scan_launch_many,
+]
+
+
+def measure(f, repeat):
+    """
+    :return: A tuple of the best time in seconds, and the peak memory in bytes.
+    """
+    gc.collect()
+    seconds = min(timeit.repeat(f, number=1, repeat=repeat))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        f()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def compare(result, baseline, threshold):
+    """
+    :return: A tuple of the text comparing a result with its baseline, and True if it regressed above the threshold.
+    """
+    if not baseline:
+        return u'', False
+    time_ratio = result['seconds'] / baseline['seconds'] if baseline['seconds'] else 1.0
+    peak_ratio = float(result['peak']) / baseline['peak'] if baseline['peak'] else 1.0
+    regressed = time_ratio > 1 + threshold or peak_ratio > 1 + threshold
+    text = u'%+7.1f%% %+7.1f%%' % ((time_ratio - 1) * 100, (peak_ratio - 1) * 100)
+    return text + (u'  REGRESSION' if regressed else u''), regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES[:2], help=u'Numbers of hosts.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--filter', default='', help=u'Only run benchmarks whose name contains this string.')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save', action='store_true', help=u'Save the results to the baseline.')
+    parser.add_argument('--check', action='store_true', help=u'Exit with status 1 on regressions.')
+    parser.add_argument('--threshold', type=float, default=0.2, help=u'Tolerated slowdown ratio, default to 0.2.')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = 0
+    temp_dir = tempfile.mkdtemp()
+    try:
+        print(u'%-40s %10s %12s %8s %8s' % (u'Benchmark', u'time (s)', u'peak (MB)', u'time', u'peak'))
+        for size in args.sizes:
+            data = Data(size, temp_dir)
+            try:
+                for benchmark in BENCHMARKS:
+                    if args.filter not in benchmark.__name__:
+                        continue
+                    key = u'%s[%d]' % (benchmark.__name__, size)
+                    seconds, peak = measure(benchmark(data), args.repeat)
+                    results[key] = {'seconds': seconds, 'peak': peak}
+                    text, regressed = compare(results[key], baseline.get(key), args.threshold)
+                    regressions += regressed
+                    print(u'%-40s %10.3f %12.1f %s' % (key, seconds, peak / 1024.0 / 1024, text))
+                    sys.stdout.flush()
+            finally:
+                data.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(u'Baseline saved to %s.' % args.baseline)
+    if regressions:
+        print(u'%d regression(s) above %d%%.' % (regressions, args.threshold * 100))
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
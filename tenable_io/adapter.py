@@ -0,0 +1,97 @@
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connection import HTTPConnection, HTTPSConnection
+from requests.packages.urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Seconds a connection stays idle before TCP keep-alive probes are sent, where the platform allows to set it.
+TCP_KEEPALIVE_IDLE = 60
+
+_local = threading.local()
+
+
+class _TimedConnectionMixin(object):
+    """Records, for the current thread, the time taken to open a new connection.
+    """
+
+    def connect(self):
+        start = time.time()
+        super(_TimedConnectionMixin, self).connect()
+        _local.connect_time = time.time() - start
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TenableIOAdapter(HTTPAdapter):
+    """HTTPAdapter with optional TCP keep-alive, which reports whether every request reused a pooled connection.
+
+    Every response is given two attributes: `connection_reused`, True if the request was sent on a pooled connection,
+    and `connect_time`, the seconds taken to open a new connection (including the TLS handshake) or None. Counts are
+    available through :func:`TenableIOAdapter.stats`.
+    """
+
+    def __init__(self, tcp_keepalive=False, **kwargs):
+        """
+        :param tcp_keepalive: If True, enable TCP keep-alive on the connections, default to False.
+        :param kwargs: Additional keyword arguments are passed to :class:`requests.adapters.HTTPAdapter`.
+        """
+        self._tcp_keepalive = tcp_keepalive
+        self._stats_lock = threading.Lock()
+        self.new_connections = 0
+        self.reused_connections = 0
+        super(TenableIOAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if getattr(self, '_tcp_keepalive', False):
+            pool_kwargs.setdefault('socket_options', TenableIOAdapter.keepalive_socket_options())
+        super(TenableIOAdapter, self).init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    @staticmethod
+    def keepalive_socket_options():
+        """
+        :return: The default socket options of urllib3 with TCP keep-alive enabled.
+        """
+        options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        for name in ['TCP_KEEPIDLE', 'TCP_KEEPINTVL']:
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), TCP_KEEPALIVE_IDLE))
+        return options
+
+    def send(self, request, *args, **kwargs):
+        _local.connect_time = None
+        response = super(TenableIOAdapter, self).send(request, *args, **kwargs)
+        response.connect_time = _local.connect_time
+        response.connection_reused = response.connect_time is None
+        with self._stats_lock:
+            if response.connection_reused:
+                self.reused_connections += 1
+            else:
+                self.new_connections += 1
+        return response
+
+    def stats(self):
+        """
+        :return: A dict of the number of requests sent on new and reused connections.
+        """
+        with self._stats_lock:
+            return {'new_connections': self.new_connections, 'reused_connections': self.reused_connections}
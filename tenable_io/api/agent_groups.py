@@ -1,5 +1,3 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import AgentGroup, AgentGroupList
 
@@ -43,7 +41,7 @@ class AgentGroupsApi(BaseApi):
         """
         response = self._client.post('scanners/1/agent-groups',
                                      create_agent_group)
-        return loads(response.text).get('id')
+        return self._client.json_codec.loads(response.content).get('id')
 
     def delete(self, agent_group_id):
         """Delete an agent group.
@@ -80,7 +78,7 @@ class AgentGroupsApi(BaseApi):
         """
         response = self._client.get('scanners/1/agent-groups/%(agent_group_id)s',
                                     path_params={'agent_group_id': agent_group_id})
-        return AgentGroup.from_json(response.text)
+        return AgentGroup.from_json(response.content, self._client.json_codec)
 
     def list(self):
         """Return agent groups for the given scanner.
@@ -89,7 +87,7 @@ class AgentGroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.AgentGroupList`.
         """
         response = self._client.get('scanners/1/agent-groups')
-        return AgentGroupList.from_json(response.text)
+        return AgentGroupList.from_json(response.content, self._client.json_codec)
 
 
 class AgentGroupSaveRequest(BaseRequest):
@@ -21,4 +21,4 @@ class AgentsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.AgentList`.
         """
         response = self._client.get('scanners/1/agents')
-        return AgentList.from_json(response.text)
+        return AgentList.from_json(response.content, self._client.json_codec)
@@ -12,4 +12,4 @@ class EditorApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.TemplateList`.
         """
         response = self._client.get('editor/%(type)s/templates', path_params={'type': type})
-        return TemplateList.from_json(response.text)
+        return TemplateList.from_json(response.content, self._client.json_codec)
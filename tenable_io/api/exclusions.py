@@ -12,7 +12,7 @@ class ExclusionApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Exclusion`.
         """
         response = self._client.post('exclusions', exclusion_create)
-        return Exclusion.from_json(response.text)
+        return Exclusion.from_json(response.content, self._client.json_codec)
 
     def delete(self, list_id):
         """Delete an exclusion
@@ -32,7 +32,7 @@ class ExclusionApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Exclusion`.
         """
         response = self._client.get('exclusions/%(list_id)s', path_params={'list_id': list_id})
-        return Exclusion.from_json(response.text)
+        return Exclusion.from_json(response.content, self._client.json_codec)
 
     def edit(self, list_id, exclusion_edit):
         """Edit the given exclusion
@@ -43,7 +43,7 @@ class ExclusionApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Exclusion`.
         """
         response = self._client.put('exclusions/%(list_id)s', exclusion_edit, path_params={'list_id': list_id})
-        return Exclusion.from_json(response.text)
+        return Exclusion.from_json(response.content, self._client.json_codec)
 
     def list(self):
         """Return the current exclusions
@@ -52,7 +52,7 @@ class ExclusionApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ExclusionList`.
         """
         response = self._client.get('exclusions')
-        return ExclusionList.from_json(response.text)
+        return ExclusionList.from_json(response.content, self._client.json_codec)
 
 
 class ExclusionSaveBaseRequest(BaseRequest):
@@ -1,7 +1,5 @@
 import os
 
-from json import loads
-
 from tenable_io.api.base import BaseApi
 
 
@@ -15,4 +13,4 @@ class FileApi(BaseApi):
         :return: The name of the uploaded file.
         """
         response = self._client.post('file/upload', files={'Filedata': (os.path.basename(file.name), file)})
-        return loads(response.text).get('fileuploaded')
+        return self._client.json_codec.loads(response.content).get('fileuploaded')
@@ -1,5 +1,3 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import FolderList
 
@@ -14,7 +12,7 @@ class FoldersApi(BaseApi):
         :return: The ID of the folder created.
         """
         response = self._client.post('folders', {'name': name})
-        return loads(response.text).get('id')
+        return self._client.json_codec.loads(response.content).get('id')
 
     def edit(self, folder_id, name):
         """Rename the folder.
@@ -44,4 +42,4 @@ class FoldersApi(BaseApi):
         :return: An instance of :class"`tenable_io.api.models.FolderList`.
         """
         response = self._client.get('folders')
-        return FolderList.from_json(response.text)
+        return FolderList.from_json(response.content, self._client.json_codec)
@@ -24,7 +24,7 @@ class GroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Group`.
         """
         response = self._client.post('groups', {'name': name})
-        return Group.from_json(response.text)
+        return Group.from_json(response.content, self._client.json_codec)
 
     def delete(self, group_id):
         """Delete a group.
@@ -64,7 +64,7 @@ class GroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Grouplist`.
         """
         response = self._client.get('groups')
-        return GroupList.from_json(response.text)
+        return GroupList.from_json(response.content, self._client.json_codec)
 
     def list_users(self, group_id):
         """Return the user list in the group.
@@ -73,4 +73,4 @@ class GroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.UserList`.
         """
         response = self._client.get('groups/%(group_id)s/users', {'group_id': group_id})
-        return UserList.from_json(response.text)
+        return UserList.from_json(response.content, self._client.json_codec)
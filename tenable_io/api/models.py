@@ -1,34 +1,153 @@
-from json import loads
+import six
 
+from tenable_io.codec import DEFAULT_JSON_CODEC
 from tenable_io.exceptions import TenableIOException
 from tenable_io.util import payload_filter
 
 
+class ModelMeta(type):
+    """Metaclass giving models a compact memory layout. Unless a model declares its own `__slots__`, slots are derived
+    from the arguments of its constructor; an argument exposed through a property is stored in a slot named after the
+    property, prefixed with an underscore. Attributes not declared by the model (ex. new API fields set by `from_dict`)
+    are still stored in the instance `__dict__`, which is only allocated when needed.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        base_fields = tuple(f for base in bases for f in getattr(base, '_fields', ()))
+        if '__slots__' not in namespace:
+            slots = []
+            init = namespace.get('__init__')
+            if init is not None:
+                code = six.get_function_code(init)
+                for arg in code.co_varnames[1:code.co_argcount]:
+                    field = '_' + arg if isinstance(namespace.get(arg), property) else arg
+                    if field not in base_fields and field not in slots:
+                        slots.append(field)
+            namespace['__slots__'] = tuple(slots)
+        namespace['_fields'] = base_fields + tuple(f for f in namespace['__slots__'] if f != '__dict__')
+        return super(ModelMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+# Deserializers built by BaseModel.from_dict, keyed by model class.
+_deserializers = {}
+
+
+@six.add_metaclass(ModelMeta)
 class BaseModel(object):
 
+    __slots__ = ('__dict__',)
+
     @classmethod
-    def from_json(cls, json):
-        return cls.from_dict(loads(json))
+    def from_json(cls, json, codec=None):
+        """
+        :param json: The JSON document, as bytes or text.
+        :param codec: The :class:`tenable_io.codec.JsonCodec` to decode the document with, default to \
+        :data:`tenable_io.codec.DEFAULT_JSON_CODEC`.
+        :return: An instance of the class.
+        """
+        return cls.from_dict((codec if codec else DEFAULT_JSON_CODEC).loads(json))
 
     @classmethod
     def from_dict(cls, dict_):
-        instance = cls()
-        for key in dict_:
-            setattr(instance, key, dict_[key])
-        return instance
+        deserializer = _deserializers.get(cls)
+        if deserializer is None:
+            deserializer = _deserializers[cls] = cls._deserializer()
+        return deserializer(dict_)
 
     @classmethod
     def from_list(cls, list_):
         model_list = None
         if list_:
-            model_list = []
-            for item in list_:
-                model_list.append(cls.from_dict(item))
+            from_dict = cls.from_dict
+            model_list = [from_dict(item) for item in list_]
         return model_list
 
     @classmethod
-    def from_json_list(cls, json_list):
-        return cls.from_list(loads(json_list))
+    def from_json_list(cls, json_list, codec=None):
+        """
+        :param json_list: The JSON array, as bytes or text.
+        :param codec: The :class:`tenable_io.codec.JsonCodec` to decode the array with, default to \
+        :data:`tenable_io.codec.DEFAULT_JSON_CODEC`.
+        :return: A list of instances of the class, or None if the array is empty.
+        """
+        return cls.from_list((codec if codec else DEFAULT_JSON_CODEC).loads(json_list))
+
+    @classmethod
+    def _deserializer(cls):
+        """Build the function used by `from_dict` to create instances of the class. The function is equivalent to
+        instantiating the class with no argument and then setting each key of the dict as an attribute, but it is
+        generated from the declared attributes of the class so that attributes are assigned directly, and lists of
+        nested models are converted without the per element checks of `_model_list`.
+
+        :return: A function that takes a dict and returns an instance of the class.
+        """
+        def generic(dict_):
+            instance = cls()
+            for key in dict_:
+                setattr(instance, key, dict_[key])
+            return instance
+
+        try:
+            template = cls()
+        except TypeError:
+            return generic
+
+        namespace = {'cls': cls, 'new': cls.__new__}
+        known = []
+        lines = [
+            'def deserializer(dict_):',
+            '    instance = new(cls)',
+            '    get = dict_.get',
+        ]
+        for field in cls._fields:
+            prop = getattr(cls, field[1:], None) if field.startswith('_') else None
+            key = field[1:] if isinstance(prop, property) else field
+            known.append(key)
+            if isinstance(prop, property) and getattr(prop.fset, 'model_class', None) is not None:
+                namespace['set_' + key] = BaseModel._fast_setter(prop.fset)
+                lines.append('    set_%s(instance, get(%r))' % (key, key))
+            else:
+                lines.append('    instance.%s = get(%r)' % (key, key))
+        namespace['known'] = frozenset(known)
+        lines += [
+            '    if not known.issuperset(dict_):',
+            '        for key in dict_:',
+            '            if key not in known:',
+            '                setattr(instance, key, dict_[key])',
+            '    return instance',
+        ]
+        six.exec_('\n'.join(lines), namespace)
+        deserializer = namespace['deserializer']
+
+        # Only use the generated function if it produces the same defaults as the constructor.
+        if deserializer({}).as_dict() != template.as_dict():
+            return generic
+        return deserializer
+
+    @staticmethod
+    def _fast_setter(fset):
+        """
+        :param fset: A property setter decorated by `_model_list`.
+        :return: A setter equivalent to `fset`, that converts lists of dicts without the per element type checks.
+        """
+        model_class = fset.model_class
+        setter = fset.setter
+        base_from_dict = BaseModel.from_dict.__func__
+
+        def wrapper(self, list_):
+            if type(list_) is not list:
+                return fset(self, list_)
+            from_dict = _deserializers.get(model_class) if model_class.from_dict.__func__ is base_from_dict else None
+            if from_dict is None:
+                from_dict = model_class.from_dict
+            model_list = []
+            append = model_list.append
+            for item in list_:
+                if type(item) is not dict:
+                    return fset(self, list_)
+                append(from_dict(item))
+            setter(self, model_list)
+        return wrapper
 
     @staticmethod
     def _model_list(class_):
@@ -52,11 +171,26 @@ class BaseModel(object):
                     f(self, model_list)
                 else:
                     f(self, [])
+            wrapper.model_class = class_
+            wrapper.setter = f
             return wrapper
         return decorator
 
+    def as_dict(self):
+        """
+        :return: A dict of the attributes of the model, including attributes stored in slots.
+        """
+        dict_ = {}
+        for field in self._fields:
+            try:
+                dict_[field] = getattr(self, field)
+            except AttributeError:
+                pass
+        dict_.update(self.__dict__)
+        return dict_
+
     def as_payload(self, filter_=None):
-        return payload_filter(self.__dict__, filter_)
+        return payload_filter(self.as_dict(), filter_)
 
 
 class Agent(BaseModel):
@@ -1108,7 +1242,7 @@ class ScannerAwsTargetList(BaseModel):
     @aws_targets.setter
     @BaseModel._model_list(ScannerAwsTarget)
     def aws_targets(self, aws_targets):
-        self.aws_targets = aws_targets
+        self._aws_targets = aws_targets
 
 
 class ScannerLicense(BaseModel):
@@ -1576,7 +1710,7 @@ class AssetList(BaseModel):
 
 class Vulnerability(BaseModel):
 
-    def __init_(
+    def __init__(
             self,
             count=None,
             plugin_family=None,
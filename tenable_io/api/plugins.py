@@ -11,7 +11,7 @@ class PluginsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.PluginFamilyList`.
         """
         response = self._client.get('plugins/families')
-        return PluginFamilyList.from_json(response.text)
+        return PluginFamilyList.from_json(response.content, self._client.json_codec)
 
     def family_details(self, family_id):
         """Return plugin family details.
@@ -21,7 +21,7 @@ class PluginsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.PluginFamilyDetails`.
         """
         response = self._client.get('plugins/families/%(id)s', path_params={'id': family_id})
-        return PluginFamilyDetails.from_json(response.text)
+        return PluginFamilyDetails.from_json(response.content, self._client.json_codec)
 
     def plugin_details(self, plugin_id):
         """Return plugin details.
@@ -31,4 +31,4 @@ class PluginsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.PluginDetails`.
         """
         response = self._client.get('plugins/plugin/%(id)s', path_params={'id': plugin_id})
-        return PluginDetails.from_json(response.text)
+        return PluginDetails.from_json(response.content, self._client.json_codec)
@@ -1,8 +1,8 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import PolicyDetails, PolicySettings, PolicyList
 from tenable_io.api.base import BaseRequest
+from tenable_io.downloader import Downloader
+from tenable_io.util import DOWNLOAD_CHUNK_SIZE
 
 
 class PoliciesApi(BaseApi):
@@ -27,7 +27,7 @@ class PoliciesApi(BaseApi):
         :return: Policy id.
         """
         response = self._client.post('policies', policy_create_request)
-        return loads(response.text).get('policy_id')
+        return self._client.json_codec.loads(response.content).get('policy_id')
 
     def copy(self, policy_id):
         """Copy a policy.
@@ -38,7 +38,7 @@ class PoliciesApi(BaseApi):
         """
         response = self._client.post('policies/%(policy_id)s/copy', {},
                                      path_params={'policy_id': policy_id})
-        return loads(response.text).get('id')
+        return self._client.json_codec.loads(response.content).get('id')
 
     def delete(self, policy_id):
         """Delete a policy.
@@ -60,7 +60,7 @@ class PoliciesApi(BaseApi):
         """
         response = self._client.get('policies/%(policy_id)s',
                                     path_params={'policy_id': policy_id})
-        return PolicyDetails.from_json(response.text)
+        return PolicyDetails.from_json(response.content, self._client.json_codec)
 
     def import_policy(self, policy_import_request):
         """Import a policy.
@@ -70,14 +70,15 @@ class PoliciesApi(BaseApi):
         :return: Policy id.
         """
         response = self._client.post('policies/import', policy_import_request)
-        return loads(response.text).get('id')
+        return self._client.json_codec.loads(response.content).get('id')
 
-    def export(self, policy_id, stream=True, chunk_size=1024):
+    def export(self, policy_id, stream=True, chunk_size=DOWNLOAD_CHUNK_SIZE):
         """Export a policy.
 
         :param policy_id: Policy id.
         :param stream: Defaults to True. If False, the response content will be immediately downloaded.
-        :param chunk_size: If Stream=False, data is returned as a single chunk.
+        :param chunk_size: If Stream=False, data is returned as a single chunk. Default to the `download_chunk_size`
+            config.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Response content iterator.
         """
@@ -86,6 +87,19 @@ class PoliciesApi(BaseApi):
                                     stream=stream)
         return response.iter_content(chunk_size=chunk_size)
 
+    def export_file(self, policy_id, path, segments=None, chunk_size=None):
+        """Export a policy to a file, with parallel range requests resumed after failures.
+
+        :param policy_id: Policy id.
+        :param path: The file path to save the file to.
+        :param segments: The maximum number of parallel range requests, default to None for the config value.
+        :param chunk_size: The size of the buffer data is read into, default to None for the config value.
+        :raise TenableIOApiException:  When API error is encountered.
+        :return: The file path.
+        """
+        return Downloader(self._client, segments, chunk_size).download(
+            'policies/%(policy_id)s/export', path, {'policy_id': policy_id})
+
     def list(self):
         """Return the policy list.
 
@@ -93,7 +107,7 @@ class PoliciesApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.PolicyList`.
         """
         response = self._client.get('policies')
-        return PolicyList.from_json(response.text)
+        return PolicyList.from_json(response.content, self._client.json_codec)
 
 
 class PolicyCreateRequest(BaseRequest):
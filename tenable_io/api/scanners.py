@@ -1,5 +1,3 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import Scanner, ScannerAwsTargetList, ScannerList, ScannerScanList
 
@@ -38,7 +36,7 @@ class ScannersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Scanner`.
         """
         response = self._client.get('scanners/%(scanner_id)s', path_params={'scanner_id': scanner_id})
-        return Scanner.from_json(response.text)
+        return Scanner.from_json(response.content, self._client.json_codec)
 
     def edit(self, scanner_id, scanner_edit):
         """Edit the given scanner.
@@ -59,7 +57,7 @@ class ScannersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ScannerAwsTargetList`.
         """
         response = self._client.get('scanners/%(scanner_id)s/aws-targets', path_params={'scanner_id': scanner_id})
-        return ScannerAwsTargetList.from_json(response.text)
+        return ScannerAwsTargetList.from_json(response.content, self._client.json_codec)
 
     def get_scanner_key(self, scanner_id):
         """Returns key of given scanner.
@@ -69,7 +67,7 @@ class ScannersApi(BaseApi):
         :return: Scanner key.
         """
         response = self._client.get('scanners/%(scanner_id)s/key', path_params={'scanner_id': scanner_id})
-        return loads(response.text).get('key')
+        return self._client.json_codec.loads(response.content).get('key')
 
     def get_scans(self, scanner_id):
         """Returns list of running scans on given scanner.
@@ -79,7 +77,7 @@ class ScannersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ScannerScanList`.
         """
         response = self._client.get('scanners/%(scanner_id)s/scans', path_params={'scanner_id': scanner_id})
-        return ScannerScanList.from_json(response.text)
+        return ScannerScanList.from_json(response.content, self._client.json_codec)
 
     def list(self):
         """Returns list of scanners.
@@ -88,7 +86,7 @@ class ScannersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ScannerList`.
         """
         response = self._client.get('scanners')
-        return ScannerList.from_json(response.text)
+        return ScannerList.from_json(response.content, self._client.json_codec)
 
     def toggle_link_state(self, scanner_id, toggle_link):
         """Enables or disables link state of given scanner.
@@ -1,8 +1,8 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import Scan, ScanDetails, ScanHistory, ScanList, ScanSettings
 from tenable_io.api.base import BaseRequest
+from tenable_io.downloader import Downloader
+from tenable_io.util import DOWNLOAD_CHUNK_SIZE
 
 
 class ScansApi(BaseApi):
@@ -18,7 +18,7 @@ class ScansApi(BaseApi):
         :return: The ID of scan just configured.
         """
         response = self._client.put('scans/%(scan_id)s', scan_configure, path_params={'scan_id': scan_id})
-        return loads(response.text).get('scan', {}).get('id')
+        return self._client.json_codec.loads(response.content).get('scan', {}).get('id')
 
     def create(self, scan_create):
         """Create a scan.
@@ -28,13 +28,13 @@ class ScansApi(BaseApi):
         :return: The ID of scan just created.
         """
         response = self._client.post('scans', scan_create)
-        return loads(response.text).get('scan', {}).get('id')
+        return self._client.json_codec.loads(response.content).get('scan', {}).get('id')
 
     def copy(self, scan_id):
         response = self._client.post('scans/%(scan_id)s/copy',
                                      {},
                                      path_params={'scan_id': scan_id})
-        return Scan.from_json(response.text)
+        return Scan.from_json(response.content, self._client.json_codec)
 
     def delete(self, scan_id):
         """Delete a scan. NOTE: Scans in running, paused or stopping states can not be deleted.
@@ -58,16 +58,17 @@ class ScansApi(BaseApi):
                                     path_params={'scan_id': scan_id},
                                     params={'history_id': history_id} if history_id else None)
 
-        return ScanDetails.from_json(response.text)
+        return ScanDetails.from_json(response.content, self._client.json_codec)
 
-    def export_download(self, scan_id, file_id, stream=True, chunk_size=1024):
+    def export_download(self, scan_id, file_id, stream=True, chunk_size=DOWNLOAD_CHUNK_SIZE):
         """Download an exported scan.
 
         :param scan_id: The scan ID.
         :param file_id: The file ID.
         :param stream: Default to True. If False, the response content will be immediately downloaded.
         :param chunk_size: If Stream=False, data is returned as a single chunk.\
-         If Stream=True, it's the number of bytes it should read into memory.
+         If Stream=True, it's the number of bytes it should read into memory. Default to the `download_chunk_size`\
+         config.
         :raise TenableIOApiException:  When API error is encountered.
         :return: The downloaded file.
         """
@@ -76,6 +77,20 @@ class ScansApi(BaseApi):
                                     stream=stream)
         return response.iter_content(chunk_size=chunk_size)
 
+    def export_download_file(self, scan_id, file_id, path, segments=None, chunk_size=None):
+        """Download an exported scan to a file, with parallel range requests resumed after failures.
+
+        :param scan_id: The scan ID.
+        :param file_id: The file ID.
+        :param path: The file path to save the file to.
+        :param segments: The maximum number of parallel range requests, default to None for the config value.
+        :param chunk_size: The size of the buffer data is read into, default to None for the config value.
+        :raise TenableIOApiException:  When API error is encountered.
+        :return: The file path.
+        """
+        return Downloader(self._client, segments, chunk_size).download(
+            'scans/%(scan_id)s/export/%(file_id)s/download', path, {'scan_id': scan_id, 'file_id': file_id})
+
     def export_request(self, scan_id, scan_export, history_id=None):
         """Export the given scan. Once requested, the file can be downloaded using the export\
          download method upon receiving a "ready" status from the export status method.
@@ -91,7 +106,7 @@ class ScansApi(BaseApi):
                                      scan_export,
                                      path_params={'scan_id': scan_id},
                                      params={'history_id': history_id} if history_id else None)
-        return loads(response.text).get('file')
+        return self._client.json_codec.loads(response.content).get('file')
 
     def export_status(self, scan_id, file_id):
         """Check the file status of an exported scan. When an export has been requested,\
@@ -105,7 +120,7 @@ class ScansApi(BaseApi):
         """
         response = self._client.get('scans/%(scan_id)s/export/%(file_id)s/status',
                                     path_params={'scan_id': scan_id, 'file_id': file_id})
-        return loads(response.text).get('status')
+        return self._client.json_codec.loads(response.content).get('status')
 
     def folder(self, scan_id, folder_id):
         """Move to a scan to a folder.
@@ -123,7 +138,7 @@ class ScansApi(BaseApi):
     def history(self, scan_id, history_id):
         response = self._client.get('scans/%(scan_id)s/history/%(history_id)s',
                                     path_params={'scan_id': scan_id, 'history_id': history_id})
-        return ScanHistory.from_json(response.text)
+        return ScanHistory.from_json(response.content, self._client.json_codec)
 
     def import_scan(self, scan_import):
         """Import an existing scan which has been uploaded using :func:`TenableIO.FileApi.upload`
@@ -133,7 +148,7 @@ class ScansApi(BaseApi):
         :return: The ID of the imported scan.
         """
         response = self._client.post('scans/import', scan_import)
-        return loads(response.text).get('scan', {}).get('id')
+        return self._client.json_codec.loads(response.content).get('scan', {}).get('id')
 
     def launch(self, scan_id, scan_launch_request):
         """Launch a scan.
@@ -147,16 +162,23 @@ class ScansApi(BaseApi):
         response = self._client.post('scans/%(scan_id)s/launch',
                                      scan_launch_request,
                                      path_params={'scan_id': scan_id})
-        return loads(response.text).get('scan_uuid')
+        return self._client.json_codec.loads(response.content).get('scan_uuid')
 
-    def list(self, folder_id=None):
+    def list(self, folder_id=None, last_modification_date=None):
         """Return the scan list.
 
+        :param folder_id: Only scans in the folder identified by `folder_id`, default to None.
+        :param last_modification_date: Only scans modified since this Unix timestamp, default to None.
         :raise TenableIOApiException:  When API error is encountered.
         :return: An instance of :class:`tenable_io.api.models.ScanList`.
         """
-        response = self._client.get('scans', params={'folder_id': folder_id} if folder_id else {})
-        return ScanList.from_json(response.text)
+        params = {}
+        if folder_id:
+            params['folder_id'] = folder_id
+        if last_modification_date:
+            params['last_modification_date'] = last_modification_date
+        response = self._client.get('scans', params=params)
+        return ScanList.from_json(response.content, self._client.json_codec)
 
     def pause(self, scan_id):
         """Pause a scan.
@@ -11,7 +11,7 @@ class ServerApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ServerStatus`.
         """
         response = self._client.get('server/properties')
-        return ServerProperties.from_json(response.text)
+        return ServerProperties.from_json(response.content, self._client.json_codec)
 
     def status(self):
         """Return server status.
@@ -20,4 +20,4 @@ class ServerApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.ServerStatus`.
         """
         response = self._client.get('server/status')
-        return ServerStatus.from_json(response.text)
+        return ServerStatus.from_json(response.content, self._client.json_codec)
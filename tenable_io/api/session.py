@@ -11,4 +11,4 @@ class SessionApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.Session`.
         """
         response = self._client.get('session')
-        return Session.from_json(response.text)
+        return Session.from_json(response.content, self._client.json_codec)
@@ -12,7 +12,7 @@ class TargetGroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.TargetGroup`.
         """
         response = self._client.post('target-groups', target_group_create)
-        return TargetGroup.from_json(response.text)
+        return TargetGroup.from_json(response.content, self._client.json_codec)
 
     def delete(self, group_id):
         """Delete a target group.
@@ -32,7 +32,7 @@ class TargetGroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.TargetGroup`.
         """
         response = self._client.get('target-groups/%(group_id)s', {'group_id': group_id})
-        return TargetGroup.from_json(response.text)
+        return TargetGroup.from_json(response.content, self._client.json_codec)
 
     def edit(self, target_group_edit, group_id):
         """Modify a target group.
@@ -43,7 +43,7 @@ class TargetGroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.TargetGroup`
         """
         response = self._client.put('target-groups/%(group_id)s', target_group_edit, {'group_id': group_id})
-        return TargetGroup.from_json(response.text)
+        return TargetGroup.from_json(response.content, self._client.json_codec)
 
     def list(self):
         """Return the current target groups.
@@ -52,7 +52,7 @@ class TargetGroupsApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.TargetGroupList`
         """
         response = self._client.get('target-groups')
-        return TargetGroupList.from_json(response.text)
+        return TargetGroupList.from_json(response.content, self._client.json_codec)
 
 
 class TargetGroupCreateRequest(BaseRequest):
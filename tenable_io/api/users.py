@@ -1,5 +1,3 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import User, UserKeys, UserList
 
@@ -8,7 +6,7 @@ class UsersApi(BaseApi):
 
     def get(self, user_id):
         response = self._client.get('users/%(user_id)s', {'user_id': user_id})
-        return User.from_json(response.text)
+        return User.from_json(response.content, self._client.json_codec)
 
     def list(self):
         """Return the user list.
@@ -16,11 +14,11 @@ class UsersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.UserList`.
         """
         response = self._client.get('users')
-        return UserList.from_json(response.text)
+        return UserList.from_json(response.content, self._client.json_codec)
 
     def impersonate(self, user_id):
         response = self._client.post('users/%(user_id)s/impersonate', path_params={'user_id': user_id})
-        return loads(response.text)
+        return self._client.json_codec.loads(response.content)
 
     def create(self, user_create):
         """Create a new user.
@@ -30,7 +28,7 @@ class UsersApi(BaseApi):
         :return: The ID of the created user.
         """
         response = self._client.post('users', user_create)
-        return loads(response.text).get('id')
+        return self._client.json_codec.loads(response.content).get('id')
 
     def edit(self, user_id, user_edit):
         """Edit an existing user.
@@ -41,7 +39,7 @@ class UsersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.User`.
         """
         response = self._client.put('users/%(user_id)s', user_edit, {'user_id': user_id})
-        return User.from_json(response.text)
+        return User.from_json(response.content, self._client.json_codec)
 
     def delete(self, user_id):
         """Delete a user.
@@ -72,7 +70,7 @@ class UsersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.User`
         """
         response = self._client.get('users/%(user_id)s', {'user_id': user_id})
-        return User.from_json(response.text)
+        return User.from_json(response.content, self._client.json_codec)
 
     def keys(self, user_id):
         """Generate the API Keys for the given user.
@@ -82,7 +80,7 @@ class UsersApi(BaseApi):
         :return: An instance of :class:`tenable_io.api.models.UserKeys`
         """
         response = self._client.put('users/%(user_id)s/keys', path_params={'user_id': user_id})
-        return UserKeys.from_json(response.text)
+        return UserKeys.from_json(response.content, self._client.json_codec)
 
     def enabled(self, user_id, enabled):
         """Enable or disable an user.
@@ -1,8 +1,8 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import AssetActivityList, AssetList, AssetInfo, VulnerabilityList, \
     VulnerabilityOutputList
+from tenable_io.downloader import Downloader
+from tenable_io.util import DOWNLOAD_CHUNK_SIZE
 
 
 class WorkbenchesApi(BaseApi):
@@ -36,7 +36,7 @@ class WorkbenchesApi(BaseApi):
         params = {'date_range': date_range, 'filter': filters, 'filter.search_type': filter_search_type}
         response = self._client.get('workbenches/assets',
                                     params={k: v for (k, v) in params.items() if v})
-        return AssetList.from_json(response.text)
+        return AssetList.from_json(response.content, self._client.json_codec)
 
     def assets_vulnerabilities(self, date_range=None, filters=None, filter_search_type=None):
         """List all the assets with vulnerabilities.
@@ -50,7 +50,7 @@ class WorkbenchesApi(BaseApi):
         params = {'date_range': date_range, 'filter': filters, 'filter.search_type': filter_search_type}
         response = self._client.get('workbenches/assets/vulnerabilities',
                                     params={k: v for (k, v) in params.items() if v})
-        return AssetList.from_json(response.text)
+        return AssetList.from_json(response.content, self._client.json_codec)
 
     def asset_activity(self, asset_id):
         """List detailed info of an asset.
@@ -61,7 +61,7 @@ class WorkbenchesApi(BaseApi):
         """
         response = self._client.get('workbenches/assets/%(asset_id)s/activity',
                                     path_params={'asset_id': asset_id})
-        return AssetActivityList.from_json(response.text)
+        return AssetActivityList.from_json(response.content, self._client.json_codec)
 
     def asset_info(self, asset_id):
         """List detailed info of an asset.
@@ -72,7 +72,7 @@ class WorkbenchesApi(BaseApi):
         """
         response = self._client.get('workbenches/assets/%(asset_id)s/info',
                                     path_params={'asset_id': asset_id})
-        return AssetInfo.from_dict(loads(response.text).get('info'))
+        return AssetInfo.from_dict(self._client.json_codec.loads(response.content).get('info'))
 
     def asset_vulnerabilities(self, asset_id, date_range=None, filters=None, filter_search_type=None):
         """List all the vulnerabilities recorded for a given asset.
@@ -88,15 +88,16 @@ class WorkbenchesApi(BaseApi):
         response = self._client.get('workbenches/assets/%(asset_id)s/vulnerabilities',
                                     params={k: v for (k, v) in params.items() if v},
                                     path_params={'asset_id': asset_id})
-        return VulnerabilityList.from_json(response.text)
+        return VulnerabilityList.from_json(response.content, self._client.json_codec)
 
-    def export_download(self, file_id, stream=True, chunk_size=1024):
+    def export_download(self, file_id, stream=True, chunk_size=DOWNLOAD_CHUNK_SIZE):
         """Download a file that has been prepared for export.
 
         :param file_id: The unique identifier of the workbench report being downloaded.
         :param stream: Default to True. If False, the response content will be immediately downloaded.
         :param chunk_size: If Stream=False, data is returned as a single chunk.
-            If Stream=True, it's the number of bytes it should read into memory.
+            If Stream=True, it's the number of bytes it should read into memory. Default to the `download_chunk_size`
+            config.
         :raise TenableIOApiException:  When API error is encountered.
         :return: The content iterator for the file.
         """
@@ -105,6 +106,19 @@ class WorkbenchesApi(BaseApi):
                                     stream=stream)
         return response.iter_content(chunk_size=chunk_size)
 
+    def export_download_file(self, file_id, path, segments=None, chunk_size=None):
+        """Download a file that has been prepared for export, with parallel range requests resumed after failures.
+
+        :param file_id: The unique identifier of the workbench report being downloaded.
+        :param path: The file path to save the file to.
+        :param segments: The maximum number of parallel range requests, default to None for the config value.
+        :param chunk_size: The size of the buffer data is read into, default to None for the config value.
+        :raise TenableIOApiException:  When API error is encountered.
+        :return: The file path.
+        """
+        return Downloader(self._client, segments, chunk_size).download(
+            'workbenches/export/%(file_id)s/download', path, {'file_id': file_id})
+
     def export_request(
             self,
             format,
@@ -165,7 +179,7 @@ class WorkbenchesApi(BaseApi):
 
         response = self._client.get('workbenches/export',
                                     params={k: params[k] for k in params if params[k] is not None})
-        return loads(response.text).get('file')
+        return self._client.json_codec.loads(response.content).get('file')
 
     def export_status(self, file_id):
         """Retrieve the status of a pending export.
@@ -176,7 +190,7 @@ class WorkbenchesApi(BaseApi):
         """
         response = self._client.get('workbenches/export/%(file_id)s/status',
                                     path_params={'file_id': file_id})
-        return loads(response.text).get('status')
+        return self._client.json_codec.loads(response.content).get('status')
 
     def vulnerabilities(self, age=None, authenticated=None, date_range=None, exploitable=None, filters=None,
                         filter_search_type=None, resolvable=None, severity=None):
@@ -198,7 +212,7 @@ class WorkbenchesApi(BaseApi):
                   'severity': severity}
         response = self._client.get('workbenches/vulnerabilities',
                                     params={k: v for (k, v) in params.items() if v})
-        return VulnerabilityList.from_json(response.text)
+        return VulnerabilityList.from_json(response.content, self._client.json_codec)
 
     def vulnerability_output(self, plugin_id, date_range=None, filters=None, filter_search_type=None):
         """Get the vulnerability outputs for a plugin.
@@ -214,4 +228,4 @@ class WorkbenchesApi(BaseApi):
         response = self._client.get('workbenches/vulnerabilities/%(plugin_id)s/outputs',
                                     path_params={'plugin_id': plugin_id},
                                     params={k: v for (k, v) in params.items() if v})
-        return VulnerabilityOutputList.from_json(response.text)
+        return VulnerabilityOutputList.from_json(response.content, self._client.json_codec)
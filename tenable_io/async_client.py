@@ -0,0 +1,123 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from tenable_io.client import TenableIOClient
+from tenable_io.config import TenableIOConfig
+
+# get_event_loop is deprecated when no loop is running, get_running_loop is only available from Python 3.7.
+_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+class AsyncTenableIOClient(object):
+    """asyncio interface of :class:`tenable_io.client.TenableIOClient`.
+
+    Every request method, and every method of the `*_api` attributes, returns an awaitable instead of blocking. Requests
+    are run by a pool of at most `concurrency` worker threads sharing one :class:`TenableIOClient`, so the same session,
+    retry and 429 handling apply. Note: Python 3.4+ only.
+    """
+
+    DEFAULT_CONCURRENCY = 10
+
+    def __init__(
+            self,
+            access_key=TenableIOConfig.get('access_key'),
+            secret_key=TenableIOConfig.get('secret_key'),
+            endpoint=TenableIOConfig.get('endpoint'),
+            impersonate=None,
+            concurrency=DEFAULT_CONCURRENCY,
+            loop=None,
+            **kwargs
+    ):
+        """
+        :param concurrency: The maximum number of concurrent requests, also used as the connection pool size unless \
+        pool_maxsize is specified.
+        :param loop: The event loop, default to None for the running event loop. Without a loop, requests should be \
+        made from the running event loop.
+        :param kwargs: Additional keyword arguments are passed to :class:`tenable_io.client.TenableIOClient`.
+        """
+        assert concurrency > 0, u'Concurrency limit should be positive.'
+
+        kwargs.setdefault('pool_maxsize', concurrency)
+
+        self._concurrency = concurrency
+        self._loop = loop
+        self._kwargs = kwargs
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._client = TenableIOClient(access_key, secret_key, endpoint, impersonate, **kwargs)
+
+        self._init_api()
+
+    def _init_api(self):
+        """
+        Initializes all api, mirroring the api attributes of the wrapped client.
+        """
+        for name, api in vars(self._client).items():
+            if name.endswith('_api'):
+                setattr(self, name, AsyncApi(api, self._run))
+
+    def _run(self, f, *args, **kwargs):
+        """
+        Schedule a blocking call on the worker threads.
+        :return: An asyncio future resolved with the result of the call.
+        """
+        loop = self._loop if self._loop is not None else _running_loop()
+        return loop.run_in_executor(self._executor, partial(f, *args, **kwargs))
+
+    @property
+    def concurrency(self):
+        return self._concurrency
+
+    def impersonate(self, username):
+        # Cached responses are not shared with the impersonated user.
+        kwargs = {k: v for (k, v) in self._kwargs.items() if k != 'cache'}
+        kwargs.update(json_codec=self._client.json_codec, rate_limiter=self._client.rate_limiter)
+        return AsyncTenableIOClient(
+            self._client._access_key,
+            self._client._secret_key,
+            self._client._endpoint,
+            impersonate=username,
+            concurrency=self._concurrency,
+            loop=self._loop,
+            **kwargs
+        )
+
+    def get(self, uri, path_params=None, **kwargs):
+        return self._run(self._client.get, uri, path_params, **kwargs)
+
+    def post(self, uri, payload=None, path_params=None, **kwargs):
+        return self._run(self._client.post, uri, payload, path_params, **kwargs)
+
+    def put(self, uri, payload=None, path_params=None, **kwargs):
+        return self._run(self._client.put, uri, payload, path_params, **kwargs)
+
+    def delete(self, uri, path_params=None, **kwargs):
+        return self._run(self._client.delete, uri, path_params, **kwargs)
+
+    _flatten_param = staticmethod(TenableIOClient._flatten_param)
+
+    def _request(self, method, uri, path_params=None, **kwargs):
+        return self._run(self._client._request, method, uri, path_params, **kwargs)
+
+    def close(self):
+        """
+        Shut down the worker threads and close the underlying session.
+        """
+        self._executor.shutdown(wait=True)
+        self._client._session.close()
+
+
+class AsyncApi(object):
+    """Wraps an api instance so that its public methods return awaitables.
+    """
+
+    def __init__(self, api, run):
+        self._api = api
+        self._run = run
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        return partial(self._run, attr)
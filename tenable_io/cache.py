@@ -0,0 +1,113 @@
+import threading
+import time
+
+from collections import OrderedDict
+from fnmatch import fnmatch
+
+
+class ResponseCache(object):
+    """LRU cache of successful GET responses, with a time to live per URI pattern.
+
+    Responses are cached by URI (with path params substituted) and query params. A POST, PUT or DELETE issued on a
+    resource invalidates every cached response of that resource, the resource being the first segment of the URI (ex.
+    `scans/1/launch` invalidates `scans` and `scans/1`).
+    """
+
+    # TTLs in seconds of the read-mostly endpoints, used when no TTL is specified.
+    DEFAULT_TTLS = {
+        'editor/*/templates': 300,
+        'folders': 60,
+        'scanners': 60,
+        'scans': 10,
+    }
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, ttls=None, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param ttls: A dict of URI pattern (ex. `editor/*/templates`, see :mod:`fnmatch`) to the number of seconds
+            responses are cached for, default to DEFAULT_TTLS. URIs matching no pattern are not cached.
+        :param max_size: The maximum number of cached responses, the least recently used are evicted first.
+        """
+        assert max_size > 0, u'Cache size should be positive.'
+        self._ttls = list((ttls if ttls is not None else ResponseCache.DEFAULT_TTLS).items())
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    _clock = staticmethod(time.time)
+
+    def ttl(self, uri):
+        """
+        :param uri: The request URI, relative to the endpoint.
+        :return: The TTL of the first pattern matching the URI, or None.
+        """
+        for pattern, ttl in self._ttls:
+            if fnmatch(uri, pattern):
+                return ttl
+        return None
+
+    @staticmethod
+    def key(uri, params=None):
+        """
+        :return: The cache key of a request.
+        """
+        return uri, repr(sorted(params.items())) if isinstance(params, dict) else repr(params)
+
+    def get(self, key):
+        """
+        :param key: The cache key, see :func:`ResponseCache.key`.
+        :return: The cached response, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                # Move to the most recently used end.
+                del self._entries[key]
+                self._entries[key] = entry
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, response):
+        """Cache a response if its URI matches a pattern.
+
+        :param key: The cache key, see :func:`ResponseCache.key`.
+        :param response: The response to cache.
+        """
+        ttl = self.ttl(key[0])
+        if not ttl or ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self._clock() + ttl, response)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uri=None):
+        """Remove cached responses.
+
+        :param uri: Remove the responses of the resource of this URI, default to None to remove all responses.
+        """
+        with self._lock:
+            if uri is None:
+                self._entries.clear()
+                return
+            resource = ResponseCache._resource(uri)
+            for key in [k for k in self._entries if ResponseCache._resource(k[0]) == resource]:
+                del self._entries[key]
+
+    def stats(self):
+        """
+        :return: A dict of the number of hits, misses and cached responses.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    @staticmethod
+    def _resource(uri):
+        return uri.strip('/').split('?')[0].split('/')[0]
@@ -1,9 +1,13 @@
 import requests
 import sys
+import time
+
+import tenable_io.util as util
 
-from requests.packages.urllib3 import Retry
 from requests.utils import quote
 
+from tenable_io.adapter import TenableIOAdapter
+from tenable_io.codec import DEFAULT_JSON_CODEC
 from tenable_io.config import TenableIOConfig
 from tenable_io.exceptions import TenableIOApiException
 from tenable_io.api.agents import AgentsApi
@@ -27,13 +31,16 @@ from tenable_io.helpers.folder import FolderHelper
 from tenable_io.helpers.policy import PolicyHelper
 from tenable_io.helpers.scan import ScanHelper
 from tenable_io.helpers.workbench import WorkbenchHelper
-from tenable_io.log import format_request, logging
+from tenable_io.log import log_request, logging
+from tenable_io.metrics import RequestMetrics
+from tenable_io.rate_limiter import RateLimitedRetry, RateLimiter
 
 
 class TenableIOClient(object):
 
     _MAX_RETRIES = 3
     _RETRY_STATUS_CODES = {429, 501, 502, 503, 504}
+    _DEFAULT_POOL_MAXSIZE = 10
 
     def __init__(
             self,
@@ -41,11 +48,55 @@ class TenableIOClient(object):
             secret_key=TenableIOConfig.get('secret_key'),
             endpoint=TenableIOConfig.get('endpoint'),
             impersonate=None,
+            json_codec=None,
+            cache=None,
+            rate_limiter=None,
+            pool_connections=int(TenableIOConfig.get('pool_connections')),
+            pool_maxsize=None,
+            pool_block=TenableIOConfig.get_boolean('pool_block'),
+            connect_timeout=TenableIOConfig.get_float('connect_timeout'),
+            read_timeout=TenableIOConfig.get_float('read_timeout'),
+            tcp_keepalive=TenableIOConfig.get_boolean('tcp_keepalive'),
+            observers=None,
     ):
+        """
+        :param access_key: The API access key.
+        :param secret_key: The API secret key.
+        :param endpoint: The API endpoint.
+        :param impersonate: The username to impersonate, default to None.
+        :param json_codec: The :class:`tenable_io.codec.JsonCodec` of responses and payloads, default to None for \
+        :data:`tenable_io.codec.DEFAULT_JSON_CODEC`.
+        :param cache: A :class:`tenable_io.cache.ResponseCache`, default to None for no caching.
+        :param rate_limiter: A :class:`tenable_io.rate_limiter.RateLimiter`, default to None for the process wide \
+        limiter.
+        :param pool_connections: The number of connection pools to cache.
+        :param pool_maxsize: The maximum number of connections kept per pool, default to the `pool_maxsize` config, or \
+        the greatest of 10 and the `concurrency` config.
+        :param pool_block: If True, wait for a pooled connection to be free instead of opening a new connection which \
+        is discarded after use.
+        :param connect_timeout: The connect timeout in seconds, or None for no timeout.
+        :param read_timeout: The read timeout in seconds, or None for no timeout.
+        :param tcp_keepalive: If True, enable TCP keep-alive on connections.
+        :param observers: A list of callables called with a :class:`tenable_io.metrics.RequestMetrics` after every \
+        request, default to None.
+        """
+        if pool_maxsize is None:
+            pool_maxsize = int(TenableIOConfig.get('pool_maxsize') or
+                               max(TenableIOClient._DEFAULT_POOL_MAXSIZE, util.CONCURRENCY))
+
         self._access_key = access_key
         self._secret_key = secret_key
         self._endpoint = endpoint
         self._impersonate = impersonate
+        self.json_codec = json_codec if json_codec else DEFAULT_JSON_CODEC
+        self.cache = cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.shared()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._timeout = (connect_timeout, read_timeout) if connect_timeout or read_timeout else None
+        self._tcp_keepalive = tcp_keepalive
+        self.observers = list(observers) if observers else []
 
         self._init_session()
         self._init_api()
@@ -55,16 +106,23 @@ class TenableIOClient(object):
         """
         Initializes the requests session
         """
-        retries = Retry(
+        retries = RateLimitedRetry(
                     total=TenableIOClient._MAX_RETRIES,
                     status_forcelist=TenableIOClient._RETRY_STATUS_CODES,
                     backoff_factor=2,
                     respect_retry_after_header=True
         )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+        retries.rate_limiter = self.rate_limiter
+        self._adapter = TenableIOAdapter(
+            tcp_keepalive=self._tcp_keepalive,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            max_retries=retries,
+        )
         self._session = requests.Session()
-        self._session.mount('http://', adapter)
-        self._session.mount('https://', adapter)
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
         self._session.headers.update({
             u'X-ApiKeys': u'accessKey=%s; secretKey=%s;' % (self._access_key, self._secret_key),
             u'User-Agent': u'TenableIOSDK Python/%s' % ('.'.join([str(i) for i in sys.version_info][0:3]))
@@ -118,8 +176,14 @@ class TenableIOClient(object):
         return wrapper
 
     @staticmethod
-    def impersonate(username):
-        return TenableIOClient(impersonate=username)
+    def impersonate(username, rate_limiter=None):
+        """
+        :param username: The username to impersonate.
+        :param rate_limiter: The :class:`tenable_io.rate_limiter.RateLimiter` of the client, default to None for the \
+        process wide limiter.
+        :return: A client impersonating the user.
+        """
+        return TenableIOClient(impersonate=username, rate_limiter=rate_limiter)
 
     @_error_handler
     def get(self, uri, path_params=None, **kwargs):
@@ -127,20 +191,48 @@ class TenableIOClient(object):
 
     @_error_handler
     def post(self, uri, payload=None, path_params=None, **kwargs):
-        if isinstance(payload, BaseRequest):
-            payload = payload.as_payload()
-        return self._request('POST', uri, path_params, json=payload, **kwargs)
+        return self._request('POST', uri, path_params, **self._json_kwargs(payload, kwargs))
 
     @_error_handler
     def put(self, uri, payload=None, path_params=None, **kwargs):
-        if isinstance(payload, BaseRequest):
-            payload = payload.as_payload()
-        return self._request('PUT', uri, path_params, json=payload, **kwargs)
+        return self._request('PUT', uri, path_params, **self._json_kwargs(payload, kwargs))
 
     @_error_handler
     def delete(self, uri, path_params=None, **kwargs):
         return self._request('DELETE', uri, path_params, **kwargs)
 
+    def _notify(self, metrics):
+        """
+        Call the observers with the metrics of a request. Errors raised by observers are logged and ignored.
+        """
+        for observer in self.observers:
+            try:
+                observer(metrics)
+            except Exception:
+                logging.exception(u'Request observer failed.')
+
+    def connection_stats(self):
+        """
+        :return: A dict of the number of requests sent on new and reused connections. Every response also has the \
+        `connection_reused` and `connect_time` attributes, see :class:`tenable_io.adapter.TenableIOAdapter`.
+        """
+        return self._adapter.stats()
+
+    def _json_kwargs(self, payload, kwargs):
+        """
+        Encode the payload with the client's JSON codec.
+        :param payload: The payload, as a :class:`tenable_io.api.base.BaseRequest` or a JSON serializable object.
+        :param kwargs: The request keyword arguments.
+        :return: The request keyword arguments with the encoded payload as body.
+        """
+        if isinstance(payload, BaseRequest):
+            payload = payload.as_payload()
+        if payload is None:
+            return kwargs
+        headers = dict(kwargs.get('headers') or {})
+        headers.setdefault('Content-Type', 'application/json')
+        return dict(kwargs, data=self.json_codec.dumps(payload), headers=headers)
+
     @classmethod
     def _flatten_param(cls, params):
         """
@@ -161,6 +253,7 @@ class TenableIOClient(object):
         return flatten
 
     def _request(self, method, uri, path_params=None, **kwargs):
+        uri_template = uri
         if path_params:
             # Ensure path param is encoded.
             path_params = {key: quote(str(value), safe=u'') for key, value in path_params.items()}
@@ -170,14 +263,48 @@ class TenableIOClient(object):
         if 'params' in kwargs:
             kwargs['params'] = self._flatten_param(kwargs['params'])
 
+        if self._timeout is not None:
+            kwargs.setdefault('timeout', self._timeout)
+
+        cache_key = None
+        if self.cache is not None and method == 'GET' and not kwargs.get('stream'):
+            cache_key = self.cache.key(uri, kwargs.get('params'))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         full_uri = self._endpoint + uri
 
-        response = self._session.request(method, full_uri, **kwargs)
-        log_message = format_request(response)
+        start = time.time()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        rate_limit_wait = time.time() - start
+
+        start = time.time()
+        try:
+            response = self._session.request(method, full_uri, **kwargs)
+        except Exception as e:
+            if self.observers:
+                self._notify(RequestMetrics(method, uri_template, uri, total_time=time.time() - start,
+                                            rate_limit_wait=rate_limit_wait, error=e))
+            raise
+
+        if self.observers:
+            self._notify(RequestMetrics.from_response(response, method=method, uri_template=uri_template, uri=uri,
+                                                      total_time=time.time() - start, rate_limit_wait=rate_limit_wait))
+
+        if self.rate_limiter is not None:
+            if response.status_code == 429:
+                self.rate_limiter.throttled(response.headers.get('Retry-After'))
+            else:
+                self.rate_limiter.success()
+        log_request(response)
+
+        if cache_key is not None and 200 <= response.status_code <= 299:
+            self.cache.set(cache_key, response)
 
-        logging.info(log_message)
-        if not 200 <= response.status_code <= 299:
-            logging.error(log_message)
+        if self.cache is not None and method != 'GET':
+            self.cache.invalidate(uri)
 
         return response
 
@@ -0,0 +1,56 @@
+import json
+import six
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    """JSON codec used to decode responses and encode payloads, based on the standard library `json` module.
+    """
+
+    def loads(self, s):
+        """Deserialize JSON.
+
+        :param s: The JSON document, as bytes (ex. `Response.content`) or text.
+        :return: The deserialized object.
+        """
+        if isinstance(s, six.binary_type) and not six.PY2:
+            s = s.decode('utf-8')
+        return json.loads(s)
+
+    def dumps(self, obj):
+        """Serialize to JSON.
+
+        :param obj: The object to serialize.
+        :return: The UTF-8 encoded JSON document.
+        """
+        s = json.dumps(obj)
+        return s.encode('utf-8') if isinstance(s, six.text_type) else s
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on `orjson <https://github.com/ijl/orjson>`_, which parses bytes directly without decoding them
+    to text first. Requires the optional `orjson` package.
+    """
+
+    def __init__(self):
+        assert orjson is not None, u'orjson is not installed.'
+
+    def loads(self, s):
+        return orjson.loads(s)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+
+def default_json_codec():
+    """
+    :return: An instance of :class:`OrjsonCodec` if orjson is installed, otherwise an instance of :class:`JsonCodec`.
+    """
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+DEFAULT_JSON_CODEC = default_json_codec()
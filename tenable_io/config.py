@@ -11,7 +11,18 @@ base_config = {
     'access_key': environ.get('TENABLEIO_ACCESS_KEY'),
     'secret_key': environ.get('TENABLEIO_SECRET_KEY'),
     'logging_level': environ.get('TENABLEIO_LOGGING_LEVEL', 'WARNING'),
+    'logging_sample_rate': environ.get('TENABLEIO_LOGGING_SAMPLE_RATE', '1'),
     'polling_interval': environ.get('TENABLEIO_POLLING_INTERVAL', '10'),
+    'concurrency': environ.get('TENABLEIO_CONCURRENCY', '1'),
+    'rate_limit': environ.get('TENABLEIO_RATE_LIMIT', '0'),
+    'pool_connections': environ.get('TENABLEIO_POOL_CONNECTIONS', '10'),
+    'pool_maxsize': environ.get('TENABLEIO_POOL_MAXSIZE', ''),
+    'pool_block': environ.get('TENABLEIO_POOL_BLOCK', 'false'),
+    'connect_timeout': environ.get('TENABLEIO_CONNECT_TIMEOUT', ''),
+    'read_timeout': environ.get('TENABLEIO_READ_TIMEOUT', ''),
+    'tcp_keepalive': environ.get('TENABLEIO_TCP_KEEPALIVE', 'false'),
+    'download_chunk_size': environ.get('TENABLEIO_DOWNLOAD_CHUNK_SIZE', '1048576'),
+    'download_segments': environ.get('TENABLEIO_DOWNLOAD_SEGMENTS', '4'),
 }
 
 # Read tenable_io.ini config. Default to environment variables if exist.
@@ -25,3 +36,15 @@ class TenableIOConfig(object):
     @staticmethod
     def get(key):
         return config.get('tenable_io', key)
+
+    @staticmethod
+    def get_boolean(key):
+        return config.getboolean('tenable_io', key)
+
+    @staticmethod
+    def get_float(key):
+        """
+        :return: The float value of the key, or None if empty.
+        """
+        value = config.get('tenable_io', key)
+        return float(value) if value else None
@@ -0,0 +1,234 @@
+import json
+import os
+import six
+import socket
+import threading
+
+from requests.exceptions import RequestException
+from requests.packages.urllib3.exceptions import HTTPError
+from six.moves.http_client import HTTPException
+
+import tenable_io.util as util
+
+from tenable_io.config import TenableIOConfig
+from tenable_io.exceptions import TenableIOApiException, TenableIOException, TenableIOFileChangedException
+
+DOWNLOAD_SEGMENTS = int(TenableIOConfig.get('download_segments'))
+
+# Errors of a dropped or stalled connection, after which a download is retried.
+CONNECTION_ERRORS = (RequestException, HTTPError, HTTPException, socket.timeout,
+                     getattr(six.moves.builtins, 'ConnectionError', socket.error))
+
+
+class Downloader(object):
+    """Download files to disk with parallel HTTP Range requests, resuming after failures.
+
+    The file is downloaded to `<path>.part`, next to a `<path>.part.json` state file recording the bytes downloaded by
+    every segment. After a failure, segments are retried from where they stopped, and a later download of the same file
+    to the same path resumes from the state file. Range requests carry an `If-Range` validator (`ETag` or
+    `Last-Modified`) so that segments of a modified file are never mixed, and the size of the file is verified before it
+    is moved to `path`. Files without a validator, or from servers not supporting ranges, are downloaded on a single
+    connection and restarted from the beginning after a failure.
+    """
+
+    MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+    # Number of bytes a segment downloads in between saves of the state file.
+    STATE_INTERVAL = 8 * 1024 * 1024
+
+    def __init__(self, client, segments=None, chunk_size=None, max_attempts=3):
+        """
+        :param client: An instance of :class:`tenable_io.client.TenableIOClient`.
+        :param segments: The maximum number of parallel segments, default to the `download_segments` config.
+        :param chunk_size: The size of the buffer data is read into, default to the `download_chunk_size` config.
+        :param max_attempts: The number of attempts of every segment before failing.
+        """
+        self._client = client
+        self._segments = segments if segments else DOWNLOAD_SEGMENTS
+        self._chunk_size = chunk_size if chunk_size else util.DOWNLOAD_CHUNK_SIZE
+        self._max_attempts = max_attempts
+
+    def download(self, uri, path, path_params=None):
+        """Download a file.
+
+        :param uri: The URI of the file, relative to the endpoint.
+        :param path: The file path to save the file to.
+        :param path_params: The path params of the URI.
+        :raise TenableIOException: When the download fails after max_attempts, or the file is inconsistent.
+        :return: The file path.
+        """
+        part_path = path + '.part'
+        state_path = part_path + '.json'
+
+        state = Downloader._load_state(state_path, uri, path_params) if os.path.exists(part_path) else None
+        if state is None:
+            try:
+                response = self._client.get(uri, path_params, stream=True, headers={'Range': 'bytes=0-0'})
+            except TenableIOApiException as e:
+                if e.response.status_code != 416:
+                    raise
+                # Range not satisfiable, the file is empty.
+                response = self._client.get(uri, path_params, stream=True)
+            total = Downloader._total(response)
+            validator = Downloader._validator(response)
+            if total is None or validator is None:
+                # Ranges are not supported, or a change of the file in between ranges could not be detected. Download
+                # the whole file.
+                if total is not None:
+                    response.close()
+                    response = self._client.get(uri, path_params, stream=True)
+                self._download_whole(uri, path_params, response, part_path)
+                Downloader._move(part_path, path)
+                return path
+            response.close()
+            state = {
+                'uri': uri,
+                'path_params': path_params,
+                'total': total,
+                'validator': validator,
+                'segments': self._split(total),
+            }
+            with open(part_path, 'wb') as f:
+                f.truncate(total)
+
+        lock = threading.Lock()
+        self._save_state(state_path, state, lock)
+        try:
+            util.parallel_map(lambda segment: self._download_segment(state, segment, part_path, state_path, lock),
+                              state['segments'], concurrency=len(state['segments']))
+        except TenableIOFileChangedException:
+            # Downloaded segments cannot be resumed.
+            os.remove(part_path)
+            os.remove(state_path)
+            raise
+
+        if not all(start + done == end + 1 for (start, end, done) in state['segments']) \
+                or os.path.getsize(part_path) != state['total']:
+            raise TenableIOException(u'Downloaded file size does not match the expected size.')
+        Downloader._move(part_path, path)
+        os.remove(state_path)
+        return path
+
+    def _split(self, total):
+        """
+        :return: The list of [start, end, done] of the segments of a file of `total` bytes.
+        """
+        count = max(1, min(self._segments, total // self.MIN_SEGMENT_SIZE))
+        size = -(-total // count)
+        return [[start, min(start + size, total) - 1, 0] for start in range(0, total, size)] or [[0, -1, 0]]
+
+    def _download_segment(self, state, segment, part_path, state_path, lock):
+        attempts = 0
+        while segment[0] + segment[2] <= segment[1]:
+            offset = segment[0] + segment[2]
+            headers = {'Range': 'bytes=%d-%d' % (offset, segment[1]), 'If-Range': state['validator']}
+            try:
+                response = self._client.get(state['uri'], state['path_params'], stream=True, headers=headers)
+                content_range = response.headers.get('Content-Range', '')
+                if response.status_code != 206 or not content_range.startswith('bytes %d-' % offset):
+                    response.close()
+                    raise TenableIOFileChangedException(u'File changed or range not satisfied during download.')
+                with open(part_path, 'r+b') as f:
+                    f.seek(offset)
+                    written = [0]
+
+                    def save():
+                        # Only record bytes flushed to the file, so that the state never runs ahead of the data.
+                        f.flush()
+                        segment[2] += written[0]
+                        written[0] = 0
+                        self._save_state(state_path, state, lock)
+
+                    def progress(count):
+                        written[0] += count
+                        if written[0] >= self.STATE_INTERVAL:
+                            save()
+
+                    try:
+                        Downloader._copy(response, f, self._chunk_size, progress)
+                    finally:
+                        save()
+                if segment[0] + segment[2] == offset:
+                    raise RequestException(u'Empty response.')
+            except CONNECTION_ERRORS:
+                attempts += 1
+                if attempts >= self._max_attempts:
+                    raise TenableIOException(u'Download failed after %d attempts.' % attempts)
+
+    def _download_whole(self, uri, path_params, response, part_path):
+        attempts = 0
+        while True:
+            try:
+                with open(part_path, 'wb') as f:
+                    Downloader._copy(response, f, self._chunk_size)
+                return
+            except CONNECTION_ERRORS:
+                attempts += 1
+                if attempts >= self._max_attempts:
+                    raise TenableIOException(u'Download failed after %d attempts.' % attempts)
+                response = self._client.get(uri, path_params, stream=True)
+
+    @staticmethod
+    def _copy(response, f, chunk_size, callback=None):
+        """Copy the body of a streamed response into a file.
+
+        :param callback: A function called with the number of bytes of every chunk once written, default to None.
+        """
+        raw = response.raw
+        # Let urllib3 decode gzip and deflate encoded bodies, as iter_content does.
+        raw.decode_content = True
+        util.copy_stream(raw, f, chunk_size, callback)
+        # Check the number of bytes received against Content-Length, which urllib3 only enforces from version 2.
+        expected = int(response.headers.get('Content-Length', -1))
+        if 0 <= expected != raw.tell():
+            raw.close()
+            raise RequestException(u'Connection closed after %d of %d bytes.' % (raw.tell(), expected))
+        raw.release_conn()
+
+    @staticmethod
+    def _validator(response):
+        """
+        :return: The strong ETag of the response, or its Last-Modified date, or None.
+        """
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return response.headers.get('Last-Modified')
+
+    @staticmethod
+    def _total(response):
+        """
+        :return: The total size of a 206 response, or None if the range was not satisfied.
+        """
+        content_range = response.headers.get('Content-Range', '')
+        if response.status_code != 206 or '/' not in content_range:
+            return None
+        total = content_range.rsplit('/', 1)[1]
+        return int(total) if total.isdigit() else None
+
+    @staticmethod
+    def _load_state(state_path, uri, path_params):
+        """
+        :return: The state of a previous download of the same URI with a validator, or None.
+        """
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if state.get('uri') != uri or state.get('path_params') != path_params or not state.get('validator'):
+            return None
+        return state
+
+    @staticmethod
+    def _save_state(state_path, state, lock):
+        with lock:
+            # Write a temporary file first, so that the state file is never left truncated.
+            with open(state_path + '.tmp', 'w') as f:
+                json.dump(state, f)
+            Downloader._move(state_path + '.tmp', state_path)
+
+    @staticmethod
+    def _move(source, destination):
+        if os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
@@ -22,6 +22,12 @@ class TenableIOApiException(TenableIOException):
             super(TenableIOApiException, self).__init__(response.text)
 
 
+class TenableIOFileChangedException(TenableIOException):
+    """Raised when a file is modified while it is being downloaded.
+    """
+    pass
+
+
 class ErrorCode(object):
 
     _HTTP_CODES = {}
@@ -113,13 +113,17 @@ class PolicyRef(object):
         """Download a policy file.
 
         :param path: The file path to save the file.
-        :param file_open_mode: The open mode to the file output. Default to 'wb'.
+        :param file_open_mode: The open mode to the file output. Default to 'wb', which downloads the file with \
+        :class:`tenable_io.downloader.Downloader`.
         :return: The same PolicyRef instance.
         """
-        iter_content = self._client.policies_api.export(self.id)
-        with open(path, file_open_mode) as fd:
-            for chunk in iter_content:
-                fd.write(chunk)
+        if file_open_mode == 'wb':
+            self._client.policies_api.export_file(self.id, path)
+        else:
+            iter_content = self._client.policies_api.export(self.id)
+            with open(path, file_open_mode) as fd:
+                for chunk in iter_content:
+                    fd.write(chunk)
         return self
 
     def name(self):
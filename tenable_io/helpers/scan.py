@@ -1,9 +1,11 @@
 import six
 import os
 import re
+import threading
 import time
 
 from datetime import datetime, timedelta
+from requests.exceptions import RequestException
 
 from tenable_io.api.models import Scan, ScanSettings, Template
 from tenable_io.api.scans import ScansApi, ScanCreateRequest, ScanExportRequest, ScanImportRequest, ScanLaunchRequest
@@ -23,6 +25,8 @@ class ScanHelper(object):
 
     def __init__(self, client):
         self._client = client
+        # A ScanCatalog used to look up scans instead of listing them on every call, default to None.
+        self.catalog = None
 
     def scans(self, name_regex=None, name=None, folder_id=None):
         """Get scans.
@@ -32,7 +36,11 @@ class ScanHelper(object):
         :param folder_id: Only scans in the folder identified by `folder_id`, default to None.
         :return: A list of ScanRef.
         """
-        scans = self._client.scans_api.list(folder_id=folder_id).scans
+        if self.catalog is not None:
+            return [ScanRef(self._client, scan_id)
+                    for scan_id in self.catalog.ids(name_regex=name_regex, name=name, folder_id=folder_id)]
+
+        scans = self._client.scans_api.list(folder_id=folder_id).scans or []
         if name_regex:
             name_regex = re.compile(name_regex)
             scans = [scan for scan in scans if name_regex.match(scan.name)]
@@ -51,28 +59,96 @@ class ScanHelper(object):
         # return ScanRef(self._client, self._client.scans_api.details(id).info.object_id)
         return ScanRef(self._client, id)
 
-    def stop_all(self, folder=None, folder_id=None):
+    def stop_all(self, folder=None, folder_id=None, polling_policy=None):
         """Stop all scans.
 
         :param folder: Instance of FolderRef. Stop all scan in the folder only. Default to None.
         :param folder_id: Stop all scan in the folder identified by folder_id only. Default to None.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :raise TenableIOException: When scans failed to stop and are still running or paused.
         :return: The current instance of ScanHelper.
         """
         from tenable_io.helpers.folder import FolderRef
         if folder_id is None and isinstance(folder, FolderRef):
             folder_id = folder.id
 
-        scans = self.scans(folder_id=folder_id)
-        for scan in scans:
-            try:
-                # Send stop requests for all scans first before waiting for it to be fully stopped.
-                scan.stop(False)
-            except TenableIOException:
-                pass
-        # Wait for scans to stop after all the stop requests are made.
-        [scan.wait_until_stopped() for scan in scans]
+        results = self.stop_many(self.scans(folder_id=folder_id), polling_policy=polling_policy)
+        failed = [result for result in results if not result.ok]
+        if failed:
+            # Stop requests fail for scans that are already stopped, and for running scans on errors.
+            statuses = {s.id: s.status for s in self._client.scans_api.list(folder_id=folder_id).scans or []}
+            running = [result for result in failed
+                       if result.scan.id in statuses and not ScanWaiter.stopped(statuses[result.scan.id])]
+            if running:
+                raise TenableIOException(u'Failed to stop scans: %s.' % u', '.join(
+                    u'%s (%s)' % (result.scan.id, result.error) for result in running))
         return self
 
+    def launch_many(self, scans, alt_targets=None, wait=True, concurrency=None, scanner_limit=None,
+                    polling_policy=None):
+        """Launch many scans concurrently. A scan failing to launch does not fail the others.
+
+        :param scans: A list of ScanRef.
+        :param alt_targets: String of comma separated alternative targets or list of alternative target strings.
+        :param wait: If True, the method blocks until the status of every launched scan is not \
+        :class:`tenable_io.api.models.Scan`.STATUS_PENDING. Default to True.
+        :param concurrency: The maximum number of concurrent launch requests, default to \
+        :data:`tenable_io.util.CONCURRENCY`.
+        :param scanner_limit: The maximum number of running scans per scanner, counting the scans already running \
+        according to :func:`tenable_io.api.scanners.ScannersApi.list`. Scans over the limit are launched as the scans \
+        running on their scanner stop, the method blocks until every scan is launched. Default to None for no limit.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :return: A list of ScanBatchResult, in the same order as the scans.
+        """
+        if isinstance(alt_targets, six.string_types):
+            alt_targets = [alt_targets]
+
+        return ScanBatch(self._client, concurrency=concurrency, scanner_limit=scanner_limit).run(
+            scans,
+            lambda scan: self._client.scans_api.launch(scan.id, ScanLaunchRequest(alt_targets=alt_targets)),
+            (lambda status: status != Scan.STATUS_PENDING) if wait else None,
+            polling_policy=polling_policy,
+        )
+
+    def pause_many(self, scans, wait=True, concurrency=None, polling_policy=None):
+        """Pause many scans concurrently. A scan failing to pause does not fail the others.
+
+        :param scans: A list of ScanRef.
+        :param wait: If True, the method blocks until the status of every paused scan is not \
+        :class:`tenable_io.api.models.Scan`.STATUS_PAUSING. Default to True.
+        :param concurrency: The maximum number of concurrent pause requests, default to \
+        :data:`tenable_io.util.CONCURRENCY`.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :return: A list of ScanBatchResult, in the same order as the scans.
+        """
+        return ScanBatch(self._client, concurrency=concurrency).run(
+            scans,
+            lambda scan: self._client.scans_api.pause(scan.id),
+            (lambda status: status != Scan.STATUS_PAUSING) if wait else None,
+            polling_policy=polling_policy,
+        )
+
+    def stop_many(self, scans, wait=True, concurrency=None, polling_policy=None):
+        """Stop many scans concurrently. A scan failing to stop does not fail the others.
+
+        :param scans: A list of ScanRef.
+        :param wait: If True, the method blocks until every stopped scan's status is stopped. Default to True.
+        :param concurrency: The maximum number of concurrent stop requests, default to \
+        :data:`tenable_io.util.CONCURRENCY`.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :return: A list of ScanBatchResult, in the same order as the scans.
+        """
+        return ScanBatch(self._client, concurrency=concurrency).run(
+            scans,
+            lambda scan: self._client.scans_api.stop(scan.id),
+            ScanWaiter.stopped if wait else None,
+            polling_policy=polling_policy,
+        )
+
     def create(self, name, text_targets, template):
         """Get scan by ID.
 
@@ -155,7 +231,8 @@ class ScanHelper(object):
             mac_addresses=None,
             netbios_names=None,
             tenable_uuids=None,
-            date_range=7
+            date_range=7,
+            concurrency=None,
     ):
         """Get scan activities against a list of targets. Note: For uncompleted scans, only the targets configured for
         the scan are matched against on the SDK-side. Completed scans are queried and matched on the API server-side.
@@ -167,6 +244,8 @@ class ScanHelper(object):
         :param netbios_names: A list of netbios_name's.
         :param tenable_uuids: A list of tenable_uuid's.
         :param date_range: The number of days of data prior to and including today that should be considered.
+        :param concurrency: The maximum number of concurrent requests made to resolve assets and scans, default to \
+        :data:`tenable_io.util.CONCURRENCY`.
         return: ScanActivity list sort by timestamp; active ScanActivity's are ordered first with None timestamp.
         """
         if not isinstance(targets, list):
@@ -191,20 +270,31 @@ class ScanHelper(object):
             elif isinstance(target, six.string_types) and len(target) > 0:
                 fqdns.append(target)
 
-        asset_activities = self._asset_activities(fqdns, ipv4s, mac_addresses, netbios_names, tenable_uuids, date_range)
-        running_activities = self._running_activities(fqdns, ipv4s)
+        # Scan details are shared by both lookups, fetch them at most once per scan.
+        scan_details = util.memoize(self._client.scans_api.details)
+
+        asset_activities = self._asset_activities(fqdns, ipv4s, mac_addresses, netbios_names, tenable_uuids, date_range,
+                                                  concurrency, scan_details)
+        running_activities = self._running_activities(fqdns, ipv4s, concurrency, scan_details)
 
         return running_activities + asset_activities
 
-    def _asset_activities(self, fqdns, ipv4s, mac_addresses, netbios_names, tenable_uuids, date_range):
+    def _asset_activities(self, fqdns, ipv4s, mac_addresses, netbios_names, tenable_uuids, date_range,
+                          concurrency=None, scan_details=None):
         """Get scan activities against FQDNs and IPv4s targets from scan are not completed yet. Note: The method is to
         inspect all active scan jobs from all scanners.
 
         :param fqdns: List of string targets in FQDN-format.
         :param ipv4s: List of string targets in IPv4-format.
         :param date_range: The number of days of data prior to and including today that should be considered.
+        :param concurrency: The maximum number of concurrent requests, default to :data:`tenable_io.util.CONCURRENCY`.
+        :param scan_details: Function returning the details of a scan given its ID, default to \
+        :func:`tenable_io.api.scans.ScansApi.details`.
         return: ScanActivity list.
         """
+        if scan_details is None:
+            scan_details = self._client.scans_api.details
+
         activities = []
         filters = []
 
@@ -251,8 +341,12 @@ class ScanHelper(object):
                 filter_search_type='or'
             )
 
-            for asset in assets.assets:
-                activity_list = self._client.workbenches_api.asset_activity(asset.id)
+            activity_lists = util.parallel_map(
+                lambda asset: self._client.workbenches_api.asset_activity(asset.id),
+                assets.assets,
+                concurrency
+            )
+            for activity_list in activity_lists:
                 activities.extend([a for a in activity_list.activity if None not in [a.scan_id, a.schedule_id]])
 
         # TODO support for date_range is broken as of 2017/05/15, remove manual filtering when support is functional.
@@ -265,11 +359,13 @@ class ScanHelper(object):
         ]
 
         # Build scan_id lookup table with schedule_uuid as keys.
-        scans = self._client.scans_api.list()
-        scan_ids = {
-            s.schedule_uuid: s.id
-            for s in scans.scans
-        }
+        if self.catalog is not None:
+            scan_ids = self.catalog.schedule_ids()
+        else:
+            scan_ids = {
+                getattr(s, 'schedule_uuid', None): s.id
+                for s in self._client.scans_api.list().scans or []
+            }
 
         # Group activities by scan_id (a scenario where this can be possible is when a scan have multiple targets that
         # matches the targets being queried).
@@ -284,8 +380,9 @@ class ScanHelper(object):
                 activities_by_scan_history[a.scan_id][a.history_uuid].append(a)
 
         # Look up history_id for each history_uuid
-        for scan_id, activities_by_history_uuid in activities_by_scan_history.items():
-            details = self._client.scans_api.details(scan_id)
+        scan_ids = list(activities_by_scan_history.keys())
+        for scan_id, details in zip(scan_ids, util.parallel_map(scan_details, scan_ids, concurrency)):
+            activities_by_history_uuid = activities_by_scan_history[scan_id]
             for history in details.history:
                 if history.uuid in activities_by_history_uuid:
                     for a in activities_by_history_uuid[history.uuid]:
@@ -297,44 +394,58 @@ class ScanHelper(object):
         # Order by timestamp
         return sorted(activities, key=lambda a: datetime.strptime(a.timestamp, '%Y-%m-%dT%H:%M:%S.%fZ'), reverse=True)
 
-    def _running_activities(self, fqdns, ipv4s):
+    def _running_activities(self, fqdns, ipv4s, concurrency=None, scan_details=None):
         """Get scan activities against FQDNs and IPv4s targets from scan are not completed yet. Note: The method is to
         inspect all active scan jobs from all scanners.
 
         :param fqdns: List of string targets in FQDN-format.
         :param ipv4s: List of string targets in IPv4-format.
+        :param concurrency: The maximum number of concurrent requests, default to :data:`tenable_io.util.CONCURRENCY`.
+        :param scan_details: Function returning the details of a scan given its ID, default to \
+        :func:`tenable_io.api.scans.ScansApi.details`.
         return: ScanActivity list.
         """
-        activities = []
+        if scan_details is None:
+            scan_details = self._client.scans_api.details
+
+        # Get the running scans of all scanners with at least 1 running scans.
+        scan_lists = util.parallel_map(
+            lambda scanner: self._client.scanners_api.get_scans(scanner.id),
+            [s for s in self._client.scanners_api.list().scanners if s.scan_count > 0],
+            concurrency
+        )
 
-        # Iterate through all scanners with at least 1 running scans.
-        for scanner in [s for s in self._client.scanners_api.list().scanners if s.scan_count > 0]:
-            scans = self._client.scanners_api.get_scans(scanner.id)
-            # Iterate through each running scan.
-            for s in scans.scans:
-                # Find the corresponding history.
-                history = None
-                for h in self._client.scans_api.details(scan_id=s.scan_id).history:
-                    if s.id == h.uuid:
-                        history = h
-                        break
-                assert history, u'There should be history with the matching ID returned by the scanner.'
-
-                details = self._client.scans_api.details(scan_id=s.scan_id, history_id=history.history_id)
-
-                # Check if this scan has matching targets.
-                if details.info.targets:
-                    scan_targets = set(details.info.targets.lower().split(u','))
-                    if scan_targets.intersection(fqdns) or scan_targets.intersection(ipv4s):
-                        activities.append(
-                            ScanActivity(
-                                self._client,
-                                history.history_id,
-                                history.uuid,
-                                s.scan_id,
-                                details.info.schedule_uuid
-                            )
-                        )
+        def running_activity(s):
+            # Find the corresponding history.
+            history = None
+            for h in scan_details(s.scan_id).history:
+                if s.id == h.uuid:
+                    history = h
+                    break
+            assert history, u'There should be history with the matching ID returned by the scanner.'
+
+            details = self._client.scans_api.details(scan_id=s.scan_id, history_id=history.history_id)
+
+            # Check if this scan has matching targets.
+            if details.info.targets:
+                scan_targets = set(details.info.targets.lower().split(u','))
+                if scan_targets.intersection(fqdns) or scan_targets.intersection(ipv4s):
+                    return ScanActivity(
+                        self._client,
+                        history.history_id,
+                        history.uuid,
+                        s.scan_id,
+                        details.info.schedule_uuid
+                    )
+            return None
+
+        # Inspect each running scan.
+        activities = util.parallel_map(
+            running_activity,
+            [s for scans in scan_lists for s in scans.scans],
+            concurrency
+        )
+        activities = [a for a in activities if a is not None]
 
         return sorted(activities, key=lambda o: o.scan_id, reverse=True)
 
@@ -387,6 +498,8 @@ class ScanRef(object):
         if force_stop and not self.stopped():
             self.stop()
         self._client.scans_api.delete(self.id)
+        if self._client.scan_helper.catalog is not None:
+            self._client.scan_helper.catalog.discard(self.id)
         return self
 
     def details(self, history_id=None):
@@ -397,18 +510,22 @@ class ScanRef(object):
         return self._client.scans_api.details(self.id, history_id=history_id)
 
     def download(self, path, history_id=None, format=ScanExportRequest.FORMAT_PDF,
-                 chapter=ScanExportRequest.CHAPTER_EXECUTIVE_SUMMARY, file_open_mode='wb'):
+                 chapter=ScanExportRequest.CHAPTER_EXECUTIVE_SUMMARY, file_open_mode='wb',
+                 polling_policy=None):
         """Download a scan report.
 
         :param path: The file path to save the report to.
         :param format: The report format. Default to :class:`tenable_io.api.scans.ScanExportRequest`.FORMAT_PDF.
         :param chapter: The report contents. Default to \
         :class:`tenable_io.api.scans.ScanExportRequest`.CHAPTER_EXECUTIVE_SUMMARY.
-        :param file_open_mode: The open mode to the file output. Default to "wb".
+        :param file_open_mode: The open mode to the file output. Default to "wb", which downloads the file with \
+        :class:`tenable_io.downloader.Downloader`.
         :param history_id: A specific scan history ID, None for the most recent scan history. default to None.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the waits, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
-        self.wait_until_stopped(history_id=history_id)
+        self.wait_until_stopped(history_id=history_id, polling_policy=polling_policy)
 
         if format in [ScanExportRequest.FORMAT_HTML, ScanExportRequest.FORMAT_PDF]:
             export_request = ScanExportRequest(format=format, chapters=chapter)
@@ -421,12 +538,16 @@ class ScanRef(object):
             history_id
         )
         util.wait_until(
-            lambda: self._client.scans_api.export_status(self.id, file_id) == ScansApi.STATUS_EXPORT_READY)
+            lambda: self._client.scans_api.export_status(self.id, file_id) == ScansApi.STATUS_EXPORT_READY,
+            polling_policy=polling_policy)
 
-        iter_content = self._client.scans_api.export_download(self.id, file_id)
-        with open(path, file_open_mode) as fd:
-            for chunk in iter_content:
-                fd.write(chunk)
+        if file_open_mode == 'wb':
+            self._client.scans_api.export_download_file(self.id, file_id, path)
+        else:
+            iter_content = self._client.scans_api.export_download(self.id, file_id)
+            with open(path, file_open_mode) as fd:
+                for chunk in iter_content:
+                    fd.write(chunk)
         return self
 
     def histories(self, since=None):
@@ -451,13 +572,15 @@ class ScanRef(object):
         histories = self.histories()
         return histories[-1] if len(histories) else None
 
-    def launch(self, wait=True, alt_targets=None):
+    def launch(self, wait=True, alt_targets=None, polling_policy=None):
         """Launch the scan.
 
         :param wait: If True, the method blocks until the scan's status is not \
         :class:`tenable_io.api.models.Scan`.STATUS_PENDING. Default is False.
 
         :param alt_targets: String of comma separated alternative targets or list of alternative target strings.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
         if isinstance(alt_targets, six.string_types):
@@ -468,7 +591,8 @@ class ScanRef(object):
             ScanLaunchRequest(alt_targets=alt_targets)
         )
         if wait:
-            util.wait_until(lambda context: self.status(_context=context) not in Scan.STATUS_PENDING, context={})
+            util.wait_until(lambda context: self.status(_context=context) not in Scan.STATUS_PENDING, context={},
+                            polling_policy=polling_policy)
         return self
 
     def name(self, history_id=None):
@@ -508,28 +632,34 @@ class ScanRef(object):
         self.move_to(trash_folder)
         return self
 
-    def pause(self, wait=True):
+    def pause(self, wait=True, polling_policy=None):
         """Pause the scan.
 
         :param wait: If True, the method blocks until the scan's status is not \
         :class:`tenable_io.api.models.Scan`.STATUS_PAUSING. Default is False.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
         self._client.scans_api.pause(self.id)
         if wait:
-            util.wait_until(lambda context: self.status(_context=context) != Scan.STATUS_PAUSING, context={})
+            util.wait_until(lambda context: self.status(_context=context) != Scan.STATUS_PAUSING, context={},
+                            polling_policy=polling_policy)
         return self
 
-    def resume(self, wait=True):
+    def resume(self, wait=True, polling_policy=None):
         """Resume the scan.
 
         :param wait: If True, the method blocks until the scan's status is not \
         :class:`tenable_io.api.models.Scan`.STATUS_RESUMING. Default is False.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
         self._client.scans_api.resume(self.id)
         if wait:
-            util.wait_until(lambda context: self.status(_context=context) != Scan.STATUS_RESUMING, context={})
+            util.wait_until(lambda context: self.status(_context=context) != Scan.STATUS_RESUMING, context={},
+                            polling_policy=polling_policy)
         return self
 
     def status(self, history_id=None, _context=None):
@@ -553,15 +683,17 @@ class ScanRef(object):
             status = details.info.status
         return status
 
-    def stop(self, wait=True):
+    def stop(self, wait=True, polling_policy=None):
         """Stop the scan.
 
         :param wait: If True, the method blocks until the scan's status is stopped. Default is False.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
         self._client.scans_api.stop(self.id)
         if wait:
-            self.wait_until_stopped()
+            self.wait_until_stopped(polling_policy=polling_policy)
         return self
 
     def stopped(self, history_id=None, _context=None):
@@ -572,23 +704,333 @@ class ScanRef(object):
         """
         return self.status(history_id=history_id, _context=_context) in ScanHelper.STATUSES_STOPPED
 
-    def wait_or_cancel_after(self, seconds):
+    def wait_or_cancel_after(self, seconds, polling_policy=None):
         """Blocks until the scan is stopped, or cancel if it isn't stopped within the specified seconds.
 
         :param seconds: The maximum amount of seconds the method should block before canceling the scan.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
         start_time = time.time()
-        util.wait_until(lambda: time.time() - start_time > seconds or self.stopped())
+        util.wait_until(lambda: time.time() - start_time > seconds or self.stopped(), polling_policy=polling_policy)
         if not self.stopped():
             self.stop()
         return self
 
-    def wait_until_stopped(self, history_id=None):
+    def wait_until_stopped(self, history_id=None, polling_policy=None):
         """Blocks until the scan is stopped.
 
         :param history_id: The scan history to wait for, None for most recent. Default to None.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
         :return: The same ScanRef instance.
         """
-        util.wait_until(lambda context: self.stopped(history_id=history_id, _context=context), context={})
+        util.wait_until(lambda context: self.stopped(history_id=history_id, _context=context), context={},
+                        polling_policy=polling_policy)
         return self
+
+
+class ScanWaiter(object):
+    """Waits on many scans at once. Each polling round fetches the status of every tracked scan with a single call to
+    :func:`tenable_io.api.scans.ScansApi.list`, instead of polling each scan separately.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._pending = {}
+        self.statuses = {}
+
+    @staticmethod
+    def stopped(status):
+        return status in ScanHelper.STATUSES_STOPPED
+
+    def add(self, scan, condition=None, callback=None):
+        """Track a scan.
+
+        :param scan: An instance of ScanRef.
+        :param condition: Function of the scan status, returning True when the scan is done waiting on. Default to \
+        :func:`ScanWaiter.stopped`.
+        :param callback: Function called with the ScanRef and its status as soon as the condition is met, or with a \
+        None status if the scan no longer exists. Default to None.
+        :return: The same ScanWaiter instance.
+        """
+        assert isinstance(scan, ScanRef)
+        self._pending[scan.id] = (scan, condition if condition else ScanWaiter.stopped, callback)
+        return self
+
+    def pending(self):
+        """Get the scans that are still waited on.
+
+        :return: A list of ScanRef.
+        """
+        return [scan for scan, _, _ in self._pending.values()]
+
+    def poll(self):
+        """Fetch the status of all tracked scans once, and resolve the scans that meet their condition.
+
+        :return: True if no scan is left to wait on.
+        """
+        if self._pending:
+            statuses = {s.id: s.status for s in self._client.scans_api.list().scans}
+            for scan_id in list(self._pending):
+                scan, condition, callback = self._pending[scan_id]
+                # Scans missing from the list have been deleted, there is nothing left to wait on.
+                if scan_id not in statuses or condition(statuses[scan_id]):
+                    del self._pending[scan_id]
+                    self.statuses[scan_id] = statuses.get(scan_id)
+                    if callback:
+                        callback(scan, self.statuses[scan_id])
+        return not self._pending
+
+    def wait(self, polling_policy=None):
+        """Blocks until every tracked scan meets its condition.
+
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :return: A dict of the final status of each scan, keyed by scan ID.
+        """
+        util.wait_until(self.poll, polling_policy=polling_policy)
+        return self.statuses
+
+
+class ScanCatalog(object):
+    """Index of the scan list by name, folder and schedule UUID, shared by the lookups of :class:`ScanHelper` when set
+    as its `catalog`.
+
+    The first lookup lists all scans. Lookups made more than `max_age` seconds after the last refresh only list the
+    scans modified since then. Deleted scans are only dropped by a full refresh, or when deleted with
+    :func:`ScanRef.delete`.
+    """
+
+    def __init__(self, client, max_age=60):
+        """
+        :param client: An instance of TenableIOClient.
+        :param max_age: Seconds a lookup uses the index before refreshing it, default to 60. 0 to refresh before \
+        every lookup.
+        """
+        self._client = client
+        self.max_age = max_age
+        self.scans = {}
+        self._names = {}
+        self._folders = {}
+        self._schedules = {}
+        # The server timestamp of the last scan list, and the local time of the last refresh.
+        self.timestamp = None
+        self._refreshed = None
+        self._lock = threading.Lock()
+
+    def refresh(self, full=False):
+        """Update the index with the scans modified since the last refresh.
+
+        :param full: If True, or if the index was never refreshed, list all scans and rebuild the index. Default to \
+        False.
+        :return: The same ScanCatalog instance.
+        """
+        with self._lock:
+            if full or self.timestamp is None:
+                scan_list = self._client.scans_api.list()
+                self.scans, self._names, self._folders, self._schedules = {}, {}, {}, {}
+            else:
+                scan_list = self._client.scans_api.list(last_modification_date=self.timestamp)
+            for scan in scan_list.scans or []:
+                self._add(scan)
+            self.timestamp = scan_list.timestamp
+            self._refreshed = time.time()
+        return self
+
+    def _add(self, scan):
+        self._remove(scan.id)
+        self.scans[scan.id] = scan
+        self._names.setdefault(scan.name, set()).add(scan.id)
+        self._folders.setdefault(scan.folder_id, set()).add(scan.id)
+        schedule_uuid = getattr(scan, 'schedule_uuid', None)
+        if schedule_uuid:
+            self._schedules[schedule_uuid] = scan.id
+
+    def _remove(self, scan_id):
+        scan = self.scans.pop(scan_id, None)
+        if scan is not None:
+            self._names.get(scan.name, set()).discard(scan_id)
+            self._folders.get(scan.folder_id, set()).discard(scan_id)
+            schedule_uuid = getattr(scan, 'schedule_uuid', None)
+            if self._schedules.get(schedule_uuid) == scan_id:
+                del self._schedules[schedule_uuid]
+
+    def discard(self, scan_id):
+        """Remove a deleted scan from the index.
+
+        :param scan_id: The scan ID.
+        :return: The same ScanCatalog instance.
+        """
+        with self._lock:
+            self._remove(scan_id)
+        return self
+
+    def _fresh(self):
+        if self._refreshed is None or time.time() - self._refreshed >= self.max_age:
+            self.refresh()
+
+    def ids(self, name_regex=None, name=None, folder_id=None):
+        """Get the IDs of scans.
+
+        :param name: A string to match scans with, default to None. Ignored if the `name_regex` argument is passed.
+        :param name_regex: A regular expression to match scans' names with, default to None.
+        :param folder_id: Only scans in the folder identified by `folder_id`, default to None.
+        :return: A list of scan IDs, in ascending order.
+        """
+        self._fresh()
+        with self._lock:
+            if folder_id:
+                ids = set(self._folders.get(folder_id, ()))
+            else:
+                ids = set(self.scans)
+            if name_regex:
+                name_regex = re.compile(name_regex)
+                ids = set(scan_id for scan_id in ids if name_regex.match(self.scans[scan_id].name))
+            elif name:
+                ids &= self._names.get(name, set())
+        return sorted(ids)
+
+    def schedule_ids(self):
+        """
+        :return: A dict of scan IDs keyed by the scans' schedule UUID.
+        """
+        self._fresh()
+        with self._lock:
+            return dict(self._schedules)
+
+
+class ScanBatchResult(object):
+    """The outcome of a request of a batch for one scan.
+    """
+
+    def __init__(self, scan):
+        """
+        :param scan: The ScanRef.
+        """
+        self.scan = scan
+        # The name of the scanner of the scan, when the batch has a per-scanner limit.
+        self.scanner = None
+        # The status once the request is complete, None when not waited on or if the scan no longer exists.
+        self.status = None
+        # The exception raised by the request, including transport errors such as timeouts, None if it succeeded.
+        self.error = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class ScanBatch(object):
+    """Sends a request for many scans with a bounded number of concurrent requests, and an optional limit of the
+    running scans per scanner. The completion of every request is tracked by a single :class:`ScanWaiter`.
+    """
+
+    def __init__(self, client, concurrency=None, scanner_limit=None):
+        """
+        :param client: An instance of TenableIOClient.
+        :param concurrency: The maximum number of concurrent requests, default to :data:`tenable_io.util.CONCURRENCY`.
+        :param scanner_limit: The maximum number of running scans per scanner, including the scans already running \
+        according to :func:`tenable_io.api.scanners.ScannersApi.list`. Default to None for no limit.
+        """
+        self._client = client
+        self.concurrency = concurrency
+        self.scanner_limit = scanner_limit
+
+    def run(self, scans, request, condition=None, polling_policy=None):
+        """Send the request for every scan, and wait until every successful request is complete.
+
+        :param scans: A list of ScanRef.
+        :param request: Function sending the request for a ScanRef.
+        :param condition: Function of the scan status, returning True when the request is complete. Default to None \
+        to not wait.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` for the wait, default to None \
+        for the default policy.
+        :return: A list of ScanBatchResult, in the same order as the scans.
+        """
+        results = [ScanBatchResult(scan) for scan in scans]
+        slots = self._slots(results) if self.scanner_limit is not None else None
+        queue = [result for result in results if result.ok]
+        waiter = ScanWaiter(self._client)
+        # Results waiting on their condition, and results holding a slot of their scanner until they stop.
+        waiting = set()
+        holding = set()
+
+        def send(result):
+            try:
+                request(result.scan)
+            except (TenableIOException, RequestException) as e:
+                result.error = e
+
+        def on_stopped(result):
+            def callback(scan, status):
+                holding.discard(result)
+                slots[result.scanner] = slots.get(result.scanner, self.scanner_limit) + 1
+            return callback
+
+        def on_complete(result):
+            def callback(scan, status):
+                result.status = status
+                waiting.discard(result)
+                if result in holding:
+                    if status is None or ScanWaiter.stopped(status):
+                        on_stopped(result)(scan, status)
+                    else:
+                        waiter.add(scan, callback=on_stopped(result))
+            return callback
+
+        def step():
+            ready = []
+            for result in list(queue):
+                if slots is None or slots.get(result.scanner, self.scanner_limit) > 0:
+                    queue.remove(result)
+                    ready.append(result)
+                    if slots is not None:
+                        slots[result.scanner] = slots.get(result.scanner, self.scanner_limit) - 1
+            util.parallel_map(send, ready, self.concurrency)
+            for result in ready:
+                if not result.ok:
+                    if slots is not None:
+                        slots[result.scanner] += 1
+                    continue
+                if slots is not None:
+                    holding.add(result)
+                if condition:
+                    waiting.add(result)
+                    waiter.add(result.scan, condition, on_complete(result))
+                elif slots is not None:
+                    waiter.add(result.scan, callback=on_stopped(result))
+
+            if not queue and not waiting:
+                return True
+            if waiter.pending():
+                waiter.poll()
+            if queue and not holding:
+                # The scanners are busy with scans out of the batch, refresh their counts.
+                slots.update(self._scanner_slots())
+            return not queue and not waiting
+
+        util.wait_until(step, polling_policy=polling_policy)
+        return results
+
+    def _scanner_slots(self):
+        """
+        :return: A dict of the number of scans that can be launched on each scanner, keyed by scanner name.
+        """
+        return dict((scanner.name, self.scanner_limit - (scanner.scan_count or 0))
+                    for scanner in self._client.scanners_api.list().scanners)
+
+    def _slots(self, results):
+        """Look up the scanner of every scan.
+
+        :return: A dict of the number of scans that can be launched on each scanner, keyed by scanner name.
+        """
+        def lookup(result):
+            try:
+                result.scanner = self._client.scans_api.details(result.scan.id).info.scanner_name
+            except (TenableIOException, RequestException) as e:
+                result.error = e
+
+        util.parallel_map(lookup, results, self.concurrency)
+        return self._scanner_slots()
@@ -1,8 +1,12 @@
+import os
+import shutil
+import six
 import tempfile
 
 from tenable_io.api.workbenches import WorkbenchesApi
-from tenable_io.parser.workbenches import WorkbenchParser
-from tenable_io.util import wait_until
+from tenable_io.parser.columnar import VulnerabilityColumnBuilder
+from tenable_io.parser.workbenches import PluginTable, WorkbenchParser
+from tenable_io.util import IterContentReader, wait_until
 
 
 class WorkbenchHelper(object):
@@ -12,17 +16,30 @@ class WorkbenchHelper(object):
     def __init__(self, client):
         self._client = client
 
-    def assets(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def assets(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE, stream=False, polling_policy=None,
+               processes=None, ordered=True, report_filter=None, plugins=None):
         """Retrieve recorded assets.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param plugin_id: If specified, returns only assets with vulnerabilities found by the plugin identified by
             plugin_id, default to None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param stream: If True, parse the report while it is being downloaded, default to False.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
+        :param processes: If specified, the number of processes to parse the report with, default to None.
+        :param ordered: If False, parallel parsing yields assets as soon as they are parsed, default to True.
+        :param report_filter: If specified, an instance of :class:`tenable_io.parser.workbenches.ReportFilter` of the \
+        hosts and vulnerabilities to parse, default to None.
+        :param plugins: If specified, an instance of :class:`tenable_io.parser.workbenches.PluginTable` the plugin \
+        level fields are stored into once per plugin. Vulnerabilities are then instances of \
+        :class:`CompactVulnerability`, which look up the plugin level fields in the table instead of copying them. It \
+        cannot be combined with processes, default to None.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`AssetVulnerabilities`.
         """
-        return self.assets_parse(date_range, plugin_id, page_size)
+        return self.assets_parse(date_range, plugin_id, page_size, stream, polling_policy, processes, ordered,
+                                 report_filter, plugins)
 
     def assets_api(self, date_range=1, plugin_id=None):
         """Retrieve recorded assets.
@@ -62,16 +79,34 @@ class WorkbenchHelper(object):
 
         return vulnerability_assets_ids
 
-    def assets_parse(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def assets_parse(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE, stream=False,
+                     polling_policy=None, processes=None, ordered=True, report_filter=None, plugins=None):
         """Retrieve recorded assets from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param plugin_id: If specified, returns only assets with vulnerabilities found by the plugin identified by
             plugin_id, default to None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param stream: If True, the report is parsed while it is being downloaded instead of being written to a \
+        temporary file first, default to False. Note: the download connection stays open until the iterator is \
+        exhausted or closed.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
+        :param processes: If specified, the report is parsed by this number of processes, see \
+        :func:`WorkbenchParser.parse_parallel`. It cannot be combined with stream, default to None.
+        :param ordered: If False, parallel parsing yields assets as soon as they are parsed, default to True.
+        :param report_filter: If specified, an instance of :class:`tenable_io.parser.workbenches.ReportFilter` of the \
+        hosts and vulnerabilities to parse, default to None.
+        :param plugins: If specified, an instance of :class:`tenable_io.parser.workbenches.PluginTable` the plugin \
+        level fields are stored into once per plugin. Vulnerabilities are then instances of \
+        :class:`CompactVulnerability`, which look up the plugin level fields in the table instead of copying them. It \
+        cannot be combined with processes, default to None.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`AssetVulnerabilities`.
         """
+        assert not (stream and processes), u'Streamed reports cannot be parsed in parallel.'
+        assert not (plugins is not None and processes), u'Plugin tables cannot be shared by processes.'
+
         file_id = self._client.workbenches_api.export_request(
             WorkbenchesApi.FORMAT_NESSUS,
             WorkbenchesApi.REPORT_VULNERABILITIES,
@@ -85,43 +120,46 @@ class WorkbenchHelper(object):
             }],
         )
 
-        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
-
-        iter_content = self._client.workbenches_api.export_download(file_id)
-
-        with tempfile.NamedTemporaryFile() as temp:
+        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY,
+                   polling_policy=polling_policy)
 
-            for chunk in iter_content:
-                temp.write(chunk)
-                temp.flush()
-
-            assets = []
-            try:
-                gen = WorkbenchParser.parse(temp.name)
-                while True:
-                    report = next(gen)
-                    assets.append(AssetVulnerabilities().from_report(report))
-                    if page_size and len(assets) >= page_size:
-                        yield assets
-                        assets = []
-                pass
-            except StopIteration:
-                pass
+        assets = []
+        transform = _asset_vulnerabilities_from_report if plugins is None \
+            else lambda report: AssetVulnerabilities().from_report(report, plugins)
+        for asset in self._parse_export(file_id, WorkbenchParser.REPORT_HOST, stream, processes, ordered,
+                                        transform, report_filter, plugins=plugins):
+            assets.append(asset)
+            if page_size and len(assets) >= page_size:
+                yield assets
+                assets = []
 
         if len(assets) > 0:
             yield assets
 
-    def vulnerabilities(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def vulnerabilities(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE, stream=False,
+                        polling_policy=None, processes=None, ordered=True, report_filter=None, plugins=None):
         """Retrieve recorded vulnerabilities from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param asset_id: If specified, returns only vulnerabilities for the asset identified by asset_id, default to
             None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param stream: If True, parse the report while it is being downloaded, default to False.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
+        :param processes: If specified, the number of processes to parse the report with, default to None.
+        :param ordered: If False, parallel parsing yields vulnerabilities as soon as they are parsed, default to True.
+        :param report_filter: If specified, an instance of :class:`tenable_io.parser.workbenches.ReportFilter` of the \
+        hosts and vulnerabilities to parse, default to None.
+        :param plugins: If specified, an instance of :class:`tenable_io.parser.workbenches.PluginTable` the plugin \
+        level fields are stored into once per plugin. Vulnerabilities are then instances of \
+        :class:`CompactVulnerability`, which look up the plugin level fields in the table instead of copying them. It \
+        cannot be combined with processes, default to None.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`Vulnerability`.
         """
-        return self.vulnerabilities_parse(date_range, asset_id, page_size)
+        return self.vulnerabilities_parse(date_range, asset_id, page_size, stream, polling_policy, processes, ordered,
+                                          report_filter, plugins)
 
     def vulnerabilities_api(self, date_range=1, asset_id=None):
         """Retrieve recorded vulnerabilities.
@@ -139,16 +177,82 @@ class WorkbenchHelper(object):
             vulnerabilities = self._client.workbenches_api.vulnerabilities(date_range=date_range).vulnerabilities
         return vulnerabilities
 
-    def vulnerabilities_parse(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def vulnerabilities_parse(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE, stream=False,
+                              polling_policy=None, processes=None, ordered=True, report_filter=None, plugins=None):
         """Retrieve recorded vulnerabilities from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param asset_id: If specified, returns only vulnerabilities for the asset identified by asset_id, default to
             None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param stream: If True, the report is parsed while it is being downloaded instead of being written to a \
+        temporary file first, default to False. Note: the download connection stays open until the iterator is \
+        exhausted or closed.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
+        :param processes: If specified, the report is parsed by this number of processes, see \
+        :func:`WorkbenchParser.parse_parallel`. It cannot be combined with stream, default to None.
+        :param ordered: If False, parallel parsing yields vulnerabilities as soon as they are parsed, default to True.
+        :param report_filter: If specified, an instance of :class:`tenable_io.parser.workbenches.ReportFilter` of the \
+        hosts and vulnerabilities to parse, default to None.
+        :param plugins: If specified, an instance of :class:`tenable_io.parser.workbenches.PluginTable` the plugin \
+        level fields are stored into once per plugin. Vulnerabilities are then instances of \
+        :class:`CompactVulnerability`, which look up the plugin level fields in the table instead of copying them. It \
+        cannot be combined with processes, default to None.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`Vulnerability`.
         """
+        assert not (stream and processes), u'Streamed reports cannot be parsed in parallel.'
+        assert not (plugins is not None and processes), u'Plugin tables cannot be shared by processes.'
+
+        file_id = self._vulnerabilities_export(date_range, asset_id, polling_policy)
+
+        vulnerabilities = []
+        transform = _vulnerability_from_report_item if plugins is None \
+            else lambda report_item: CompactVulnerability(report_item, plugins)
+        for vulnerability in self._parse_export(file_id, WorkbenchParser.REPORT_ITEM, stream, processes, ordered,
+                                                transform, report_filter, plugins=plugins):
+            vulnerabilities.append(vulnerability)
+            if page_size and len(vulnerabilities) >= page_size:
+                yield vulnerabilities
+                vulnerabilities = []
+
+        if len(vulnerabilities) > 0:
+            yield vulnerabilities
+
+    def vulnerabilities_columnar(self, date_range=1, asset_id=None, batch_size=65536, stream=False,
+                                 polling_policy=None, processes=None, report_filter=None):
+        """Retrieve recorded vulnerabilities from the workbench nessus report, in column oriented batches.
+
+        Batches hold typed arrays of the numeric fields and dictionary encoded strings, see \
+        :class:`tenable_io.parser.columnar.VulnerabilityColumnBuilder`. They can be written to a file with \
+        :class:`tenable_io.parser.columnar.ColumnarWriter`, or converted with :func:`ColumnBatch.to_arrow`.
+
+        :param date_range: The number of days of data prior to today to return, default to 1.
+        :param asset_id: If specified, returns only vulnerabilities for the asset identified by asset_id, default to \
+        None.
+        :param batch_size: The maximum number of vulnerabilities per batch.
+        :param stream: See :func:`WorkbenchHelper.vulnerabilities_parse`.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
+        :param processes: See :func:`WorkbenchHelper.vulnerabilities_parse`.
+        :param report_filter: See :func:`WorkbenchHelper.vulnerabilities_parse`.
+        :raise TenableIOApiException:  When API error is encountered.
+        :return: Iterator that yields instances of :class:`tenable_io.parser.columnar.ColumnBatch`.
+        """
+        assert not (stream and processes), u'Streamed reports cannot be parsed in parallel.'
+
+        file_id = self._vulnerabilities_export(date_range, asset_id, polling_policy)
+        report_hosts = self._parse_export(file_id, WorkbenchParser.REPORT_HOST, stream, processes,
+                                          report_filter=report_filter, fields=VulnerabilityColumnBuilder.FIELDS)
+        for batch in VulnerabilityColumnBuilder(batch_size).batches(report_hosts):
+            yield batch
+
+    def _vulnerabilities_export(self, date_range, asset_id, polling_policy):
+        """Request a nessus export of vulnerabilities, and wait for it to be ready.
+
+        :return: The file ID of the export.
+        """
         file_id = self._client.workbenches_api.export_request(
             WorkbenchesApi.FORMAT_NESSUS,
             WorkbenchesApi.REPORT_VULNERABILITIES,
@@ -162,31 +266,47 @@ class WorkbenchHelper(object):
             }]
         )
 
-        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
-
-        iter_content = self._client.workbenches_api.export_download(file_id)
-
-        with tempfile.NamedTemporaryFile() as temp:
-
-            for chunk in iter_content:
-                temp.write(chunk)
-                temp.flush()
-
-            vulnerabilities = []
+        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY,
+                   polling_policy=polling_policy)
+        return file_id
+
+    def _parse_export(self, file_id, tag, stream=False, processes=None, ordered=True, transform=None,
+                      report_filter=None, fields=None, plugins=None):
+        """Download and parse a nessus workbench export.
+
+        :param file_id: The file ID of a ready export.
+        :param tag: The XML tag to iterate on, see :func:`WorkbenchParser.parse`.
+        :param stream: If True, feed the downloaded chunks directly into the parser. Otherwise, the report is downloaded
+            to a temporary file with :class:`tenable_io.downloader.Downloader` before being parsed.
+        :param processes: If specified, parse the temporary file with :func:`WorkbenchParser.parse_parallel`.
+        :param ordered: See :func:`WorkbenchParser.parse_parallel`.
+        :param transform: A module level function applied to every parsed dict.
+        :param report_filter: See :func:`WorkbenchParser.parse`.
+        :param fields: See :func:`WorkbenchParser.parse`.
+        :param plugins: See :func:`WorkbenchParser.parse`, it is not supported with processes.
+        :return: Iterator that yields the dicts parsed by :class:`WorkbenchParser`, or the transformed values.
+        """
+        if stream:
+            iter_content = self._client.workbenches_api.export_download(file_id)
+            for parsed in WorkbenchParser.parse(IterContentReader(iter_content), tag=tag,
+                                                report_filter=report_filter, fields=fields, plugins=plugins):
+                yield transform(parsed) if transform else parsed
+        else:
+            temp_dir = tempfile.mkdtemp()
             try:
-                gen = WorkbenchParser.parse(temp.name, tag=WorkbenchParser.REPORT_ITEM)
-                while True:
-                    report_item = next(gen)
-                    vulnerabilities.append(Vulnerability().from_report_item(report_item))
-                    if page_size and len(vulnerabilities) >= page_size:
-                        yield vulnerabilities
-                        vulnerabilities = []
-                pass
-            except StopIteration:
-                pass
-
-        if len(vulnerabilities) > 0:
-            yield vulnerabilities
+                path = self._client.workbenches_api.export_download_file(file_id, os.path.join(temp_dir, 'export'))
+
+                if processes:
+                    parsed_iter = WorkbenchParser.parse_parallel(path, tag, processes, ordered, transform,
+                                                                 report_filter=report_filter, fields=fields)
+                else:
+                    parsed_iter = (transform(parsed) if transform else parsed
+                                   for parsed in WorkbenchParser.parse(path, tag=tag, report_filter=report_filter,
+                                                                       fields=fields, plugins=plugins))
+                for parsed in parsed_iter:
+                    yield parsed
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     def export(
             self,
@@ -195,6 +315,7 @@ class WorkbenchHelper(object):
             report=WorkbenchesApi.REPORT_VULNERABILITIES,
             chapter=WorkbenchesApi.CHAPTER_VULN_BY_ASSET,
             file_open_mode='wb',
+            polling_policy=None,
             **kwargs
     ):
         """Download a workbench report.
@@ -202,7 +323,10 @@ class WorkbenchHelper(object):
         :param format: The file format. Default to WorkbenchesApi.FORMAT_NESSUS.
         :param report: The type of workbench report. Default to WorkbenchesApi.REPORT_VULNERABILITIES.
         :param chapter: Chapter to include. Default to WorkbenchesApi.CHAPTER_VULN_BY_ASSET.
-        :param file_open_mode: Chapter to include, WorkbenchesApi.CHAPTER_VULN_BY_ASSET.
+        :param file_open_mode: The open mode to the file output. Default to 'wb', which downloads the file with \
+        :class:`tenable_io.downloader.Downloader`.
+        :param polling_policy: An instance of :class:`tenable_io.util.PollingPolicy` to wait for the export with, \
+        default to None for the default policy.
         :param **kwargs: Additional keyword arguments are the same as
             :class:`tenable_io.api.workbenches.WorkbenchesApi.export_request`
         :return: The same WorkbenchHelper instance.
@@ -214,12 +338,16 @@ class WorkbenchHelper(object):
             **kwargs
         )
 
-        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
+        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY,
+                   polling_policy=polling_policy)
 
-        iter_content = self._client.workbenches_api.export_download(file_id)
-        with open(path, file_open_mode) as fd:
-            for chunk in iter_content:
-                fd.write(chunk)
+        if file_open_mode == 'wb':
+            self._client.workbenches_api.export_download_file(file_id, path)
+        else:
+            iter_content = self._client.workbenches_api.export_download(file_id)
+            with open(path, file_open_mode) as fd:
+                for chunk in iter_content:
+                    fd.write(chunk)
 
         return self
 
@@ -236,10 +364,18 @@ class AssetVulnerabilities(object):
         self.asset = asset
         self.vulnerabilities = vulnerabilities
 
-    def from_report(self, report):
+    def from_report(self, report, plugins=None):
+        """
+        :param report: A ReportHost dict parsed by :class:`tenable_io.parser.workbenches.WorkbenchParser`.
+        :param plugins: The :class:`tenable_io.parser.workbenches.PluginTable` the report was parsed with, default to \
+        None. With a table, vulnerabilities are instances of :class:`CompactVulnerability`.
+        """
         self.name = report['report_host'].get('name')
         self.asset = Asset().host_properties(report['host_properties'])
-        self.vulnerabilities = [Vulnerability().from_report_item(item) for item in report['report_items']]
+        if plugins is not None:
+            self.vulnerabilities = [CompactVulnerability(item, plugins) for item in report['report_items']]
+        else:
+            self.vulnerabilities = [Vulnerability().from_report_item(item) for item in report['report_items']]
         return self
 
 
@@ -403,6 +539,43 @@ class Vulnerability(object):
         return self
 
 
+class CompactVulnerability(Vulnerability):
+    """Vulnerability of a ReportItem parsed with a :class:`tenable_io.parser.workbenches.PluginTable`. It only stores
+    the fields specific to the finding, and looks up the plugin level fields in the table when they are accessed.
+    Attributes assigned to an instance take precedence over the parsed fields.
+    """
+
+    __slots__ = ('_plugins', '_values')
+
+    # Fields specific to a finding, in the order of the stored values.
+    _FIELDS = tuple(sorted(PluginTable.INSTANCE_FIELDS))
+    _INDEXES = dict((field, i) for (i, field) in enumerate(_FIELDS))
+
+    # ReportItem field of every attribute.
+    _code = six.get_function_code(Vulnerability.__init__)
+    _KEYS = dict((name, name) for name in _code.co_varnames[1:_code.co_argcount])
+    del _code
+    _KEYS.update(plugin_family='pluginFamily', plugin_name='pluginName', plugin_id='pluginID')
+
+    def __init__(self, report_item, plugins):
+        """
+        :param report_item: A dict of the fields specific to a finding, parsed with the table.
+        :param plugins: The :class:`tenable_io.parser.workbenches.PluginTable` the ReportItem was parsed with.
+        """
+        self._plugins = plugins
+        self._values = tuple(report_item.get(field) for field in CompactVulnerability._FIELDS)
+
+    def __getattr__(self, name):
+        key = CompactVulnerability._KEYS.get(name)
+        if key is None:
+            raise AttributeError(name)
+        index = CompactVulnerability._INDEXES.get(key)
+        if index is not None:
+            return self._values[index]
+        plugin = self._plugins.get(self._values[CompactVulnerability._INDEXES['pluginID']])
+        return plugin.get(key) if plugin else None
+
+
 class Asset(object):
 
     def __init__(
@@ -450,3 +623,11 @@ class Asset(object):
         self.operating_system = host_properties.get('operating-system')
         self.system_type = host_properties.get('system-type')
         return self
+
+
+def _asset_vulnerabilities_from_report(report):
+    return AssetVulnerabilities().from_report(report)
+
+
+def _vulnerability_from_report_item(report_item):
+    return Vulnerability().from_report_item(report_item)
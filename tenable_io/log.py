@@ -1,5 +1,6 @@
 import json
 import logging as logging_
+import random
 import six
 import sys
 
@@ -21,6 +22,8 @@ class LevelFilter(logging_.Filter):
 
 LOGGER_NAME = 'tenable_io'
 LOGGER_LEVEL = logging_.getLevelName(TenableIOConfig.get('logging_level'))
+LOGGING_SAMPLE_RATE = float(TenableIOConfig.get('logging_sample_rate'))
+BODY_MAX_LENGTH = 100000
 logging = logging_.Logger(LOGGER_NAME, LOGGER_LEVEL)
 
 
@@ -45,6 +48,43 @@ def configure_logging():
 configure_logging()
 
 
+def log_request(response, sample_rate=None):
+    """Log a request at INFO level, and at ERROR level if it failed. The message is only formatted if it is emitted.
+
+    :param response: The :class:`requests.Response` of the request.
+    :param sample_rate: The fraction of successful requests logged at INFO level, default to the `logging_sample_rate`
+        config. Failed requests are always logged.
+    """
+    if sample_rate is None:
+        sample_rate = LOGGING_SAMPLE_RATE
+    failed = not 200 <= response.status_code <= 299
+
+    log_info = logging.isEnabledFor(logging_.INFO) and (failed or sample_rate >= 1 or random.random() < sample_rate)
+    log_error = failed and logging.isEnabledFor(logging_.ERROR)
+
+    if log_info or log_error:
+        message = RequestLogMessage(response)
+        if log_info:
+            logging.info(message)
+        if log_error:
+            logging.error(message)
+
+
+@six.python_2_unicode_compatible
+class RequestLogMessage(object):
+    """Log message of a request, formatted by :func:`format_request` on first use.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self._message = None
+
+    def __str__(self):
+        if self._message is None:
+            self._message = format_request(self._response)
+        return self._message
+
+
 def format_request(response):
     try:
         data = list()
@@ -56,7 +96,7 @@ def format_request(response):
             u'reason': response.reason,
         }
 
-        if LOGGER_LEVEL == logging_.DEBUG:
+        if logging.isEnabledFor(logging_.DEBUG):
             meta[u'request_headers'] = {k: (u'*****REDACTED******' if k == u'X-ApiKeys' else v)
                                         for k, v in six.iteritems(response.request.headers)}
             meta[u'response_headers'] = dict(response.headers)
@@ -65,15 +105,16 @@ def format_request(response):
             if response.request.body:
                 data += [
                     u'REQUEST_BODY:',
-                    response.request.body[:100000] + u'...Response Body Truncated'
-                    if len(response.request.body) > 100000 else response.request.body,
+                    _format_body(response.request.body),
                 ]
 
-            if response.text:
+            # Never read the body of a streamed response, it would load it in memory.
+            if not getattr(response, '_content_consumed', True):
+                data.append(u'RESPONSE_BODY: Streamed, not logged.')
+            elif response.content:
                 data += [
                     u'RESPONSE_BODY:',
-                    response.text[:100000] + u'...Response Body Truncated'
-                    if len(response.text) > 100000 else response.text,
+                    _format_body(response.content),
                 ]
         else:
             meta[u'response_headers'] = {k: v for k, v in six.iteritems(response.headers)
@@ -84,3 +125,16 @@ def format_request(response):
     except Exception as e:
         logging.error(e)
         return u'Error formatting request.'
+
+
+def _format_body(body):
+    """
+    :param body: A request or response body.
+    :return: The body as text, truncated to BODY_MAX_LENGTH characters.
+    """
+    if not isinstance(body, (six.binary_type, six.text_type)):
+        return u'Body of type %s, not logged.' % type(body).__name__
+    text = body[:BODY_MAX_LENGTH + 1]
+    if isinstance(text, six.binary_type):
+        text = text.decode('utf-8', 'replace')
+    return text[:BODY_MAX_LENGTH] + u'...Body Truncated' if len(body) > BODY_MAX_LENGTH else text
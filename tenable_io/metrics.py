@@ -0,0 +1,185 @@
+import bisect
+import socket
+import threading
+
+
+class RequestMetrics(object):
+    """Measurements of one request issued by :class:`tenable_io.client.TenableIOClient`, passed to its observers.
+    """
+
+    def __init__(
+            self,
+            method=None,
+            uri_template=None,
+            uri=None,
+            status=None,
+            bytes=None,
+            retries=0,
+            connection_reused=None,
+            connect_time=None,
+            ttfb=None,
+            total_time=None,
+            rate_limit_wait=0,
+            error=None,
+    ):
+        """
+        :param method: The HTTP method.
+        :param uri_template: The URI before path params substitution (ex. `scans/%(scan_id)s`).
+        :param uri: The URI after path params substitution.
+        :param status: The HTTP status code, or None if no response was received.
+        :param bytes: The size of the response body, or its Content-Length when streamed.
+        :param retries: The number of retries done by the session.
+        :param connection_reused: True if the request was sent on a pooled connection.
+        :param connect_time: Seconds taken to resolve and connect (including the TLS handshake) a new connection, or \
+        None when a pooled connection was reused.
+        :param ttfb: Seconds from sending the request until the response headers were parsed.
+        :param total_time: Seconds from sending the request until the response was returned, including the body \
+        unless streamed.
+        :param rate_limit_wait: Seconds spent waiting for the rate limiter.
+        :param error: The exception raised by the session, or None.
+        """
+        self.method = method
+        self.uri_template = uri_template
+        self.uri = uri
+        self.status = status
+        self.bytes = bytes
+        self.retries = retries
+        self.connection_reused = connection_reused
+        self.connect_time = connect_time
+        self.ttfb = ttfb
+        self.total_time = total_time
+        self.rate_limit_wait = rate_limit_wait
+        self.error = error
+
+    @staticmethod
+    def from_response(response, **kwargs):
+        """
+        :param response: The :class:`requests.Response`.
+        :param kwargs: Additional keyword arguments are the same as :class:`RequestMetrics`.
+        :return: An instance of :class:`RequestMetrics`.
+        """
+        retries = getattr(response.raw, 'retries', None)
+        content_length = response.headers.get('Content-Length')
+        return RequestMetrics(
+            status=response.status_code,
+            bytes=len(response.content) if response._content_consumed else
+            (int(content_length) if content_length else None),
+            retries=len(retries.history) if retries is not None else 0,
+            connection_reused=getattr(response, 'connection_reused', None),
+            connect_time=getattr(response, 'connect_time', None),
+            ttfb=response.elapsed.total_seconds() if response.elapsed else None,
+            **kwargs
+        )
+
+
+class EndpointHistogram(object):
+    """Request observer aggregating the total time of requests into histograms per method and URI template.
+    """
+
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: The sorted upper bounds, in seconds, of the histogram buckets.
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def __call__(self, metrics):
+        key = (metrics.method, metrics.uri_template)
+        with self._lock:
+            if key not in self._endpoints:
+                self._endpoints[key] = {
+                    'count': 0,
+                    'errors': 0,
+                    'sum': 0.0,
+                    'bytes': 0,
+                    'retries': 0,
+                    'rate_limit_wait': 0.0,
+                    'buckets': [0] * len(self.buckets),
+                }
+            endpoint = self._endpoints[key]
+            endpoint['count'] += 1
+            if metrics.status is None or metrics.status >= 400:
+                endpoint['errors'] += 1
+            endpoint['sum'] += metrics.total_time or 0
+            endpoint['bytes'] += metrics.bytes or 0
+            endpoint['retries'] += metrics.retries
+            endpoint['rate_limit_wait'] += metrics.rate_limit_wait
+            index = bisect.bisect_left(self.buckets, metrics.total_time or 0)
+            if index < len(self.buckets):
+                endpoint['buckets'][index] += 1
+
+    def endpoints(self):
+        """
+        :return: A dict of (method, uri_template) to a dict of the `count`, `errors`, `sum` of total times, `bytes`, \
+        `retries`, `rate_limit_wait` and non-cumulative `buckets` counts.
+        """
+        with self._lock:
+            return dict((k, dict(v, buckets=list(v['buckets']))) for (k, v) in self._endpoints.items())
+
+    def prometheus_text(self, name='tenableio_request_duration_seconds'):
+        """
+        :param name: The metric name.
+        :return: The histograms in the Prometheus text exposition format.
+        """
+        lines = [
+            u'# HELP %s Duration of Tenable.io API requests.' % name,
+            u'# TYPE %s histogram' % name,
+        ]
+        for (method, uri_template), endpoint in sorted(self.endpoints().items()):
+            labels = u'method="%s",uri="%s"' % (method, EndpointHistogram._escape(uri_template))
+            cumulative = 0
+            for bound, count in zip(self.buckets, endpoint['buckets']):
+                cumulative += count
+                lines.append(u'%s_bucket{%s,le="%s"} %d' % (name, labels, bound, cumulative))
+            lines.append(u'%s_bucket{%s,le="+Inf"} %d' % (name, labels, endpoint['count']))
+            lines.append(u'%s_sum{%s} %s' % (name, labels, repr(endpoint['sum'])))
+            lines.append(u'%s_count{%s} %d' % (name, labels, endpoint['count']))
+        return u'\n'.join(lines) + u'\n'
+
+    @staticmethod
+    def _escape(value):
+        return (value or u'').replace(u'\\', u'\\\\').replace(u'"', u'\\"').replace(u'\n', u'\\n')
+
+
+class StatsdExporter(object):
+    """Request observer sending the metrics of every request to StatsD over UDP.
+    """
+
+    def __init__(self, host='localhost', port=8125, prefix='tenableio'):
+        self._address = (host, port)
+        self._prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def __call__(self, metrics):
+        self._socket.sendto(u'\n'.join(self.lines(metrics)).encode('utf-8'), self._address)
+
+    def lines(self, metrics):
+        """
+        :param metrics: An instance of :class:`RequestMetrics`.
+        :return: The StatsD lines of the request metrics.
+        """
+        key = u'%s.%s.%s' % (self._prefix, metrics.method.lower(), StatsdExporter._sanitize(metrics.uri_template))
+        lines = [
+            u'%s.requests:1|c' % key,
+            u'%s.status.%s:1|c' % (key, metrics.status if metrics.status is not None else u'error'),
+        ]
+        for name in ['total_time', 'ttfb', 'connect_time', 'rate_limit_wait']:
+            value = getattr(metrics, name)
+            if value is not None:
+                lines.append(u'%s.%s:%d|ms' % (key, name, value * 1000))
+        if metrics.bytes is not None:
+            lines.append(u'%s.bytes:%d|c' % (key, metrics.bytes))
+        if metrics.retries:
+            lines.append(u'%s.retries:%d|c' % (key, metrics.retries))
+        return lines
+
+    @staticmethod
+    def _sanitize(uri_template):
+        name = (uri_template or u'').strip(u'/').replace(u'%(', u'').replace(u')s', u'')
+        return u''.join(c if c.isalnum() or c in u'_.' else u'_' for c in name.replace(u'/', u'.')) or u'root'
+
+    def close(self):
+        self._socket.close()
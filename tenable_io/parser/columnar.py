@@ -0,0 +1,297 @@
+import json
+import struct
+import sys
+
+from array import array
+
+from tenable_io.exceptions import TenableIOException
+
+INT = 'int'
+FLOAT = 'float'
+DICTIONARY = 'dictionary'
+
+# Typecodes of the arrays of every column type, and missing values of numeric columns.
+TYPECODES = {INT: 'i', FLOAT: 'd', DICTIONARY: 'i'}
+MISSING_INT = -1
+MISSING_FLOAT = float('nan')
+
+
+class DictionaryColumn(object):
+    """Dictionary encoded string column: the values are the indices of distinct strings in the dictionary, or -1 for
+    missing values.
+    """
+
+    def __init__(self, indices=None, dictionary=None):
+        """
+        :param indices: An array of type `i` of the indices, default to an empty array.
+        :param dictionary: The list of distinct strings.
+        """
+        self.indices = indices if indices is not None else array(TYPECODES[DICTIONARY])
+        self.dictionary = list(dictionary) if dictionary else []
+        self._lookup = dict((v, i) for (i, v) in enumerate(self.dictionary))
+
+    def append(self, value):
+        if value is None:
+            self.indices.append(MISSING_INT)
+            return
+        index = self._lookup.get(value)
+        if index is None:
+            index = self._lookup[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        self.indices.append(index)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        index = self.indices[i]
+        return self.dictionary[index] if index >= 0 else None
+
+    def __iter__(self):
+        dictionary = self.dictionary
+        return (dictionary[index] if index >= 0 else None for index in self.indices)
+
+
+class ColumnBatch(object):
+    """Batch of vulnerabilities stored column by column: numeric columns are typed arrays, and string columns are
+    instances of :class:`DictionaryColumn`.
+    """
+
+    def __init__(self, schema, columns):
+        """
+        :param schema: The list of (name, type) of the columns.
+        :param columns: The dict of column name to array or :class:`DictionaryColumn`.
+        """
+        self.schema = list(schema)
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[self.schema[0][0]]) if self.schema else 0
+
+    def column(self, name):
+        return self.columns[name]
+
+    def to_pydict(self):
+        """
+        :return: A dict of column name to the list of its values, with missing values as None.
+        """
+        d = {}
+        for (name, column_type) in self.schema:
+            if column_type == INT:
+                d[name] = [v if v != MISSING_INT else None for v in self.columns[name]]
+            elif column_type == FLOAT:
+                d[name] = [v if v == v else None for v in self.columns[name]]
+            else:
+                d[name] = list(self.columns[name])
+        return d
+
+    def to_arrow(self):
+        """Convert the batch to a `pyarrow.RecordBatch`, with dictionary encoded string columns. Requires the optional
+        `pyarrow` package.
+
+        :return: An instance of `pyarrow.RecordBatch`.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise TenableIOException(u'pyarrow is not installed.')
+        arrays = []
+        for (name, column_type) in self.schema:
+            column = self.columns[name]
+            if column_type == INT:
+                arrays.append(pyarrow.array(column, pyarrow.int32(), mask=[v == MISSING_INT for v in column]))
+            elif column_type == FLOAT:
+                arrays.append(pyarrow.array(column, pyarrow.float64(), from_pandas=True))
+            else:
+                indices = pyarrow.array(column.indices, pyarrow.int32(), mask=[i < 0 for i in column.indices])
+                arrays.append(pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(column.dictionary,
+                                                                                         pyarrow.string())))
+        return pyarrow.RecordBatch.from_arrays(arrays, [name for (name, _) in self.schema])
+
+
+class VulnerabilityColumnBuilder(object):
+    """Build :class:`ColumnBatch` of vulnerabilities from the ReportHost dicts of :func:`WorkbenchParser.parse`.
+    """
+
+    # (name, type, source) of the columns, where source is a ReportItem attribute or child tag, or `host` for the host.
+    COLUMNS = [
+        ('host', DICTIONARY, 'host'),
+        ('plugin_id', INT, 'pluginID'),
+        ('plugin_name', DICTIONARY, 'pluginName'),
+        ('plugin_family', DICTIONARY, 'pluginFamily'),
+        ('severity', INT, 'severity'),
+        ('port', INT, 'port'),
+        ('protocol', DICTIONARY, 'protocol'),
+        ('svc_name', DICTIONARY, 'svc_name'),
+        ('cvss_base_score', FLOAT, 'cvss_base_score'),
+        ('cvss3_base_score', FLOAT, 'cvss3_base_score'),
+    ]
+
+    # ReportItem child tags to extract, see the fields param of :func:`WorkbenchParser.parse`.
+    FIELDS = ['cvss_base_score', 'cvss3_base_score']
+
+    def __init__(self, batch_size=65536):
+        """
+        :param batch_size: The maximum number of vulnerabilities per batch.
+        """
+        self.batch_size = batch_size
+        self.schema = [(name, column_type) for (name, column_type, _) in self.COLUMNS]
+        self._reset()
+
+    def _reset(self):
+        self._columns = dict(
+            (name, DictionaryColumn() if column_type == DICTIONARY else array(TYPECODES[column_type]))
+            for (name, column_type) in self.schema
+        )
+        self._count = 0
+
+    def append(self, report_host):
+        """Append the ReportItems of a host.
+
+        :param report_host: A dict parsed by :func:`WorkbenchParser.parse` with the tag WorkbenchParser.REPORT_HOST.
+        :return: The list of the batches completed by the host.
+        """
+        properties = report_host.get('host_properties') or {}
+        host = properties.get('host-ip') or report_host['report_host'].get('name')
+        batches = []
+        for item in report_host['report_items']:
+            for (name, column_type, source) in self.COLUMNS:
+                value = host if source == 'host' else item.get(source)
+                column = self._columns[name]
+                if column_type == INT:
+                    column.append(VulnerabilityColumnBuilder._int(value))
+                elif column_type == FLOAT:
+                    column.append(VulnerabilityColumnBuilder._float(value))
+                else:
+                    column.append(value)
+            self._count += 1
+            if self._count >= self.batch_size:
+                batches.append(self.flush())
+        return batches
+
+    def flush(self):
+        """
+        :return: The batch of the vulnerabilities appended since the last batch, or None if there is none.
+        """
+        if self._count == 0:
+            return None
+        batch = ColumnBatch(self.schema, self._columns)
+        self._reset()
+        return batch
+
+    def batches(self, report_hosts):
+        """
+        :param report_hosts: An iterable of dicts parsed by :func:`WorkbenchParser.parse` with the tag \
+        WorkbenchParser.REPORT_HOST.
+        :return: Iterator that yields instances of :class:`ColumnBatch`.
+        """
+        for report_host in report_hosts:
+            for batch in self.append(report_host):
+                yield batch
+        batch = self.flush()
+        if batch is not None:
+            yield batch
+
+    @staticmethod
+    def _int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return MISSING_INT
+
+    @staticmethod
+    def _float(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return MISSING_FLOAT
+
+
+class ColumnarWriter(object):
+    """Write instances of :class:`ColumnBatch` to a file, one column buffer after the other.
+
+    Every batch is written as a 4 bytes big-endian length, a JSON header describing the columns, then the raw bytes of
+    the arrays of every column in the header order. Read the file with :class:`ColumnarReader`. To write Parquet or
+    Arrow files, convert the batches with :func:`ColumnBatch.to_arrow` instead.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+
+    def write(self, batch):
+        header = {'byteorder': sys.byteorder, 'length': len(batch), 'columns': []}
+        buffers = []
+        for (name, column_type) in batch.schema:
+            column = batch.columns[name]
+            values = column.indices if column_type == DICTIONARY else column
+            header['columns'].append({
+                'name': name,
+                'type': column_type,
+                'dictionary': column.dictionary if column_type == DICTIONARY else None,
+            })
+            buffers.append(_tobytes(values))
+        encoded = json.dumps(header).encode('utf-8')
+        self._file.write(struct.pack('>I', len(encoded)))
+        self._file.write(encoded)
+        for buffer in buffers:
+            self._file.write(buffer)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ColumnarReader(object):
+    """Read the batches written by :class:`ColumnarWriter`.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+
+    def __iter__(self):
+        while True:
+            size = self._file.read(4)
+            if not size:
+                return
+            if len(size) < 4:
+                raise TenableIOException(u'Truncated columnar file.')
+            header = json.loads(self._file.read(struct.unpack('>I', size)[0]).decode('utf-8'))
+            schema = []
+            columns = {}
+            for column in header['columns']:
+                values = array(TYPECODES[column['type']])
+                data = self._file.read(values.itemsize * header['length'])
+                if len(data) < values.itemsize * header['length']:
+                    raise TenableIOException(u'Truncated columnar file.')
+                _frombytes(values, data)
+                if header['byteorder'] != sys.byteorder:
+                    values.byteswap()
+                schema.append((column['name'], column['type']))
+                columns[column['name']] = DictionaryColumn(values, column['dictionary']) \
+                    if column['type'] == DICTIONARY else values
+            yield ColumnBatch(schema, columns)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _tobytes(values):
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def _frombytes(values, data):
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
@@ -0,0 +1,196 @@
+import json
+import mmap
+import os
+import xml.etree.cElementTree as ET
+
+from io import BytesIO
+
+from tenable_io.exceptions import TenableIOException
+from tenable_io.parser.workbenches import WorkbenchParser
+
+
+class HostIndex(object):
+    """Index of the byte offsets of the ReportHost elements of a Nessus XML file, to parse hosts on demand.
+
+    The index maps the ReportHost name, `host-ip`, `host-fqdn` and `host-uuid` of every host to its byte range. It is
+    built in one pass over the memory mapped file, and saved to a sidecar JSON file (`<path>.idx.json` by default) which
+    is reused as long as the size and modification time of the file are unchanged. Hosts are parsed from the memory
+    mapped file, without reading the rest of the file.
+    """
+
+    VERSION = 2
+    KEYS = ['host-ip', 'host-fqdn', 'host-uuid']
+
+    def __init__(self, path, header, hosts, size=None, mtime=None):
+        """
+        :param path: The Nessus XML file path.
+        :param header: The header of the file, see :func:`WorkbenchParser.header`.
+        :param hosts: The list of (start, end, keys) of every ReportHost, where keys is the list of its name, \
+        `host-ip`, `host-fqdn` and `host-uuid`.
+        :param size: The size of the indexed file.
+        :param mtime: The modification time of the indexed file.
+        """
+        self.path = path
+        self.header = header
+        self.hosts = hosts
+        self.size = size
+        self.mtime = mtime
+        self._keys = {}
+        for i, (_, _, keys) in enumerate(hosts):
+            for key in keys:
+                if key:
+                    self._keys.setdefault(key, []).append(i)
+        self._file = None
+        self._data = None
+
+    @staticmethod
+    def index_path(path):
+        return path + '.idx.json'
+
+    @staticmethod
+    def open(path, index_path=None):
+        """Load the index of a file, or build and save it if it is missing or stale.
+
+        :param path: The Nessus XML file path.
+        :param index_path: The index file path, default to `<path>.idx.json`.
+        :return: An instance of :class:`HostIndex`.
+        """
+        index = HostIndex.load(path, index_path)
+        if index is None:
+            index = HostIndex.build(path)
+            index.save(index_path)
+        return index
+
+    @staticmethod
+    def build(path):
+        """Index a Nessus XML file.
+
+        :param path: The Nessus XML file path.
+        :return: An instance of :class:`HostIndex`.
+        """
+        stat = os.stat(path)
+        with WorkbenchParser.mapped(path) as data:
+            header = WorkbenchParser.header(data)
+            hosts = [(start, end, HostIndex._host_keys(data, start, end))
+                     for (start, end) in WorkbenchParser.iter_host_offsets(data)]
+        return HostIndex(path, header, hosts, stat.st_size, stat.st_mtime)
+
+    @staticmethod
+    def _host_keys(data, start, end):
+        """
+        :return: The list of the name, `host-ip`, `host-fqdn` and `host-uuid` of the ReportHost in data[start:end].
+        """
+        open_end = data.find(b'>', start, end) + 1
+        properties_end = data.find(b'</HostProperties>', open_end, end)
+        if properties_end >= 0:
+            properties_end += len(b'</HostProperties>')
+            content = data[start:properties_end] + b'</ReportHost>'
+        else:
+            content = data[start:open_end] + b'</ReportHost>'
+        try:
+            elem = ET.fromstring(content)
+        except ET.ParseError as e:
+            raise TenableIOException(u'Failed to parse Nessus XML: ' + str(e))
+        properties = elem.find(WorkbenchParser.HOST_PROPERTIES)
+        tags = {}
+        if properties is not None:
+            tags = dict((tag.get('name'), tag.text) for tag in properties.findall('tag'))
+        return [elem.get('name')] + [tags.get(key) for key in HostIndex.KEYS]
+
+    @staticmethod
+    def load(path, index_path=None):
+        """
+        :param path: The Nessus XML file path.
+        :param index_path: The index file path, default to `<path>.idx.json`.
+        :return: The saved index of the file, or None if it is missing or stale.
+        """
+        try:
+            with open(index_path or HostIndex.index_path(path)) as f:
+                saved = json.load(f)
+            stat = os.stat(path)
+        except (IOError, OSError, ValueError):
+            return None
+        if saved.get('version') != HostIndex.VERSION or saved.get('size') != stat.st_size \
+                or saved.get('mtime') != stat.st_mtime:
+            return None
+        return HostIndex(path, saved['header'].encode('utf-8'),
+                         [(start, end, keys) for (start, end, keys) in saved['hosts']],
+                         saved['size'], saved['mtime'])
+
+    def save(self, index_path=None):
+        """Save the index to a sidecar JSON file.
+
+        :param index_path: The index file path, default to `<path>.idx.json`.
+        """
+        index_path = index_path or HostIndex.index_path(self.path)
+        with open(index_path + '.tmp', 'w') as f:
+            json.dump({
+                'version': HostIndex.VERSION,
+                'size': self.size,
+                'mtime': self.mtime,
+                'header': self.header.decode('utf-8'),
+                'hosts': [[start, end, keys] for (start, end, keys) in self.hosts],
+            }, f)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        os.rename(index_path + '.tmp', index_path)
+
+    def __len__(self):
+        return len(self.hosts)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def lookup(self, key):
+        """
+        :param key: A ReportHost name, `host-ip`, `host-fqdn` or `host-uuid`.
+        :return: The list of (start, end) byte offsets of the matching hosts.
+        """
+        return [self.hosts[i][:2] for i in self._keys.get(key, [])]
+
+    def parse(self, keys, tag=WorkbenchParser.REPORT_HOST, report_filter=None, fields=None, plugins=None):
+        """Parse the hosts matching any of the keys, in document order.
+
+        :param keys: A key or a list of ReportHost names, `host-ip`, `host-fqdn` or `host-uuid`.
+        :param tag: See :func:`WorkbenchParser.parse`.
+        :param report_filter: See :func:`WorkbenchParser.parse`.
+        :param fields: See :func:`WorkbenchParser.parse`.
+        :param plugins: See :func:`WorkbenchParser.parse`.
+        :return: Iterator that yields the dicts parsed by :func:`WorkbenchParser.parse`.
+        """
+        if not isinstance(keys, (list, tuple, set, frozenset)):
+            keys = [keys]
+        indexes = sorted(set(i for key in keys for i in self._keys.get(key, [])))
+        if not indexes:
+            return
+        data = self._mmap()
+        for i in indexes:
+            start, end, _ = self.hosts[i]
+            document = BytesIO(self.header + data[start:end] + b'</Report></NessusClientData_v2>')
+            for parsed in WorkbenchParser.parse(document, tag=tag, report_filter=report_filter, fields=fields,
+                                                plugins=plugins):
+                yield parsed
+
+    def _mmap(self):
+        if self._data is None:
+            stat = os.stat(self.path)
+            if stat.st_size != self.size or stat.st_mtime != self.mtime:
+                raise TenableIOException(u'Indexed file changed.')
+            self._file = open(self.path, 'rb')
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data
+
+    def close(self):
+        """Unmap the indexed file.
+        """
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+            self._data = None
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,26 +1,168 @@
+import mmap
+import multiprocessing
+import six
 import xml.etree.cElementTree as ET
 
+from contextlib import contextmanager
+from io import BytesIO
+
 from tenable_io.exceptions import TenableIOException
 
 
+class ReportFilter(object):
+    """Criteria on the hosts and ReportItems of a Nessus XML export, evaluated on XML attributes while parsing.
+
+    Every criterion is a collection of accepted values, or None to accept any value. A ReportItem is accepted if it
+    matches all criteria. With ReportItem criteria, hosts without accepted ReportItems are skipped.
+    """
+
+    def __init__(self, severities=None, plugin_ids=None, plugin_families=None, ports=None, protocols=None, hosts=None):
+        """
+        :param severities: Accepted severities, from 0 (info) to 4 (critical).
+        :param plugin_ids: Accepted plugin IDs.
+        :param plugin_families: Accepted plugin families.
+        :param ports: Accepted ports.
+        :param protocols: Accepted protocols (ex. `tcp`).
+        :param hosts: Accepted hosts, matched against the ReportHost name, the `host-ip` or the `host-fqdn`.
+        """
+        self.severities = ReportFilter._values(severities)
+        self.plugin_ids = ReportFilter._values(plugin_ids)
+        self.plugin_families = ReportFilter._values(plugin_families)
+        self.ports = ReportFilter._values(ports)
+        self.protocols = ReportFilter._values(protocols, lower=True)
+        self.hosts = ReportFilter._values(hosts)
+        self._item_criteria = [(name, values) for (name, values) in [
+            ('severity', self.severities),
+            ('pluginID', self.plugin_ids),
+            ('pluginFamily', self.plugin_families),
+            ('port', self.ports),
+            ('protocol', self.protocols),
+        ] if values is not None]
+
+    @staticmethod
+    def _values(values, lower=False):
+        if values is None:
+            return None
+        return frozenset(str(v).lower() if lower else str(v) for v in values)
+
+    @property
+    def filters_items(self):
+        return len(self._item_criteria) > 0
+
+    def accept_host(self, report_host, host_properties):
+        """
+        :param report_host: The parsed ReportHost attributes.
+        :param host_properties: The parsed HostProperties, or None.
+        :return: True if the host is accepted.
+        """
+        if self.hosts is None:
+            return True
+        candidates = [(report_host or {}).get('name')]
+        if host_properties:
+            candidates += [host_properties.get('host-ip'), host_properties.get('host-fqdn')]
+        return any(c in self.hosts for c in candidates if c is not None)
+
+    def accept_item(self, attrib):
+        """
+        :param attrib: The attributes of a ReportItem element.
+        :return: True if the ReportItem is accepted.
+        """
+        for name, values in self._item_criteria:
+            value = attrib.get(name)
+            if name == 'protocol' and value is not None:
+                value = value.lower()
+            if value not in values:
+                return False
+        return True
+
+
+class PluginTable(object):
+    """Table of the plugin level fields of ReportItems (ex. `description`, `solution`), stored once per plugin ID.
+
+    When parsing with a table, ReportItems only keep the fields specific to a finding, see
+    :data:`PluginTable.INSTANCE_FIELDS`, and their short attribute values are interned.
+    """
+
+    # ReportItem attributes and child tags specific to a finding. All other fields are plugin level.
+    INSTANCE_FIELDS = frozenset([
+        'pluginID', 'port', 'protocol', 'svc_name', 'severity',
+        'plugin_output', 'first_found', 'last_found', 'last_fixed', 'vulnerability_state',
+    ])
+
+    # Short values shared by many findings, which are interned.
+    INTERNED_FIELDS = frozenset(['pluginID', 'port', 'protocol', 'svc_name', 'severity', 'vulnerability_state'])
+
+    def __init__(self):
+        self._plugins = {}
+
+    def __len__(self):
+        return len(self._plugins)
+
+    def __contains__(self, plugin_id):
+        return plugin_id in self._plugins
+
+    def get(self, plugin_id):
+        """
+        :param plugin_id: The plugin ID.
+        :return: The dict of the plugin level fields of the plugin, or None.
+        """
+        return self._plugins.get(plugin_id)
+
+    def add(self, report_item):
+        """Store the plugin level fields of a ReportItem, unless its plugin is already stored.
+
+        :param report_item: A dict of the fields of a ReportItem.
+        :return: The dict of the fields specific to the finding, with interned short values.
+        """
+        plugin_id = report_item.get('pluginID')
+        if plugin_id not in self._plugins:
+            self._plugins[plugin_id] = dict((k, v) for (k, v) in report_item.items()
+                                            if k not in PluginTable.INSTANCE_FIELDS)
+        # Only native strings can be interned, on Python 2 non-ASCII values are unicode and are kept as is.
+        return dict((k, six.moves.intern(v) if k in PluginTable.INTERNED_FIELDS and type(v) is str else v)
+                    for (k, v) in report_item.items() if k in PluginTable.INSTANCE_FIELDS)
+
+    def merge(self, report_item):
+        """
+        :param report_item: A dict of the fields specific to a finding.
+        :return: A dict of all the fields of the ReportItem. Plugin level values are shared, not copied.
+        """
+        plugin = self._plugins.get(report_item.get('pluginID'))
+        if not plugin:
+            return report_item
+        merged = dict(plugin)
+        merged.update(report_item)
+        return merged
+
+
 class WorkbenchParser(object):
 
     HOST_PROPERTIES = 'HostProperties'
     REPORT_HOST = 'ReportHost'
     REPORT_ITEM = 'ReportItem'
 
+    SHARDS_PER_PROCESS = 4
+
     @staticmethod
-    def parse(path, tag=REPORT_HOST):
+    def parse(path, tag=REPORT_HOST, report_filter=None, fields=None, plugins=None):
         """Parse Nessus XML export from Workbench API into dicts.
 
-        :param path: The file path.
+        :param path: The file path, or a file-like object opened in binary mode.
         :param tag: The XML tag to iterate on. It should be WorkbenchParser.REPORT_HOST or WorkbenchParser.REPORT_ITEM.
+        :param report_filter: An instance of :class:`ReportFilter`. Rejected hosts and ReportItems are skipped \
+        before their children are extracted, default to None.
+        :param fields: The ReportItem child tags to extract, default to None for all. Attributes are always extracted.
+        :param plugins: If specified, an instance of :class:`PluginTable` the plugin level fields are stored into. \
+        The parsed ReportItems then only have the fields specific to the finding, and the plugin level child tags are \
+        only extracted the first time a plugin is found. Default to None.
         """
         assert tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM], u'Valid tag for parsing.'
 
         report_host = None
         host_properties = None
+        host_accepted = True
         report_items = [] if tag == WorkbenchParser.REPORT_HOST else None
+        fields = frozenset(fields) if fields is not None else None
 
         try:
             for event, elem in ET.iterparse(path, events=('start', 'end')):
@@ -28,32 +170,203 @@ class WorkbenchParser(object):
                 if event == 'start':
                     if elem.tag == 'ReportHost':
                         report_host = WorkbenchParser._from_report_host(elem)
+                        host_properties = None
+                        host_accepted = report_filter is None or report_filter.accept_host(report_host, None)
 
                 if event == 'end':
 
                     if elem.tag == WorkbenchParser.REPORT_HOST:
                         elem.clear()
-                        if tag == elem.tag:
+                        if tag == elem.tag and host_accepted and \
+                                (report_items or report_filter is None or not report_filter.filters_items):
                             yield {
                                 'report_host': report_host,
                                 'host_properties': host_properties,
                                 'report_items': report_items,
                             }
-                            report_items = []
+                        report_items = [] if tag == WorkbenchParser.REPORT_HOST else None
 
                     if elem.tag == WorkbenchParser.HOST_PROPERTIES:
                         host_properties = WorkbenchParser._from_host_properties(elem)
                         elem.clear()
+                        if report_filter is not None:
+                            host_accepted = report_filter.accept_host(report_host, host_properties)
 
                     if elem.tag == WorkbenchParser.REPORT_ITEM:
-                        report_item = WorkbenchParser._from_report_item(elem)
+                        if not host_accepted or (report_filter is not None and
+                                                 not report_filter.accept_item(elem.attrib)):
+                            elem.clear()
+                            continue
+                        if plugins is None:
+                            report_item = WorkbenchParser._from_report_item(elem, fields)
+                        elif elem.get('pluginID') in plugins:
+                            # Only extract the fields specific to the finding.
+                            report_item = plugins.add(WorkbenchParser._from_report_item(
+                                elem, fields & PluginTable.INSTANCE_FIELDS if fields is not None
+                                else PluginTable.INSTANCE_FIELDS))
+                        else:
+                            report_item = plugins.add(WorkbenchParser._from_report_item(elem, fields))
                         elem.clear()
                         if tag == elem.tag:
                             yield report_item
                         elif tag == WorkbenchParser.REPORT_HOST:
                             report_items.append(report_item)
         except ET.ParseError as e:
-            raise TenableIOException(u'Failed to parse Nessus XML: ' + e.message)
+            raise TenableIOException(u'Failed to parse Nessus XML: ' + str(e))
+
+    @staticmethod
+    def parse_parallel(path, tag=REPORT_HOST, processes=None, ordered=True, transform=None, report_filter=None,
+                       fields=None):
+        """Parse Nessus XML export from Workbench API into dicts, using a pool of processes. The file is pre-scanned for
+        the byte offsets of its ReportHost elements, and consecutive hosts are grouped into shards of similar size that
+        are parsed independently.
+
+        :param path: The file path.
+        :param tag: The XML tag to iterate on. It should be WorkbenchParser.REPORT_HOST or WorkbenchParser.REPORT_ITEM.
+        :param processes: The number of worker processes, default to the number of CPUs. The file is parsed in the \
+        calling process when it is 1 or less.
+        :param ordered: If True, results are yielded in document order. Otherwise, shards are yielded as soon as they \
+        are parsed, default to True.
+        :param transform: A picklable function (ex. a module level function) applied to every parsed dict in the \
+        worker processes, default to None.
+        :param report_filter: See :func:`WorkbenchParser.parse`, it is applied in the worker processes.
+        :param fields: See :func:`WorkbenchParser.parse`.
+        :return: Iterator that yields the parsed dicts, or the transformed values.
+        """
+        assert tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM], u'Valid tag for parsing.'
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+
+        header, offsets = WorkbenchParser.host_offsets(path)
+        shards = [(path, header, start, end, tag, transform, report_filter, fields)
+                  for (start, end) in WorkbenchParser._shards(offsets, processes * WorkbenchParser.SHARDS_PER_PROCESS)]
+
+        if processes <= 1 or len(shards) <= 1:
+            for shard in shards:
+                for parsed in _parse_shard(shard):
+                    yield parsed
+            return
+
+        pool = multiprocessing.Pool(min(processes, len(shards)))
+        try:
+            for results in (pool.imap if ordered else pool.imap_unordered)(_parse_shard, shards):
+                for parsed in results:
+                    yield parsed
+        finally:
+            pool.terminate()
+            pool.join()
+
+    @staticmethod
+    def host_offsets(path):
+        """Scan a Nessus XML file for the byte offsets of its ReportHost elements.
+
+        :param path: The file path.
+        :return: A tuple of the header of the file (see :func:`WorkbenchParser.header`), and the list of (start, end) \
+        byte offsets of every ReportHost element, in document order.
+        """
+        with WorkbenchParser.mapped(path) as data:
+            return WorkbenchParser.header(data), list(WorkbenchParser.iter_host_offsets(data))
+
+    @staticmethod
+    @contextmanager
+    def mapped(path):
+        """Memory map a file for reading.
+
+        :param path: The file path.
+        :return: A context manager of the memory mapped content, or of empty bytes if the file is empty.
+        """
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file.
+                yield b''
+                return
+            try:
+                yield data
+            finally:
+                data.close()
+
+    @staticmethod
+    def xml_declaration(data):
+        """
+        :param data: The content of a Nessus XML file, as bytes or a memory map.
+        :return: The XML declaration of the content, or empty bytes.
+        """
+        return data[:data.find(b'?>') + 2] if data[:5] == b'<?xml' else b''
+
+    @staticmethod
+    def header(data):
+        """
+        :param data: The content of a Nessus XML file, as bytes or a memory map.
+        :return: The XML declaration and the start tags of the NessusClientData_v2 and Report elements of the content, \
+        with their namespace declarations, to wrap ReportHost elements parsed independently of the document.
+        """
+        header = WorkbenchParser.xml_declaration(data)
+        first_host = WorkbenchParser._find_start(data, 0)
+        if first_host < 0:
+            first_host = len(data)
+        pos = 0
+        for tag in [b'<NessusClientData_v2', b'<Report']:
+            start = WorkbenchParser._find_start(data, pos, tag, first_host)
+            if start < 0:
+                header += tag + b'>'
+                continue
+            pos = data.find(b'>', start) + 1
+            header += data[start:pos]
+        return header
+
+    @staticmethod
+    def iter_host_offsets(data):
+        """Scan the content of a Nessus XML file for the byte offsets of its ReportHost elements.
+
+        :param data: The content of a Nessus XML file, as bytes or a memory map.
+        :return: Iterator that yields the (start, end) byte offsets of every ReportHost element, in document order.
+        """
+        start = WorkbenchParser._find_start(data, 0)
+        while start >= 0:
+            end = data.find(b'</ReportHost>', start)
+            if end < 0:
+                raise TenableIOException(u'Failed to parse Nessus XML: unclosed ReportHost.')
+            end += len(b'</ReportHost>')
+            yield start, end
+            start = WorkbenchParser._find_start(data, end)
+
+    @staticmethod
+    def _find_start(data, pos, tag=b'<ReportHost', end=None):
+        """
+        :return: The offset of the next start tag from pos and before end, or -1.
+        """
+        if end is None:
+            end = len(data)
+        while True:
+            start = data.find(tag, pos, end)
+            if start < 0 or data[start + len(tag):start + len(tag) + 1] in (b' ', b'>', b'\t', b'\n', b'\r'):
+                return start
+            pos = start + len(tag)
+
+    @staticmethod
+    def _shards(offsets, count):
+        """Group consecutive hosts into at most about `count` shards of similar byte size.
+
+        :param offsets: The list of (start, end) offsets of every host.
+        :param count: The targeted number of shards.
+        :return: The list of (start, end) offsets of every shard.
+        """
+        if not offsets:
+            return []
+        target = max(1, (offsets[-1][1] - offsets[0][0]) // max(1, count))
+        shards = []
+        shard_start = None
+        for (start, end) in offsets:
+            if shard_start is None:
+                shard_start = start
+            if end - shard_start >= target:
+                shards.append((shard_start, end))
+                shard_start = None
+        if shard_start is not None:
+            shards.append((shard_start, offsets[-1][1]))
+        return shards
 
     @staticmethod
     def _from_report_host(elem):
@@ -71,11 +384,13 @@ class WorkbenchParser(object):
         return host_properties
 
     @staticmethod
-    def _from_report_item(elem):
+    def _from_report_item(elem, fields=None):
         d = dict()
         for a in elem.attrib:
             d[a] = elem.attrib[a]
         for child in list(elem):
+            if fields is not None and child.tag not in fields:
+                continue
             if child.tag in ['bid', 'cve', 'xref', 'see_also']:
                 if child.tag not in d:
                     d[child.tag] = []
@@ -83,3 +398,18 @@ class WorkbenchParser(object):
             else:
                 d[child.tag] = child.text
         return d
+
+
+def _parse_shard(shard):
+    """Parse a shard of consecutive ReportHost elements. Module level so that it can be run by a process pool.
+
+    :param shard: A tuple of (path, header, start, end, tag, transform, report_filter, fields).
+    :return: The list of parsed dicts, or transformed values.
+    """
+    path, header, start, end, tag, transform, report_filter, fields = shard
+    with open(path, 'rb') as f:
+        f.seek(start)
+        content = f.read(end - start)
+    document = BytesIO(header + content + b'</Report></NessusClientData_v2>')
+    return [transform(parsed) if transform else parsed for parsed in
+            WorkbenchParser.parse(document, tag=tag, report_filter=report_filter, fields=fields)]
@@ -0,0 +1,136 @@
+import threading
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+from requests.packages.urllib3 import Retry
+
+from tenable_io.config import TenableIOConfig
+
+RATE_LIMIT = float(TenableIOConfig.get('rate_limit'))
+
+
+class RateLimiter(object):
+    """Thread safe token bucket limiting the rate of requests, adapting its rate to the 429 responses.
+
+    The rate is decreased multiplicatively on a 429, and requests are held until the `Retry-After` delay has elapsed.
+    The 429s received within the `Retry-After` delay, or the time the bucket takes to refill at the rate which was
+    throttled, answer requests issued before the decrease (ex. by concurrent threads), and do not decrease the rate
+    again. The rate is then increased additively on every successful response, but slows down when it gets close to the
+    rate that caused the last 429, so that the throughput settles just under the platform limit. A limiter can be
+    shared by any number of clients and threads.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate, burst=None, min_rate=None, max_rate=None, decrease=0.5, increase=0.1):
+        """
+        :param rate: The initial number of requests per second.
+        :param burst: The maximum number of requests issued at once after an idle period, default to rate.
+        :param min_rate: The rate is never decreased below min_rate, default to 1/10 of rate.
+        :param max_rate: The rate is never increased above max_rate, default to rate.
+        :param decrease: Factor applied to the rate on 429 responses.
+        :param increase: Number of requests per second gained per second of successful responses.
+        """
+        assert rate > 0, u'Rate should be positive.'
+        assert 0 < decrease < 1, u'Decrease factor should be between 0 and 1.'
+        self.min_rate = min_rate if min_rate is not None else rate / 10.0
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.decrease = decrease
+        self.increase = increase
+
+        self._lock = threading.Lock()
+        self._rate = float(rate)
+        self._ceiling = None
+        self._tokens = self.burst
+        self._last = self._clock()
+        self._blocked_until = 0
+        self._decreased_until = 0
+
+    _clock = staticmethod(time.time)
+    _sleep = staticmethod(time.sleep)
+
+    @classmethod
+    def shared(cls):
+        """
+        :return: The process wide limiter of the `rate_limit` config, or None if rate limiting is not configured.
+        """
+        if RATE_LIMIT <= 0:
+            return None
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = RateLimiter(RATE_LIMIT)
+            return cls._shared
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def acquire(self):
+        """Block until a request can be issued.
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self._rate)
+            self._sleep(wait)
+
+    def success(self):
+        """Record a successful response, increasing the rate.
+        """
+        with self._lock:
+            step = self.increase / self._rate
+            if self._ceiling is not None and self._rate >= self._ceiling * 0.9:
+                # Probe slowly around the rate which was throttled.
+                step /= 10
+            self._rate = min(self.max_rate, self._rate + step)
+
+    def throttled(self, retry_after=None):
+        """Record a 429 response, decreasing the rate and holding requests for retry_after seconds.
+
+        :param retry_after: The `Retry-After` header value, in seconds or as an HTTP date, default to None.
+        """
+        delay = RateLimiter._parse_retry_after(retry_after)
+        with self._lock:
+            now = self._clock()
+            if now >= self._decreased_until:
+                self._ceiling = self._rate
+                self._rate = max(self.min_rate, self._rate * self.decrease)
+                self._decreased_until = now + max(delay or 0, self.burst / self._ceiling)
+            self._tokens = 0
+            if delay:
+                self._blocked_until = max(self._blocked_until, now + delay)
+
+    @staticmethod
+    def _parse_retry_after(value):
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            date = parsedate_tz(value)
+            return max(0.0, mktime_tz(date) - time.time()) if date else None
+
+
+class RateLimitedRetry(Retry):
+    """urllib3 Retry reporting the 429 responses it retries to a :class:`RateLimiter`.
+    """
+
+    rate_limiter = None
+
+    def new(self, **kw):
+        retry = super(RateLimitedRetry, self).new(**kw)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if self.rate_limiter is not None and response is not None and response.status == 429:
+            self.rate_limiter.throttled(response.headers.get('Retry-After'))
+        return super(RateLimitedRetry, self).increment(method, url, response, *args, **kwargs)
@@ -1,11 +1,18 @@
+import random
 import re
 import six
 import socket
+import threading
 import time
 
+from multiprocessing.pool import ThreadPool
+
 from tenable_io.config import TenableIOConfig
+from tenable_io.exceptions import TenableIOException
 
+CONCURRENCY = int(TenableIOConfig.get('concurrency'))
 POLLING_INTERVAL = int(TenableIOConfig.get('polling_interval'))
+DOWNLOAD_CHUNK_SIZE = int(TenableIOConfig.get('download_chunk_size'))
 RE_MAC = re.compile('[0-9a-f]{2}([-:])[0-9a-f]{2}(\\1[0-9a-f]{2}){4}$')
 
 
@@ -46,16 +53,204 @@ def payload_filter(payload, filter_):
     return payload
 
 
-def wait_until(condition, context=None):
+class PollingPolicy(object):
+    """Defines how often and for how long a condition is polled by :func:`wait_until`.
+
+    The first poll is made immediately. The interval between subsequent polls starts at `initial` seconds and is
+    multiplied by `multiplier` after every poll, without exceeding `max` seconds. The default policy polls every
+    POLLING_INTERVAL seconds with no limit.
+
+    :param initial: Seconds to wait after the first poll, default to POLLING_INTERVAL.
+    :param max: Maximum seconds to wait in between polls, default to None for no maximum.
+    :param multiplier: Factor the interval is multiplied by after each poll, default to 1 for a constant interval.
+    :param jitter: Fraction of the interval to randomly add or subtract, default to 0. (ex. 0.1 for +/- 10%)
+    :param deadline: Maximum seconds to wait in total, default to None for no deadline.
+    :param max_attempts: Maximum number of polls, default to None for no maximum.
+    """
+
+    def __init__(
+            self,
+            initial=None,
+            max=None,
+            multiplier=1,
+            jitter=0,
+            deadline=None,
+            max_attempts=None,
+    ):
+        assert multiplier >= 1, u'Multiplier should not decrease the interval.'
+        assert 0 <= jitter < 1, u'Jitter should be a fraction of the interval.'
+        self.initial = initial if initial is not None else POLLING_INTERVAL
+        self.max = max
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+
+    def intervals(self):
+        """Generate the intervals to wait in between polls.
+
+        :return: An infinite iterator of intervals in seconds.
+        """
+        interval = self.initial
+        while True:
+            if self.max is not None:
+                interval = min(interval, self.max)
+            jittered = interval * (1 + random.uniform(-self.jitter, self.jitter)) if self.jitter else interval
+            # Jitter is applied before the clamp, so that intervals never exceed max.
+            yield min(jittered, self.max) if self.max is not None else jittered
+            interval *= self.multiplier
+
+
+def wait_until(condition, context=None, polling_policy=None):
     """Utility function to wait for a condition to become True.
 
         :param condition: The condition function that should evaluate to True if and only if the condition is met.
         :param context: If it is not None, it is passed to every call to the condition function.
+        :param polling_policy: An instance of :class:`PollingPolicy`, default to the default PollingPolicy.
+        :raise TenableIOException: When the policy deadline or maximum attempts are reached before the condition is \
+        met.
         :return: True when the condition function evaluates to True.
     """
-    while True:
+    if polling_policy is None:
+        polling_policy = PollingPolicy()
+
+    start_time = time.time()
+    attempts = 0
+    for interval in polling_policy.intervals():
+        attempts += 1
         if context is not None and condition(context):
             return True
         elif context is None and condition():
             return True
-        time.sleep(POLLING_INTERVAL)
+
+        if polling_policy.max_attempts is not None and attempts >= polling_policy.max_attempts:
+            raise TenableIOException(u'Condition not met after %d attempts.' % attempts)
+        if polling_policy.deadline is not None:
+            remaining = polling_policy.deadline - (time.time() - start_time)
+            if remaining <= 0:
+                raise TenableIOException(u'Condition not met within %s seconds.' % polling_policy.deadline)
+            # Poll one last time at the deadline.
+            interval = min(interval, remaining)
+
+        time.sleep(interval)
+
+
+def parallel_map(f, iterable, concurrency=None):
+    """Utility function to apply a function to every item of an iterable using a bounded pool of threads.
+
+        :param f: The function to apply.
+        :param iterable: The items to apply the function to.
+        :param concurrency: The maximum number of concurrent calls, default to CONCURRENCY. Items are processed \
+        sequentially in the calling thread when it is 1 or less.
+        :return: The list of results, in the same order as the items. The first exception raised by a call is \
+        re-raised.
+    """
+    items = list(iterable)
+    if concurrency is None:
+        concurrency = CONCURRENCY
+
+    if concurrency <= 1 or len(items) <= 1:
+        return [f(item) for item in items]
+
+    pool = ThreadPool(min(concurrency, len(items)))
+    try:
+        return pool.map(f, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def memoize(f):
+    """Utility function to cache the results of a function by its positional arguments. The returned function is thread
+    safe, and calls the original function at most once per distinct arguments.
+
+        :param f: The function to memoize.
+        :return: The memoized function.
+    """
+    results = {}
+    locks = {}
+    lock = threading.Lock()
+
+    def wrapper(*args):
+        with lock:
+            key_lock = locks.setdefault(args, threading.Lock())
+        with key_lock:
+            if args not in results:
+                results[args] = f(*args)
+        return results[args]
+    return wrapper
+
+
+def copy_stream(source, destination, buffer_size=None, callback=None):
+    """Utility function to copy a binary stream, for instance `Response.raw`, into a file. Data is read with `readinto`
+    when available into a single preallocated buffer, so that sources reading into it directly, such as files, allocate
+    no bytes object per chunk.
+
+        :param source: The file-like object to read from.
+        :param destination: The file-like object to write to.
+        :param buffer_size: The number of bytes read at once, default to DOWNLOAD_CHUNK_SIZE.
+        :param callback: A function called with the number of bytes of every chunk once written, default to None.
+        :return: The number of bytes copied.
+    """
+    buffer = bytearray(buffer_size if buffer_size else DOWNLOAD_CHUNK_SIZE)
+    view = memoryview(buffer)
+    readinto = getattr(source, 'readinto', None)
+    total = 0
+    while True:
+        if readinto is not None:
+            count = readinto(buffer)
+        else:
+            data = source.read(len(buffer))
+            count = len(data)
+            buffer[:count] = data
+        if not count:
+            return total
+        # Python 2 files do not accept memoryview.
+        destination.write(buffer[:count] if six.PY2 else view[:count])
+        total += count
+        if callback is not None:
+            callback(count)
+
+
+class IterContentReader(object):
+    """File-like object that reads from an iterator of byte chunks, for instance the iterator returned by
+    `Response.iter_content`. It allows a consumer such as `ElementTree.iterparse` to process content while it is still
+    being downloaded.
+    """
+
+    def __init__(self, iter_content):
+        self._iter_content = iter(iter_content)
+        # The current chunk, and the offset of its first unread byte. Reads slice the chunk instead of re-buffering
+        # what is left of it, so that the cost of a read does not depend on the chunk size.
+        self._chunk = b''
+        self._offset = 0
+
+    def read(self, size=-1):
+        """Read up to `size` bytes, or everything left if `size` is negative or omitted.
+
+        :param size: The maximum number of bytes to read.
+        :return: A bytes string, empty when the iterator is exhausted.
+        """
+        if size is None or size < 0:
+            parts = [self._chunk[self._offset:]]
+            parts.extend(self._iter_content)
+            self._chunk, self._offset = b'', 0
+            return b''.join(parts)
+
+        parts = []
+        while size > 0:
+            available = len(self._chunk) - self._offset
+            if available <= 0:
+                try:
+                    self._chunk, self._offset = next(self._iter_content), 0
+                except StopIteration:
+                    break
+                continue
+            if self._offset == 0 and available <= size:
+                part = self._chunk
+            else:
+                part = self._chunk[self._offset:self._offset + size]
+            self._offset += len(part)
+            size -= len(part)
+            parts.append(part)
+        return parts[0] if len(parts) == 1 else b''.join(parts)
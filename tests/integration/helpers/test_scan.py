@@ -3,6 +3,7 @@ import pytest
 from time import time
 
 from tenable_io.api.scans import ScanExportRequest
+from tenable_io.helpers.scan import ScanWaiter
 
 from tests.base import BaseTest
 from tests.config import TenableIOTestConfig
@@ -81,3 +82,16 @@ class TestScanHelper(BaseTest):
         activity = next((a for a in activities if a.history_id == history_id), None)
         assert activity, u'Completed scan history should be in activities.'
         assert activity.timestamp is not None, u'Completed scan activity has a timestamp.'
+
+    def test_scan_waiter(self, client, scan):
+        scan.launch()
+
+        resolved = []
+        waiter = ScanWaiter(client).add(scan, callback=lambda s, status: resolved.append((s.id, status)))
+
+        scan.stop(wait=False)
+        statuses = waiter.wait()
+
+        assert scan.stopped(), u'Scan is stopped.'
+        assert ScanWaiter.stopped(statuses[scan.id]), u'Final status is a stopped status.'
+        assert resolved == [(scan.id, statuses[scan.id])], u'Callback is called once with the final status.'
@@ -0,0 +1,39 @@
+import pytest
+
+from tenable_io.exceptions import TenableIOApiException, TenableIOErrorCode
+from tests.base import BaseTest
+
+asyncio = pytest.importorskip('asyncio')
+
+
+class TestAsyncTenableIOClient(BaseTest):
+
+    @pytest.fixture(scope='class')
+    def loop(self):
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.fixture(scope='class')
+    def async_client(self, loop):
+        from tenable_io.async_client import AsyncTenableIOClient
+        async_client = AsyncTenableIOClient(concurrency=4, loop=loop)
+        yield async_client
+        async_client.close()
+
+    def test_client_bad_keys(self, loop):
+        from tenable_io.async_client import AsyncTenableIOClient
+        async_client = AsyncTenableIOClient('bad', 'key', loop=loop)
+        try:
+            loop.run_until_complete(async_client.session_api.get())
+            assert False, u'TenableIOApiException should be raised for bad api and secret keys.'
+        except TenableIOApiException as e:
+            assert e.code is TenableIOErrorCode.UNAUTHORIZED, u'Appropriate exception is raised.'
+        finally:
+            async_client.close()
+
+    def test_concurrent_requests(self, client, loop, async_client):
+        scan_ids = [scan.id for scan in client.scans_api.list().scans][:8]
+        details = loop.run_until_complete(
+            asyncio.gather(*[async_client.scans_api.details(scan_id) for scan_id in scan_ids]))
+        assert len(details) == len(scan_ids), u'One result per request.'
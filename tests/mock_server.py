@@ -0,0 +1,529 @@
+"""In-process stand-in of the Tenable.io API, to test and benchmark the SDK without the live platform.
+
+    server = MockServer(latency=0.01, throttle_every=10, hosts=1000)
+    with server:
+        client = server.client()
+        client.scan_helper.scans()
+
+It covers the endpoints of :class:`ScansApi`, :class:`WorkbenchesApi`, :class:`ScannersApi`, :class:`EditorApi`,
+:class:`FoldersApi` and :class:`FileApi`, keeping scans and folders in memory. Recorded traffic (see
+:class:`TrafficRecorder`) is replayed before any of the built-in endpoints.
+"""
+import base64
+import json
+import re
+import threading
+import time
+import uuid
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import parse_qsl, urlparse
+
+from tenable_io.client import TenableIOClient
+from tests.synthetic import SyntheticData
+
+# Response headers kept by TrafficRecorder.
+RECORDED_HEADERS = ['Content-Type', 'Content-Range', 'Content-Encoding', 'ETag', 'Last-Modified', 'Retry-After']
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, do not delay the body until the headers are acknowledged.
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, headers, content = self.server.mock.handle(
+            self.command, parsed.path.strip('/'), dict(parse_qsl(parsed.query)), self.headers, body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer(object):
+    """Tenable.io stand-in served on a local port from a background thread.
+    """
+
+    def __init__(
+            self,
+            latency=0,
+            throttle_every=0,
+            retry_after=0,
+            scans=10,
+            folders=3,
+            scanners=2,
+            hosts=100,
+            items_per_host=10,
+            plugins=1000,
+            scan_duration=0,
+            fixtures=None,
+            seed=0,
+    ):
+        """
+        :param latency: Seconds every response is delayed by.
+        :param throttle_every: If positive, every nth request is answered with a 429.
+        :param retry_after: The `Retry-After` header of 429 responses.
+        :param scans: The number of scans initially listed.
+        :param folders: The number of custom folders, besides `My Scans` and `Trash`.
+        :param scanners: The number of scanners.
+        :param hosts: The number of hosts of exports and assets lists.
+        :param items_per_host: The number of ReportItems per host of exports.
+        :param plugins: The number of distinct plugins of exports and vulnerabilities lists.
+        :param scan_duration: Seconds a launched scan keeps running before it is completed.
+        :param fixtures: The path of a fixtures file written by :class:`TrafficRecorder`, to replay, default to None.
+        :param seed: The seed of the synthetic data.
+        """
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.hosts = hosts
+        self.items_per_host = items_per_host
+        self.data = SyntheticData(hosts, items_per_host, plugins, seed=seed)
+        self.scan_duration = scan_duration
+        self.seed = seed
+
+        self.requests = []
+        self._lock = threading.Lock()
+        self._ids = iter(range(1000, 1 << 31))
+        self._exports = set()
+        self._nessus = None
+        self._replay = {}
+        if fixtures:
+            self.load_fixtures(fixtures)
+
+        now = int(time.time())
+        self.folders = [
+            {'id': 1, 'name': u'My Scans', 'type': u'main', 'default_tag': 1, 'custom': 0, 'unread_count': 0},
+            {'id': 2, 'name': u'Trash', 'type': u'trash', 'default_tag': 0, 'custom': 0, 'unread_count': 0},
+        ] + [{'id': 3 + i, 'name': u'Folder %d' % i, 'type': u'custom', 'default_tag': 0, 'custom': 1,
+              'unread_count': 0} for i in range(folders)]
+        self.scanners = [{
+            'id': 1 + i, 'uuid': str(uuid.UUID(int=i + 1)), 'name': u'Scanner %d' % i, 'type': u'managed',
+            'status': u'on', 'scan_count': 0, 'engine_version': u'1.0', 'platform': u'LINUX',
+            'loaded_plugin_set': u'201701010000', 'owner': u'system',
+        } for i in range(scanners)]
+        self.scans = dict((s['id'], s) for s in (self._new_scan(u'Scan %d' % i, 1, now) for i in range(scans)))
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+        self._server.mock = self
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        return 'http://127.0.0.1:%d/' % self._server.server_port
+
+    def client(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments of :class:`tenable_io.client.TenableIOClient`.
+        :return: A client of the server.
+        """
+        kwargs.setdefault('access_key', 'mock')
+        kwargs.setdefault('secret_key', 'mock')
+        return TenableIOClient(endpoint=self.endpoint, **kwargs)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def load_fixtures(self, path):
+        """Load traffic recorded by :class:`TrafficRecorder`. Responses of the same request are replayed in order, and
+        the last one is repeated. Streamed responses, recorded without body, are served by the routes instead.
+        """
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if record['body'] is None:
+                        continue
+                    key = MockServer._replay_key(record['method'], record['path'], record['query'])
+                    self._replay.setdefault(key, []).append(record)
+
+    @staticmethod
+    def _replay_key(method, path, query):
+        return method, path.strip('/'), tuple(sorted(query.items()))
+
+    def handle(self, method, path, query, headers, body):
+        """
+        :return: A tuple of the status code, headers dict and body bytes of the response.
+        """
+        with self._lock:
+            self.requests.append((method, path))
+            count = len(self.requests)
+        if self.latency:
+            time.sleep(self.latency)
+        if self.throttle_every and count % self.throttle_every == 0:
+            return 429, {'Retry-After': str(self.retry_after), 'Content-Type': 'application/json'}, \
+                b'{"error": "You have exceeded the rate limit."}'
+
+        records = self._replay.get(MockServer._replay_key(method, path, query))
+        if records:
+            with self._lock:
+                record = records.pop(0) if len(records) > 1 else records[0]
+            return record['status'], record['headers'], base64.b64decode(record['body'])
+
+        for (route_method, pattern, name) in MockServer.ROUTES:
+            match = re.match(pattern + '$', path)
+            if route_method == method and match:
+                payload = json.loads(body.decode('utf-8')) if body and \
+                    'json' in (headers.get('Content-Type') or '') else body
+                with self._lock:
+                    result = getattr(self, name)(query, payload, headers, *match.groups())
+                break
+        else:
+            result = 404, {'error': u'Not found.'}
+        if isinstance(result[-1], bytes):
+            return result
+        status, content = result
+        return status, {'Content-Type': 'application/json'}, json.dumps(content).encode('utf-8')
+
+    ROUTES = [
+        ('GET', r'editor/(\w+)/templates', '_templates'),
+        ('POST', r'file/upload', '_upload'),
+        ('GET', r'folders', '_folders'),
+        ('POST', r'folders', '_folder_create'),
+        ('PUT', r'folders/(\d+)', '_folder_edit'),
+        ('DELETE', r'folders/(\d+)', '_folder_delete'),
+        ('GET', r'scanners', '_scanners'),
+        ('GET', r'scanners/(\d+)', '_scanner'),
+        ('GET', r'scanners/(\d+)/scans', '_scanner_scans'),
+        ('POST', r'scanners/(\d+)/scans/([\w-]+)/control', '_scanner_control'),
+        ('GET', r'scans', '_scans'),
+        ('POST', r'scans', '_scan_create'),
+        ('GET', r'scans/(\d+)', '_scan_details'),
+        ('PUT', r'scans/(\d+)', '_scan_configure'),
+        ('DELETE', r'scans/(\d+)', '_scan_delete'),
+        ('POST', r'scans/(\d+)/copy', '_scan_copy'),
+        ('POST', r'scans/(\d+)/export', '_export_request'),
+        ('GET', r'scans/(\d+)/export/(\w+)/status', '_export_status'),
+        ('GET', r'scans/(\d+)/export/(\w+)/download', '_export_download'),
+        ('PUT', r'scans/(\d+)/folder', '_scan_folder'),
+        ('GET', r'scans/(\d+)/history/(\d+)', '_scan_history'),
+        ('POST', r'scans/(\d+)/(launch|pause|resume|stop)', '_scan_control'),
+        ('GET', r'workbenches/assets', '_assets'),
+        ('GET', r'workbenches/assets/vulnerabilities', '_assets'),
+        ('GET', r'workbenches/assets/([\w-]+)/info', '_asset_info'),
+        ('GET', r'workbenches/assets/([\w-]+)/activity', '_asset_activity'),
+        ('GET', r'workbenches/assets/([\w-]+)/vulnerabilities', '_vulnerabilities'),
+        ('GET', r'workbenches/vulnerabilities', '_vulnerabilities'),
+        ('GET', r'workbenches/vulnerabilities/(\d+)/outputs', '_vulnerability_outputs'),
+        ('GET', r'workbenches/export', '_export_request'),
+        ('GET', r'workbenches/export/(\w+)/status', '_export_status'),
+        ('GET', r'workbenches/export/(\w+)/download', '_export_download'),
+    ]
+
+    @staticmethod
+    def _page(query, key, items):
+        """Paginate a list with the `offset` and `limit` query params, when specified.
+        """
+        if 'limit' not in query:
+            return {key: items}
+        offset, limit = int(query.get('offset', 0)), int(query['limit'])
+        return {key: items[offset:offset + limit],
+                'pagination': {'offset': offset, 'limit': limit, 'total': len(items)}}
+
+    def _new_scan(self, name, folder_id, now):
+        scan_id = next(self._ids)
+        return {
+            'id': scan_id, 'uuid': str(uuid.UUID(int=scan_id)), 'name': name, 'type': u'remote',
+            'owner': u'mock', 'enabled': False, 'folder_id': folder_id, 'read': False, 'status': u'empty',
+            'shared': False, 'user_permissions': 128, 'creation_date': now, 'last_modification_date': now,
+            'control': True, 'starttime': None, 'timezone': None, 'rrules': None,
+            'schedule_uuid': u'template-' + str(uuid.UUID(int=scan_id)), 'history': [],
+            'scanner_name': self.scanners[scan_id % len(self.scanners)]['name'] if self.scanners else None,
+        }
+
+    @staticmethod
+    def _listed(scan):
+        """
+        :return: The scan as listed, without the fields only returned with its details.
+        """
+        return dict((k, v) for (k, v) in scan.items() if k not in ('history', 'scanner_name'))
+
+    def _scan_status(self, scan):
+        if scan['status'] == u'running' and time.time() - scan['last_modification_date'] >= self.scan_duration:
+            scan['status'] = u'completed'
+            scan['history'][-1]['status'] = u'completed'
+        return scan
+
+    def _templates(self, query, payload, headers, type):
+        return 200, {'templates': [{
+            'uuid': str(uuid.UUID(int=i + 1)), 'name': name, 'title': name.title(), 'description': name,
+            'cloud_only': False, 'subscription_only': False, 'is_agent': None, 'more_info': None,
+        } for (i, name) in enumerate(['basic', 'advanced', 'discovery', 'webapp'])]}
+
+    def _upload(self, query, payload, headers):
+        match = re.search(br'filename="([^"]*)"', payload)
+        return 200, {'fileuploaded': match.group(1).decode('utf-8') if match else u'upload'}
+
+    def _folders(self, query, payload, headers):
+        return 200, MockServer._page(query, 'folders', self.folders)
+
+    def _folder_create(self, query, payload, headers):
+        folder_id = next(self._ids)
+        self.folders.append({'id': folder_id, 'name': payload['name'], 'type': u'custom', 'default_tag': 0,
+                             'custom': 1, 'unread_count': 0})
+        return 200, {'id': folder_id}
+
+    def _folder_edit(self, query, payload, headers, folder_id):
+        for folder in self.folders:
+            if folder['id'] == int(folder_id):
+                folder['name'] = payload['name']
+                return 200, {}
+        return 404, {'error': u'Folder not found.'}
+
+    def _folder_delete(self, query, payload, headers, folder_id):
+        self.folders = [f for f in self.folders if f['id'] != int(folder_id)]
+        return 200, {}
+
+    def _scanners(self, query, payload, headers):
+        running = [self._scan_status(s)['scanner_name'] for s in self.scans.values() if s['status'] == u'running']
+        for scanner in self.scanners:
+            scanner['scan_count'] = running.count(scanner['name'])
+        return 200, MockServer._page(query, 'scanners', self.scanners)
+
+    def _scanner(self, query, payload, headers, scanner_id):
+        for scanner in self.scanners:
+            if scanner['id'] == int(scanner_id):
+                return 200, scanner
+        return 404, {'error': u'Scanner not found.'}
+
+    def _scanner_scans(self, query, payload, headers, scanner_id):
+        running = [self._scan_status(s) for s in self.scans.values()]
+        return 200, {'scans': [{
+            'scanner_uuid': self.scanners[0]['uuid'] if self.scanners else None, 'name': s['name'],
+            'status': s['status'], 'id': s['history'][-1]['uuid'], 'scan_id': s['id'], 'user': s['owner'],
+            'last_modification_date': s['last_modification_date'], 'start_time': s['starttime'], 'remote': False,
+        } for s in running if s['status'] == u'running']}
+
+    def _scanner_control(self, query, payload, headers, scanner_id, scan_uuid):
+        for scan in self.scans.values():
+            if scan['history'] and scan['history'][-1]['uuid'] == scan_uuid:
+                return self._scan_control(query, payload, headers, str(scan['id']), payload.get('action'))
+        return 404, {'error': u'Scan not found.'}
+
+    def _scans(self, query, payload, headers):
+        scans = [self._scan_status(s) for s in sorted(self.scans.values(), key=lambda s: s['id'])
+                 if ('folder_id' not in query or s['folder_id'] == int(query['folder_id'])) and
+                 ('last_modification_date' not in query or
+                  s['last_modification_date'] >= int(query['last_modification_date']))]
+        page = MockServer._page(query, 'scans', [MockServer._listed(s) for s in scans])
+        page.update(folders=self.folders, timestamp=int(time.time()))
+        return 200, page
+
+    def _scan_create(self, query, payload, headers):
+        settings = payload.get('settings', {})
+        scan = self._new_scan(settings.get('name'), settings.get('folder_id') or 1, int(time.time()))
+        self.scans[scan['id']] = scan
+        return 200, {'scan': {'id': scan['id'], 'uuid': scan['uuid'], 'name': scan['name']}}
+
+    def _scan(self, scan_id):
+        return self.scans.get(int(scan_id))
+
+    def _scan_details(self, query, payload, headers, scan_id):
+        scan = self._scan(scan_id)
+        if scan is None:
+            return 404, {'error': u'Scan not found.'}
+        self._scan_status(scan)
+        history = scan['history']
+        if 'history_id' in query:
+            history = [h for h in history if h['history_id'] == int(query['history_id'])]
+        return 200, {
+            'info': {
+                'name': scan['name'], 'uuid': history[-1]['uuid'] if history else None, 'status': scan['status'],
+                'folder_id': scan['folder_id'], 'object_id': scan['id'], 'control': scan['control'],
+                'edit_allowed': True, 'user_permissions': scan['user_permissions'], 'targets': u'127.0.0.1',
+                'scan_start': scan['starttime'], 'hostcount': self.hosts, 'scanner_name': scan['scanner_name'],
+            },
+            'hosts': [],
+            'vulnerabilities': [],
+            'history': history,
+        }
+
+    def _scan_configure(self, query, payload, headers, scan_id):
+        scan = self._scan(scan_id)
+        if scan is None:
+            return 404, {'error': u'Scan not found.'}
+        settings = payload.get('settings', {})
+        scan['name'] = settings.get('name', scan['name'])
+        scan['folder_id'] = settings.get('folder_id') or scan['folder_id']
+        scan['last_modification_date'] = int(time.time())
+        return 200, {'scan': {'id': scan['id']}}
+
+    def _scan_delete(self, query, payload, headers, scan_id):
+        return (200, {}) if self.scans.pop(int(scan_id), None) else (404, {'error': u'Scan not found.'})
+
+    def _scan_copy(self, query, payload, headers, scan_id):
+        scan = self._scan(scan_id)
+        if scan is None:
+            return 404, {'error': u'Scan not found.'}
+        copy = self._new_scan((payload or {}).get('name') or u'Copy of ' + scan['name'],
+                              (payload or {}).get('folder_id') or scan['folder_id'], int(time.time()))
+        self.scans[copy['id']] = copy
+        return 200, MockServer._listed(copy)
+
+    def _scan_folder(self, query, payload, headers, scan_id):
+        scan = self._scan(scan_id)
+        if scan is None:
+            return 404, {'error': u'Scan not found.'}
+        scan['folder_id'] = payload['folder_id']
+        scan['last_modification_date'] = int(time.time())
+        return 200, {}
+
+    def _scan_history(self, query, payload, headers, scan_id, history_id):
+        scan = self._scan(scan_id)
+        for history in (scan or {}).get('history', []):
+            if history['history_id'] == int(history_id):
+                return 200, {'name': scan['name'], 'object_id': scan['id'], 'owner': scan['owner'],
+                             'status': history['status'], 'uuid': history['uuid'], 'targets': u'127.0.0.1'}
+        return 404, {'error': u'History not found.'}
+
+    def _scan_control(self, query, payload, headers, scan_id, action):
+        scan = self._scan(scan_id)
+        if scan is None:
+            return 404, {'error': u'Scan not found.'}
+        self._scan_status(scan)
+        now = int(time.time())
+        transitions = {
+            'launch': ([u'empty', u'completed', u'canceled', u'aborted', u'imported'], u'running'),
+            'pause': ([u'running'], u'paused'),
+            'resume': ([u'paused'], u'running'),
+            'stop': ([u'running', u'paused'], u'canceled'),
+        }
+        allowed, status = transitions[action]
+        if scan['status'] not in allowed:
+            return 409, {'error': u'Invalid scan status %s for %s.' % (scan['status'], action)}
+        scan['status'] = status
+        scan['last_modification_date'] = now
+        if action == 'launch':
+            history_id = next(self._ids)
+            scan['starttime'] = now
+            scan['history'].append({'history_id': history_id, 'uuid': str(uuid.UUID(int=history_id)),
+                                    'owner_id': 1, 'status': status, 'creation_date': now,
+                                    'last_modification_date': now})
+            return 200, {'scan_uuid': scan['history'][-1]['uuid']}
+        scan['history'][-1]['status'] = status
+        return 200, {}
+
+    def _assets(self, query, payload, headers):
+        return 200, MockServer._page(query, 'assets', [self.data.asset(i) for i in range(self.hosts)])
+
+    def _asset_info(self, query, payload, headers, asset_id):
+        return 200, {'info': {'fqdn': [u'host.example.com'], 'ipv4': [u'10.0.0.1'], 'ipv6': [],
+                              'first_seen': u'2017-01-01T00:00:00.000Z', 'last_seen': u'2017-01-01T00:00:00.000Z',
+                              'counts': {'vulnerabilities': {'total': self.items_per_host}}}}
+
+    def _asset_activity(self, query, payload, headers, asset_id):
+        return 200, {'activity': [{'type': u'seen', 'timestamp': u'2017-01-01T00:00:00.000Z',
+                                   'scan_id': str(scan_id)} for scan_id in sorted(self.scans)]}
+
+    def _vulnerabilities(self, query, payload, headers, asset_id=None):
+        return 200, MockServer._page(query, 'vulnerabilities',
+                                     [self.data.vulnerability(p) for p in range(self.data.plugins)])
+
+    def _vulnerability_outputs(self, query, payload, headers, plugin_id):
+        return 200, {'outputs': [{'plugin_output': u'Output of %s.' % plugin_id, 'states': []}]}
+
+    def _export_request(self, query, payload, headers, scan_id=None):
+        file_id = str(next(self._ids))
+        self._exports.add(file_id)
+        return 200, {'file': file_id}
+
+    def _export_status(self, query, payload, headers, *ids):
+        if ids[-1] not in self._exports:
+            return 404, {'error': u'Export not found.'}
+        return 200, {'status': u'ready'}
+
+    def _export_download(self, query, payload, headers, *ids):
+        file_id = ids[-1]
+        if file_id not in self._exports:
+            return 404, {'error': u'Export not found.'}
+        if self._nessus is None:
+            # Exports have the same synthetic content, generate it once.
+            self._nessus = self.data.nessus()
+        content = self._nessus
+        response_headers = {'Content-Type': 'application/octet-stream', 'ETag': '"%s"' % file_id}
+        match = re.match(r'bytes=(\d+)-(\d*)', headers.get('Range') or '')
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else len(content) - 1, len(content) - 1)
+            if start >= len(content):
+                return 416, {'Content-Range': 'bytes */%d' % len(content)}, b''
+            response_headers['Content-Range'] = 'bytes %d-%d/%d' % (start, end, len(content))
+            return 206, response_headers, content[start:end + 1]
+        return 200, response_headers, content
+
+
+class TrafficRecorder(object):
+    """Record the traffic of a :class:`tenable_io.client.TenableIOClient` into a fixtures file replayed by
+    :class:`MockServer`. Every response is appended as a JSON line, without the body of streamed responses.
+
+        with TrafficRecorder('fixtures.jsonl') as recorder:
+            client = TenableIOClient()
+            recorder.attach(client)
+            client.scan_helper.scans()
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def attach(self, client):
+        """Record the responses received by the client.
+        """
+        client._session.hooks['response'].append(self._record)
+        return client
+
+    def _record(self, response, *args, **kwargs):
+        url = urlparse(response.request.url)
+        record = {
+            'method': response.request.method,
+            'path': url.path.strip('/'),
+            'query': dict(parse_qsl(url.query)),
+            'status': response.status_code,
+            'headers': dict((name, response.headers[name]) for name in RECORDED_HEADERS if name in response.headers),
+            # Streamed bodies (ex. export downloads) are not read, so that they are not loaded in memory.
+            'body': None if kwargs.get('stream') else base64.b64encode(response.content).decode('ascii'),
+        }
+        if 'Content-Encoding' in record['headers']:
+            # The body is recorded decoded.
+            del record['headers']['Content-Encoding']
+        with self._lock:
+            self._file.write(json.dumps(record) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,282 @@
+"""Synthetic Nessus XML exports and API payloads, to reproduce performance problems without customer data.
+
+    $ python -m tests.synthetic nessus export.nessus --hosts 100000 --items-per-host 50 --plugins 20000
+    $ python -m tests.synthetic assets assets.json --hosts 100000
+
+The output is written host by host, so files of any size can be generated in constant memory. The same seed always
+generates the same data.
+"""
+import argparse
+import json
+import random
+import sys
+import uuid
+
+from xml.sax.saxutils import escape, quoteattr
+
+FAMILIES = [u'General', u'Misc.', u'Web Servers', u'Windows', u'Ubuntu Local Security Checks', u'Databases',
+            u'Service detection', u'Settings', u'Firewalls', u'CGI abuses', u'Denial of Service', u'Backdoors']
+SEVERITIES = [u'Info', u'Low', u'Medium', u'High', u'Critical']
+RISK_FACTORS = [u'None', u'Low', u'Medium', u'High', u'Critical']
+PORTS = [(0, u'tcp', u'general'), (22, u'tcp', u'ssh'), (53, u'udp', u'dns'), (80, u'tcp', u'www'),
+         (443, u'tcp', u'www'), (445, u'tcp', u'cifs'), (3306, u'tcp', u'mysql'), (8080, u'tcp', u'www')]
+WORDS = (u'the remote host is affected by a vulnerability which allows an attacker to execute arbitrary code '
+         u'update the affected package to the latest version according to its self reported version number').split()
+
+# Kinds of JSON payloads, with the API endpoint they stand for.
+PAYLOADS = {
+    'assets': 'workbenches/assets',
+    'vulnerabilities': 'workbenches/vulnerabilities',
+    'scans': 'scans',
+    'scanner_scans': 'scanners/{id}/scans',
+}
+
+
+class SyntheticData(object):
+    """Generator of a synthetic environment of hosts and their findings.
+    """
+
+    def __init__(self, hosts=1000, items_per_host=10, plugins=1000, text_size=200, scans=100, seed=0):
+        """
+        :param hosts: The number of hosts.
+        :param items_per_host: The number of findings (ReportItems) per host.
+        :param plugins: The number of distinct plugins findings are drawn from.
+        :param text_size: The number of characters of every plugin description, solution and plugin output.
+        :param scans: The number of scans of the scans payloads.
+        :param seed: The random seed.
+        """
+        assert hosts >= 0 and items_per_host >= 0 and plugins > 0, u'Valid sizes.'
+        self.hosts = hosts
+        self.items_per_host = items_per_host
+        self.plugins = plugins
+        self.text_size = text_size
+        self.scans = scans
+        self.seed = seed
+        self._plugin_xml = {}
+
+    def _text(self, rand, prefix):
+        words = [prefix]
+        size = len(prefix)
+        while size < self.text_size:
+            words.append(rand.choice(WORDS))
+            size += len(words[-1]) + 1
+        return u' '.join(words)[:self.text_size]
+
+    def plugin(self, plugin_id):
+        """
+        :return: A dict of the plugin level fields of a plugin, always the same for a plugin ID.
+        """
+        rand = random.Random('%s-%s' % (self.seed, plugin_id))
+        severity = rand.randint(0, 4)
+        cve = [u'CVE-20%02d-%04d' % (rand.randint(0, 17), rand.randint(1, 9999)) for _ in range(rand.randint(0, 3))]
+        plugin = {
+            'pluginID': str(10000 + plugin_id),
+            'pluginName': u'Synthetic plugin %d' % plugin_id,
+            'pluginFamily': FAMILIES[plugin_id % len(FAMILIES)],
+            'severity': str(severity),
+            'risk_factor': RISK_FACTORS[severity],
+            'synopsis': self._text(rand, u'Synopsis %d:' % plugin_id)[:self.text_size // 4 or 1],
+            'description': self._text(rand, u'Description %d:' % plugin_id),
+            'solution': self._text(rand, u'Solution %d:' % plugin_id),
+            'see_also': [u'https://example.com/advisories/%d/%d' % (plugin_id, i) for i in range(rand.randint(0, 2))],
+            'cve': cve,
+            'xref': [u'IAVA:2017-A-%04d' % rand.randint(1, 9999)] if cve else [],
+            'plugin_type': rand.choice([u'remote', u'local', u'combined']),
+            'plugin_publication_date': u'2017/%02d/%02d' % (rand.randint(1, 12), rand.randint(1, 28)),
+            'plugin_modification_date': u'2017/%02d/%02d' % (rand.randint(1, 12), rand.randint(1, 28)),
+        }
+        if severity:
+            plugin['cvss_base_score'] = u'%.1f' % (severity * 2.5 - rand.random())
+            plugin['cvss_vector'] = u'CVSS2#AV:N/AC:L/Au:N/C:P/I:P/A:P'
+        return plugin
+
+    def host(self, i):
+        """
+        :return: A dict of the ReportHost name and HostProperties of a host.
+        """
+        ip = u'10.%d.%d.%d' % ((i >> 16) & 255, (i >> 8) & 255, i & 255)
+        return {
+            'name': ip,
+            'host-ip': ip,
+            'host-fqdn': u'host%d.example.com' % i,
+            'host-uuid': str(uuid.UUID(int=i + 1)),
+            'netbios-name': u'HOST%d' % i,
+            'operating-system': u'Linux Kernel 3.10' if i % 3 else u'Microsoft Windows Server 2012',
+            'mac-address': u'00:50:56:%02x:%02x:%02x' % ((i >> 16) & 255, (i >> 8) & 255, i & 255),
+            'HOST_START': u'Mon May 15 00:00:00 2017',
+            'HOST_END': u'Mon May 15 01:00:00 2017',
+        }
+
+    def findings(self, i):
+        """
+        :return: The list of (plugin ID, port, protocol, service) of the findings of a host.
+        """
+        rand = random.Random('%s-host-%s' % (self.seed, i))
+        count = min(self.items_per_host, self.plugins)
+        return [(plugin_id,) + rand.choice(PORTS) for plugin_id in rand.sample(range(self.plugins), count)]
+
+    def _report_item_xml(self, plugin_id):
+        """
+        :return: A tuple of the XML of the plugin level attributes and children of the ReportItems of a plugin, cached \
+        per plugin.
+        """
+        xml = self._plugin_xml.get(plugin_id)
+        if xml is None:
+            plugin = self.plugin(plugin_id)
+            attributes = u'severity="%s" pluginID="%s" pluginName=%s pluginFamily=%s' % (
+                plugin['severity'], plugin['pluginID'], quoteattr(plugin['pluginName']),
+                quoteattr(plugin['pluginFamily']))
+            children = []
+            for name in sorted(plugin):
+                if name in ('pluginID', 'pluginName', 'pluginFamily', 'severity'):
+                    continue
+                values = plugin[name] if isinstance(plugin[name], list) else [plugin[name]]
+                children.extend(u'<%s>%s</%s>\n' % (name, escape(value), name) for value in values)
+            xml = self._plugin_xml[plugin_id] = (attributes, u''.join(children))
+        return xml
+
+    def iter_nessus(self):
+        """
+        :return: Iterator that yields the UTF-8 encoded chunks of the Nessus XML report, one per host.
+        """
+        yield (u'<?xml version="1.0" ?>\n<NessusClientData_v2>\n<Report name=%s>\n'
+               % quoteattr(u'Synthetic %d hosts' % self.hosts)).encode('utf-8')
+        for i in range(self.hosts):
+            host = self.host(i)
+            parts = [u'<ReportHost name=%s><HostProperties>\n' % quoteattr(host['name'])]
+            parts.extend(u'<tag name=%s>%s</tag>\n' % (quoteattr(name), escape(value))
+                         for (name, value) in sorted(host.items()) if name != 'name')
+            parts.append(u'</HostProperties>\n')
+            for (plugin_id, port, protocol, svc_name) in self.findings(i):
+                attributes, children = self._report_item_xml(plugin_id)
+                parts.append(u'<ReportItem port="%d" svc_name="%s" protocol="%s" %s>\n%s'
+                             u'<plugin_output>%s</plugin_output>\n'
+                             u'<first_found>2017-05-01T00:00:00.000Z</first_found>\n'
+                             u'<last_found>2017-05-15T00:00:00.000Z</last_found>\n'
+                             u'<vulnerability_state>Active</vulnerability_state>\n</ReportItem>\n'
+                             % (port, svc_name, protocol, attributes, children,
+                                escape(self._plugin_output(i, plugin_id))))
+            parts.append(u'</ReportHost>\n')
+            yield u''.join(parts).encode('utf-8')
+        yield b'</Report>\n</NessusClientData_v2>\n'
+
+    def _plugin_attributes(self, plugin_id):
+        return {
+            'pluginID': str(10000 + plugin_id),
+            'pluginName': u'Synthetic plugin %d' % plugin_id,
+            'pluginFamily': FAMILIES[plugin_id % len(FAMILIES)],
+            'severity': self._severity(plugin_id),
+        }
+
+    def _severity(self, plugin_id):
+        return str(random.Random('%s-%s' % (self.seed, plugin_id)).randint(0, 4))
+
+    def _plugin_output(self, i, plugin_id):
+        prefix = u'Output of plugin %d on host %d:' % (plugin_id, i)
+        return (prefix + u' x' * (self.text_size // 2))[:max(len(prefix), self.text_size)]
+
+    def nessus(self):
+        """
+        :return: The bytes of the Nessus XML report.
+        """
+        return b''.join(self.iter_nessus())
+
+    def iter_json(self, kind):
+        """
+        :param kind: A key of :data:`PAYLOADS`.
+        :return: Iterator that yields the UTF-8 encoded chunks of the JSON payload.
+        """
+        if kind == 'assets':
+            records, key, extra = (self.asset(i) for i in range(self.hosts)), 'assets', {'total': self.hosts}
+        elif kind == 'vulnerabilities':
+            records, key, extra = (self.vulnerability(p) for p in range(self.plugins)), 'vulnerabilities', \
+                {'total_vulnerability_count': self.plugins}
+        elif kind == 'scans':
+            records, key, extra = (self.scan(s) for s in range(self.scans)), 'scans', \
+                {'folders': [], 'timestamp': 1494806400}
+        elif kind == 'scanner_scans':
+            records, key, extra = (self.scanner_scan(s) for s in range(self.scans)), 'scans', {}
+        else:
+            raise ValueError(u'Unknown payload %s.' % kind)
+        yield (u'{"%s": [' % key).encode('utf-8')
+        for n, record in enumerate(records):
+            yield ((u',' if n else u'') + json.dumps(record)).encode('utf-8')
+        yield (u']%s}' % u''.join(u', %s: %s' % (json.dumps(k), json.dumps(v))
+                                  for (k, v) in sorted(extra.items()))).encode('utf-8')
+
+    def json(self, kind):
+        """
+        :return: The bytes of a JSON payload, see :func:`SyntheticData.iter_json`.
+        """
+        return b''.join(self.iter_json(kind))
+
+    def asset(self, i):
+        host = self.host(i)
+        counts = [0] * 5
+        for (plugin_id, _, _, _) in self.findings(i):
+            counts[int(self._severity(plugin_id))] += 1
+        return {
+            'id': host['host-uuid'], 'has_agent': False, 'last_seen': u'2017-05-15T00:00:00.000Z',
+            'sources': [{'name': u'NESSUS_SCAN', 'first_seen': u'2017-05-01T00:00:00.000Z'}],
+            'fqdn': [host['host-fqdn']], 'ipv4': [host['host-ip']], 'ipv6': [], 'mac_address': [host['mac-address']],
+            'netbios_name': [host['netbios-name']], 'operating_system': [host['operating-system']],
+            'severities': [{'count': count, 'level': level, 'name': SEVERITIES[level]}
+                           for (level, count) in enumerate(counts)],
+        }
+
+    def vulnerability(self, plugin_id):
+        attributes = self._plugin_attributes(plugin_id)
+        return {
+            'count': max(1, self.hosts * min(self.items_per_host, self.plugins) // self.plugins),
+            'plugin_family': attributes['pluginFamily'], 'plugin_id': int(attributes['pluginID']),
+            'plugin_name': attributes['pluginName'], 'vulnerability_state': u'Active',
+            'severity': int(attributes['severity']),
+        }
+
+    def scan(self, s):
+        return {
+            'id': s + 1, 'uuid': str(uuid.UUID(int=s + 1)), 'name': u'Synthetic scan %d' % s, 'type': u'remote',
+            'owner': u'admin', 'enabled': False, 'folder_id': 3, 'read': True, 'status': u'completed',
+            'shared': False, 'user_permissions': 128, 'creation_date': 1494806400,
+            'last_modification_date': 1494810000, 'control': True, 'starttime': None, 'timezone': None,
+            'rrules': None,
+        }
+
+    def scanner_scan(self, s):
+        return {
+            'scanner_uuid': str(uuid.UUID(int=1)), 'name': u'Synthetic scan %d' % s, 'status': u'running',
+            'id': str(uuid.UUID(int=1 << 64 | s)), 'scan_id': s + 1, 'user': u'admin',
+            'last_modification_date': 1494810000, 'start_time': 1494806400, 'remote': False,
+        }
+
+
+def write(chunks, path):
+    """Write chunks to a file, or to the standard output if path is `-`.
+    """
+    out = open(path, 'wb') if path != '-' else getattr(sys.stdout, 'buffer', sys.stdout)
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if path != '-':
+            out.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('kind', choices=['nessus'] + sorted(PAYLOADS))
+    parser.add_argument('path', help=u'The output file, or - for the standard output.')
+    parser.add_argument('--hosts', type=int, default=1000)
+    parser.add_argument('--items-per-host', type=int, default=10)
+    parser.add_argument('--plugins', type=int, default=1000)
+    parser.add_argument('--text-size', type=int, default=200)
+    parser.add_argument('--scans', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    data = SyntheticData(args.hosts, args.items_per_host, args.plugins, args.text_size, args.scans, args.seed)
+    write(data.iter_nessus() if args.kind == 'nessus' else data.iter_json(args.kind), args.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import threading
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from tenable_io.client import TenableIOClient
+from tests.base import BaseTest
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestTenableIOAdapter(BaseTest):
+
+    def setup_method(self, method):
+        super(TestTenableIOAdapter, self).setup_method(method)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def teardown_method(self, method):
+        self.server.shutdown()
+        self.server.server_close()
+        super(TestTenableIOAdapter, self).teardown_method(method)
+
+    def test_connection_reuse(self):
+        client = TenableIOClient(endpoint='http://127.0.0.1:%s/' % self.server.server_port, pool_maxsize=2,
+                                 connect_timeout=5, read_timeout=5, tcp_keepalive=True)
+        responses = [client.get('resource') for _ in range(3)]
+        client._session.close()
+
+        assert not responses[0].connection_reused and responses[0].connect_time >= 0, \
+            u'First request opens a connection.'
+        assert all(r.connection_reused and r.connect_time is None for r in responses[1:]), \
+            u'Following requests reuse the pooled connection.'
+        assert client.connection_stats() == {'new_connections': 1, 'reused_connections': 2}
@@ -0,0 +1,53 @@
+import pytest
+
+from tenable_io.exceptions import TenableIOApiException, TenableIOErrorCode
+from tests.base import BaseTest
+from tests.mock_server import MockServer
+
+asyncio = pytest.importorskip('asyncio')
+
+
+class TestAsyncTenableIOClient(BaseTest):
+
+    def setup_method(self, method):
+        super(TestAsyncTenableIOClient, self).setup_method(method)
+        from tenable_io.async_client import AsyncTenableIOClient
+        self.server = MockServer(scans=8).start()
+        self.loop = asyncio.new_event_loop()
+        self.async_client = AsyncTenableIOClient('mock', 'mock', self.server.endpoint, concurrency=4, loop=self.loop)
+
+    def teardown_method(self, method):
+        self.async_client.close()
+        self.loop.close()
+        self.server.stop()
+        super(TestAsyncTenableIOClient, self).teardown_method(method)
+
+    def test_concurrent_requests(self):
+        scan_ids = sorted(self.server.scans)
+        details = self.loop.run_until_complete(
+            asyncio.gather(*[self.async_client.scans_api.details(scan_id) for scan_id in scan_ids]))
+        assert [d.info.object_id for d in details] == scan_ids, u'One result per request, in order.'
+
+    def test_api_error(self):
+        try:
+            self.loop.run_until_complete(self.async_client.scans_api.details(1))
+            assert False, u'TenableIOApiException should be raised for missing scans.'
+        except TenableIOApiException as e:
+            assert e.code is TenableIOErrorCode.NOT_FOUND, u'Appropriate exception is raised.'
+
+    def test_running_loop(self):
+        from tenable_io.async_client import AsyncTenableIOClient
+        async_client = AsyncTenableIOClient('mock', 'mock', self.server.endpoint)
+        results = []
+
+        def request():
+            # Without a loop, requests are scheduled on the running loop.
+            future = async_client.scans_api.list()
+            future.add_done_callback(lambda f: (results.append(f.result()), self.loop.stop()))
+
+        try:
+            self.loop.call_soon(request)
+            self.loop.run_forever()
+        finally:
+            async_client.close()
+        assert len(results[0].scans) == 8
@@ -0,0 +1,79 @@
+from tenable_io.cache import ResponseCache
+from tenable_io.client import TenableIOClient
+from tests.base import BaseTest
+
+
+class FakeSession(object):
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, uri, **kwargs):
+        self.requests.append((method, uri))
+        response = FakeResponse()
+        response.request = FakeResponse()
+        return response
+
+
+class FakeResponse(object):
+    status_code = 200
+    method = 'GET'
+    url = 'uri'
+    headers = {}
+    body = None
+    text = ''
+
+
+class TestResponseCache(BaseTest):
+
+    def test_ttl(self):
+        cache = ResponseCache({'editor/*/templates': 10, 'folders': 5})
+        assert cache.ttl('editor/scan/templates') == 10
+        assert cache.ttl('folders') == 5
+        assert cache.ttl('folders/1') is None, u'URIs matching no pattern are not cached.'
+
+    def test_expiry_and_stats(self):
+        cache = ResponseCache({'folders': 5})
+        now = [0]
+        cache._clock = lambda: now[0]
+        key = cache.key('folders')
+
+        assert cache.get(key) is None
+        cache.set(key, 'response')
+        assert cache.get(key) == 'response'
+        now[0] = 5
+        assert cache.get(key) is None, u'Expired responses are not returned.'
+        assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 0}
+
+    def test_lru(self):
+        cache = ResponseCache({'*': 60}, max_size=2)
+        for uri in ['a', 'b']:
+            cache.set(cache.key(uri), uri)
+        cache.get(cache.key('a'))
+        cache.set(cache.key('c'), 'c')
+        assert cache.get(cache.key('b')) is None, u'Least recently used response is evicted.'
+        assert cache.get(cache.key('a')) == 'a' and cache.get(cache.key('c')) == 'c'
+
+    def test_invalidate(self):
+        cache = ResponseCache({'*': 60})
+        for uri in ['scans', 'scans/1', 'folders']:
+            cache.set(cache.key(uri), uri)
+        cache.invalidate('scans/1/launch')
+        assert cache.stats()['size'] == 1, u'Responses of the same resource are removed.'
+        cache.invalidate()
+        assert cache.stats()['size'] == 0
+
+    def test_client(self):
+        client = TenableIOClient(cache=ResponseCache({'folders': 60}))
+        client._session = FakeSession()
+
+        client.get('folders')
+        client.get('folders')
+        client.get('folders', params={'a': 1})
+        client.get('scans')
+        assert len(client._session.requests) == 3, u'Cached responses are reused.'
+
+        client.post('folders', {'name': 'folder'})
+        client.get('folders')
+        assert len(client._session.requests) == 5, u'Mutating requests invalidate the resource.'
+        assert client.cache.stats()['hits'] == 1
@@ -1,5 +1,22 @@
+from tenable_io.api.models import ScanSettings
+from tenable_io.api.scans import ScanCreateRequest
+from tenable_io.client import TenableIOClient
+from tenable_io.codec import JsonCodec
 from tests.base import BaseTest
 
 
 class TestTenableIOClient(BaseTest):
-    pass
+
+    def test_json_kwargs(self):
+        client = TenableIOClient(json_codec=JsonCodec())
+
+        kwargs = client._json_kwargs({'name': 'folder'}, {'params': {'a': 1}})
+        assert client.json_codec.loads(kwargs['data']) == {'name': 'folder'}, u'Payload is encoded by the codec.'
+        assert kwargs['headers']['Content-Type'] == 'application/json'
+        assert kwargs['params'] == {'a': 1}, u'Other arguments are kept.'
+
+        request = ScanCreateRequest('template_uuid', ScanSettings('name', 'text_targets'))
+        kwargs = client._json_kwargs(request, {})
+        assert client.json_codec.loads(kwargs['data']) == request.as_payload(), u'Requests are encoded as payloads.'
+
+        assert client._json_kwargs(None, {'files': {}}) == {'files': {}}, u'No body is sent without payload.'
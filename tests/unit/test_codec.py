@@ -0,0 +1,33 @@
+import pytest
+
+from tenable_io.api.models import Agent, AgentList
+from tenable_io.codec import JsonCodec, OrjsonCodec, default_json_codec, orjson
+from tests.base import BaseTest
+
+
+class TestJsonCodec(BaseTest):
+
+    CODECS = [JsonCodec] + ([OrjsonCodec] if orjson is not None else [])
+
+    @pytest.mark.parametrize('codec_class', CODECS)
+    def test_round_trip(self, codec_class):
+        codec = codec_class()
+        obj = {u'name': u'café', u'ids': [1, 2], u'enabled': True, u'empty': None}
+        encoded = codec.dumps(obj)
+        assert isinstance(encoded, bytes), u'Payloads are encoded as bytes.'
+        assert codec.loads(encoded) == obj, u'Bytes are decoded.'
+        assert codec.loads(encoded.decode('utf-8')) == obj, u'Text is decoded.'
+
+    @pytest.mark.parametrize('codec_class', CODECS)
+    def test_from_json(self, codec_class):
+        agent_list = AgentList.from_json(b'{"agents": [{"id": 1}, {"id": 2}]}', codec_class())
+        assert [a.id for a in agent_list.agents] == [1, 2], u'Models are parsed with the given codec.'
+
+    @pytest.mark.parametrize('codec_class', CODECS)
+    def test_from_json_list(self, codec_class):
+        agents = Agent.from_json_list(b'[{"id": 1}, {"id": 2}]', codec_class())
+        assert [a.id for a in agents] == [1, 2], u'Model lists are parsed with the given codec.'
+
+    def test_default_json_codec(self):
+        assert isinstance(default_json_codec(), OrjsonCodec if orjson is not None else JsonCodec), \
+            u'orjson is used when installed.'
@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+
+from tenable_io.parser.columnar import ColumnarReader, ColumnarWriter, DictionaryColumn, VulnerabilityColumnBuilder
+from tenable_io.parser.workbenches import WorkbenchParser
+from tenable_io.util import IterContentReader
+from tests.base import BaseTest
+from tests.unit.test_parser import NESSUS_REPORT
+
+
+def report_hosts():
+    return WorkbenchParser.parse(IterContentReader([NESSUS_REPORT]), fields=VulnerabilityColumnBuilder.FIELDS)
+
+
+class TestColumnar(BaseTest):
+
+    def test_dictionary_column(self):
+        column = DictionaryColumn()
+        for value in ['tcp', 'udp', None, 'tcp']:
+            column.append(value)
+        assert column.dictionary == ['tcp', 'udp'], u'Distinct values are stored once.'
+        assert list(column.indices) == [0, 1, -1, 0]
+        assert list(column) == ['tcp', 'udp', None, 'tcp'] and column[1] == 'udp', u'Values are decoded.'
+
+    def test_builder(self):
+        batches = list(VulnerabilityColumnBuilder(batch_size=2).batches(report_hosts()))
+        assert [len(b) for b in batches] == [2, 1], u'Batches are limited to batch_size.'
+        batch = batches[0]
+        assert batch.column('severity').typecode == 'i' and list(batch.column('severity')) == [0, 2]
+        assert list(batch.column('host')) == ['10.0.0.1', '10.0.0.1'], u'Host is the host-ip.'
+        d = batch.to_pydict()
+        assert d['plugin_id'] == [19506, 70658]
+        assert d['cvss_base_score'] == [None, 4.3], u'Missing values are None.'
+        assert batches[1].to_pydict()['plugin_family'] == ['Web Servers']
+
+    def test_writer_reader(self):
+        batches = list(VulnerabilityColumnBuilder(batch_size=2).batches(report_hosts()))
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'vulnerabilities.col')
+            with ColumnarWriter(path) as writer:
+                for batch in batches:
+                    writer.write(batch)
+            with ColumnarReader(path) as reader:
+                read = list(reader)
+        finally:
+            shutil.rmtree(temp_dir)
+        assert [b.schema for b in read] == [b.schema for b in batches], u'Schema is written.'
+        assert [repr(b.to_pydict()) for b in read] == [repr(b.to_pydict()) for b in batches], u'Values are written.'
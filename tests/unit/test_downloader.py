@@ -0,0 +1,171 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler
+
+from tenable_io.client import TenableIOClient
+from tenable_io.downloader import Downloader
+from tenable_io.exceptions import TenableIOException, TenableIOFileChangedException
+from tests.base import BaseTest
+from tests.unit.test_adapter import ThreadingHTTPServer
+
+CONTENT = os.urandom(100000)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range') or '')
+        if_range = self.headers.get('If-Range')
+        if server.ranges and match and (if_range is None or if_range == server.etag):
+            start, end = int(match.group(1)), min(int(match.group(2)), len(server.content) - 1)
+            body = server.content[start:end + 1]
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, len(server.content)))
+        else:
+            body = server.content
+            self.send_response(200)
+        if server.etag:
+            self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        with server.lock:
+            fail = server.failures > 0 and len(body) > 1
+            if fail:
+                server.failures -= 1
+            server.served += len(body) // 2 if fail else len(body)
+        if fail:
+            # Drop the connection in the middle of the body.
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloader(BaseTest):
+
+    def setup_method(self, method):
+        super(TestDownloader, self).setup_method(method)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+        self.server.content = CONTENT
+        self.server.etag = '"v1"'
+        self.server.ranges = True
+        self.server.failures = 0
+        self.server.served = 0
+        self.server.lock = threading.Lock()
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.client = TenableIOClient(endpoint='http://127.0.0.1:%s/' % self.server.server_port)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'export.nessus')
+
+    def teardown_method(self, method):
+        self.client._session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+        super(TestDownloader, self).teardown_method(method)
+
+    def downloader(self, **kwargs):
+        downloader = Downloader(self.client, segments=4, chunk_size=4096, **kwargs)
+        downloader.MIN_SEGMENT_SIZE = 1000
+        return downloader
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_parallel_segments(self):
+        assert self.downloader().download('files/%(id)s', self.path, {'id': 1}) == self.path
+        assert self.read() == CONTENT, u'Segments are assembled.'
+        assert os.listdir(self.directory) == ['export.nessus'], u'Partial files are removed.'
+
+    def test_retry_segments(self):
+        self.server.failures = 3
+        self.downloader().download('files/%(id)s', self.path, {'id': 1})
+        assert self.read() == CONTENT, u'Failed segments are resumed.'
+        # Bytes of the chunk being read when a connection drops are downloaded again.
+        assert self.server.served <= len(CONTENT) + 1 + 3 * 4096, u'Segments are resumed from the failure offset.'
+
+    def test_resume(self):
+        self.server.failures = 4
+        try:
+            self.downloader(max_attempts=1).download('files/%(id)s', self.path, {'id': 1})
+            assert False, u'Download fails after max attempts.'
+        except TenableIOException:
+            pass
+        assert os.path.exists(self.path + '.part.json'), u'State is kept to resume.'
+
+        self.server.served = 0
+        self.downloader().download('files/%(id)s', self.path, {'id': 1})
+        assert self.read() == CONTENT
+        assert self.server.served <= len(CONTENT) // 2 + 4 * 4096, u'Downloaded bytes are not downloaded again.'
+
+    def test_save_state_during_segments(self):
+        saved = []
+        path = self.path
+
+        class RecordingDownloader(Downloader):
+
+            @staticmethod
+            def _save_state(state_path, state, lock):
+                with open(path + '.part', 'rb') as f:
+                    data = f.read()
+                # Every recorded byte is already written to the file.
+                saved.append(all(data[start:start + done] == CONTENT[start:start + done]
+                                 for (start, _, done) in state['segments']))
+                Downloader._save_state(state_path, state, lock)
+
+        downloader = RecordingDownloader(self.client, segments=4, chunk_size=4096)
+        downloader.MIN_SEGMENT_SIZE = 1000
+        downloader.STATE_INTERVAL = 8192
+        downloader.download('files/%(id)s', self.path, {'id': 1})
+        assert self.read() == CONTENT
+        # Segments of 25000 bytes are saved every 2 chunks, besides the initial and final saves.
+        assert len(saved) >= 1 + 4 * 3, u'State is saved during segments.'
+        assert all(saved), u'State does not run ahead of the written data.'
+
+    def test_file_changed(self):
+        self.server.failures = 4
+        try:
+            self.downloader(max_attempts=1).download('files/%(id)s', self.path, {'id': 1})
+        except TenableIOException:
+            pass
+        self.server.etag = '"v2"'
+        try:
+            self.downloader().download('files/%(id)s', self.path, {'id': 1})
+            assert False, u'Modified files are detected.'
+        except TenableIOFileChangedException:
+            pass
+        assert not os.listdir(self.directory), u'Partial files of a modified file are removed.'
+
+    def test_no_validator(self):
+        self.server.etag = None
+        self.server.failures = 1
+        try:
+            self.downloader(max_attempts=1).download('files/%(id)s', self.path, {'id': 1})
+            assert False, u'Download fails after max attempts.'
+        except TenableIOException:
+            pass
+        assert not os.path.exists(self.path + '.part.json'), u'Files without validator are not resumed.'
+
+        self.server.served = 0
+        self.downloader().download('files/%(id)s', self.path, {'id': 1})
+        assert self.read() == CONTENT
+        assert self.server.served == 1 + len(CONTENT), u'Files without validator are downloaded on a single connection.'
+
+    def test_no_range_support(self):
+        self.server.ranges = False
+        self.downloader().download('files/%(id)s', self.path, {'id': 1})
+        assert self.read() == CONTENT, u'Files are downloaded on a single connection.'
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+
+from tenable_io.parser.host_index import HostIndex
+from tenable_io.parser.workbenches import ReportFilter, WorkbenchParser
+from tests.base import BaseTest
+from tests.unit.test_parser import COMPLIANCE_REPORT, NESSUS_REPORT
+
+
+class TestHostIndex(BaseTest):
+
+    def setup_method(self, method):
+        super(TestHostIndex, self).setup_method(method)
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'export.nessus')
+        with open(self.path, 'wb') as f:
+            f.write(NESSUS_REPORT)
+
+    def teardown_method(self, method):
+        super(TestHostIndex, self).teardown_method(method)
+        shutil.rmtree(self.temp_dir)
+
+    def test_build(self):
+        index = HostIndex.build(self.path)
+        assert len(index) == 2, u'One entry per ReportHost.'
+        for key in ['10.0.0.1', 'one.example.com']:
+            start, end = index.lookup(key)[0]
+            assert NESSUS_REPORT[start:end].startswith(b'<ReportHost name="10.0.0.1">'), u'Host is found by %s.' % key
+        assert '10.0.0.3' not in index and index.lookup('10.0.0.3') == [], u'Unknown hosts are not found.'
+
+    def test_open(self):
+        index = HostIndex.open(self.path)
+        assert os.path.exists(HostIndex.index_path(self.path)), u'Index is saved.'
+        loaded = HostIndex.load(self.path)
+        assert loaded.hosts == index.hosts and loaded.header == index.header, u'Index is loaded.'
+
+        with open(self.path, 'ab') as f:
+            f.write(b'\n')
+        assert HostIndex.load(self.path) is None, u'Stale index is not loaded.'
+        index.save()
+        with open(HostIndex.index_path(self.path)) as f:
+            saved = f.read()
+        with open(HostIndex.index_path(self.path), 'w') as f:
+            f.write(saved.replace('"version": %d' % HostIndex.VERSION, '"version": 1'))
+        assert HostIndex.load(self.path) is None, u'Index of another version is not loaded.'
+        assert len(HostIndex.open(self.path)) == 2, u'Stale index is rebuilt.'
+
+    def test_parse(self):
+        with HostIndex.open(self.path) as index:
+            reports = list(index.parse(['10.0.0.2', 'one.example.com']))
+            expected = list(WorkbenchParser.parse(self.path))
+            assert reports == expected, u'Hosts are parsed in document order.'
+
+            items = list(index.parse('10.0.0.1', tag=WorkbenchParser.REPORT_ITEM,
+                                     report_filter=ReportFilter(severities=[2])))
+            assert [i['pluginID'] for i in items] == ['70658'], u'Filter is applied.'
+            assert list(index.parse('10.0.0.3')) == [], u'Unknown hosts yield nothing.'
+
+    def test_parse_namespaces(self):
+        with open(self.path, 'wb') as f:
+            f.write(COMPLIANCE_REPORT)
+        with HostIndex.open(self.path) as index:
+            items = list(index.parse('10.0.0.1', tag=WorkbenchParser.REPORT_ITEM))
+        assert HostIndex.load(self.path).header == index.header, u'Header is saved.'
+        assert items[1]['{http://www.nessus.org/cm}compliance-result'] == 'FAILED', \
+            u'Hosts are parsed with the namespaces of the report.'
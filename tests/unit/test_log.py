@@ -0,0 +1,80 @@
+import io
+import logging as logging_
+import requests
+
+from tenable_io.log import format_request, log_request, logging
+from tests.base import BaseTest
+
+
+def response(status_code=200, body=b'{"id": 1}', request_body=None, stream=False):
+    r = requests.Response()
+    r.status_code = status_code
+    r.reason = 'OK'
+    r.raw = io.BytesIO(body)
+    r.request = requests.Request('POST', 'https://cloud.tenable.com/scans', data=request_body).prepare()
+    if not stream:
+        r.content
+    return r
+
+
+def set_level(level):
+    logging.setLevel(level)
+    # The logger is not registered by the logging manager, which therefore does not clear its level cache.
+    getattr(logging, '_cache', {}).clear()
+
+
+class RecordingHandler(logging_.Handler):
+
+    def __init__(self):
+        super(RecordingHandler, self).__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestLog(BaseTest):
+
+    def setup_method(self, method):
+        super(TestLog, self).setup_method(method)
+        self.level = logging.level
+        self.handler = RecordingHandler()
+        logging.addHandler(self.handler)
+
+    def teardown_method(self, method):
+        logging.removeHandler(self.handler)
+        set_level(self.level)
+        super(TestLog, self).teardown_method(method)
+
+    def test_streamed_body_not_read(self):
+        set_level(logging_.DEBUG)
+        r = response(stream=True)
+        message = format_request(r)
+        assert u'Streamed, not logged.' in message
+        assert r.raw.tell() == 0, u'Streamed body is not read.'
+
+    def test_bodies(self):
+        set_level(logging_.DEBUG)
+        message = format_request(response(body=b'{"id": 1}', request_body=b'x' * 100001))
+        assert u'{"id": 1}' in message
+        assert u'x' * 100000 + u'...Body Truncated' in message, u'Bytes bodies are decoded and truncated.'
+
+    def test_lazy_formatting(self):
+        set_level(logging_.WARNING)
+        r = response(stream=True)
+        r.request = None
+        log_request(r)
+        assert not self.handler.records, u'Nothing is formatted when not emitted.'
+
+        log_request(response(status_code=404))
+        assert [record.levelno for record in self.handler.records] == [logging_.ERROR]
+
+    def test_sampling(self):
+        set_level(logging_.INFO)
+        for _ in range(10):
+            log_request(response(), sample_rate=0)
+        assert not self.handler.records, u'Successful requests are sampled.'
+
+        log_request(response(status_code=500), sample_rate=0)
+        assert [record.levelno for record in self.handler.records] == [logging_.INFO, logging_.ERROR], \
+            u'Failed requests are always logged.'
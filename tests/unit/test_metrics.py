@@ -0,0 +1,75 @@
+import threading
+
+from tenable_io.client import TenableIOClient
+from tenable_io.metrics import EndpointHistogram, RequestMetrics, StatsdExporter
+from tests.base import BaseTest
+from tests.unit.test_adapter import Handler, ThreadingHTTPServer
+
+
+class TestRequestMetrics(BaseTest):
+
+    def test_observers(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        recorded = []
+        histogram = EndpointHistogram()
+
+        def failing(metrics):
+            raise ValueError()
+
+        client = TenableIOClient(endpoint='http://127.0.0.1:%s/' % server.server_port,
+                                 observers=[recorded.append, failing, histogram])
+        try:
+            client.get('scans/%(scan_id)s', path_params={'scan_id': 1})
+            client.get('scans/%(scan_id)s', path_params={'scan_id': 2})
+        finally:
+            client._session.close()
+            server.shutdown()
+            server.server_close()
+
+        assert [m.uri for m in recorded] == ['scans/1', 'scans/2'], u'Observers are called after every request.'
+        metrics = recorded[0]
+        assert metrics.method == 'GET' and metrics.uri_template == 'scans/%(scan_id)s' and metrics.status == 200
+        assert metrics.bytes == 2 and metrics.retries == 0
+        assert metrics.connection_reused is False and metrics.connect_time is not None
+        assert recorded[1].connection_reused is True
+        assert 0 <= metrics.ttfb <= metrics.total_time
+        assert histogram.endpoints()[('GET', 'scans/%(scan_id)s')]['count'] == 2, u'Requests are grouped by template.'
+
+
+class TestEndpointHistogram(BaseTest):
+
+    def test_prometheus_text(self):
+        histogram = EndpointHistogram(buckets=[0.1, 1])
+        for total_time in [0.05, 0.5, 5]:
+            histogram(RequestMetrics('GET', 'scans', status=200, total_time=total_time))
+        histogram(RequestMetrics('POST', 'folders', status=None, total_time=0.01))
+
+        endpoint = histogram.endpoints()[('GET', 'scans')]
+        assert endpoint['count'] == 3 and endpoint['errors'] == 0 and endpoint['buckets'] == [1, 1]
+        assert histogram.endpoints()[('POST', 'folders')]['errors'] == 1, u'Failed requests are counted as errors.'
+
+        text = histogram.prometheus_text('requests')
+        assert u'requests_bucket{method="GET",uri="scans",le="0.1"} 1' in text
+        assert u'requests_bucket{method="GET",uri="scans",le="1"} 2' in text, u'Buckets are cumulative.'
+        assert u'requests_bucket{method="GET",uri="scans",le="+Inf"} 3' in text
+        assert u'requests_count{method="POST",uri="folders"} 1' in text
+
+
+class TestStatsdExporter(BaseTest):
+
+    def test_lines(self):
+        exporter = StatsdExporter(prefix='tio')
+        try:
+            lines = exporter.lines(RequestMetrics('GET', 'scans/%(scan_id)s', status=200, bytes=10, retries=1,
+                                                  ttfb=0.1, total_time=0.25))
+        finally:
+            exporter.close()
+        assert u'tio.get.scans.scan_id.requests:1|c' in lines
+        assert u'tio.get.scans.scan_id.status.200:1|c' in lines
+        assert u'tio.get.scans.scan_id.total_time:250|ms' in lines
+        assert u'tio.get.scans.scan_id.bytes:10|c' in lines and u'tio.get.scans.scan_id.retries:1|c' in lines
+        assert not any(u'connect_time' in line for line in lines), u'Missing measures are not sent.'
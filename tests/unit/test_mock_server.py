@@ -0,0 +1,71 @@
+import json
+import os
+import shutil
+import tempfile
+
+from tenable_io.api.scans import ScanCreateRequest, ScanLaunchRequest, ScanSettings
+from tests.base import BaseTest
+from tests.mock_server import MockServer, TrafficRecorder
+
+
+class TestMockServer(BaseTest):
+
+    def setup_method(self, method):
+        super(TestMockServer, self).setup_method(method)
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self, method):
+        shutil.rmtree(self.temp_dir)
+        super(TestMockServer, self).teardown_method(method)
+
+    def test_scans(self):
+        with MockServer(scans=3) as server:
+            client = server.client()
+            assert len(client.scans_api.list().scans) == 3
+            template = client.editor_api.list('scan').templates[0]
+            scan_id = client.scans_api.create(ScanCreateRequest(template.uuid, ScanSettings(u'new', u'127.0.0.1')))
+            client.scans_api.launch(scan_id, ScanLaunchRequest())
+            assert client.scans_api.details(scan_id).info.status == u'completed', u'Scan completes after launch.'
+            folder_id = client.folders_api.create(u'folder')
+            client.scans_api.folder(scan_id, folder_id)
+            assert [s.id for s in client.scans_api.list(folder_id).scans] == [scan_id], u'Scans are moved.'
+            client._session.close()
+
+    def test_workbench_export(self):
+        with MockServer(hosts=20, items_per_host=5) as server:
+            client = server.client()
+            pages = list(client.workbench_helper.vulnerabilities_parse(page_size=0))
+            client._session.close()
+        assert len(pages) == 1 and len(pages[0]) == 100, u'Export is downloaded and parsed.'
+
+    def test_throttle(self):
+        with MockServer(throttle_every=2) as server:
+            client = server.client()
+            for _ in range(3):
+                client.folders_api.list()
+            client._session.close()
+        assert len(server.requests) == 5, u'Throttled requests are retried.'
+
+    def test_pagination(self):
+        with MockServer(hosts=5) as server:
+            client = server.client()
+            response = client.get('workbenches/assets', params={'offset': 2, 'limit': 2}).json()
+            client._session.close()
+        assert len(response['assets']) == 2 and response['pagination']['total'] == 5
+
+    def test_record_replay(self):
+        fixtures = os.path.join(self.temp_dir, 'fixtures.jsonl')
+        with MockServer(scans=2) as server:
+            with TrafficRecorder(fixtures) as recorder:
+                client = recorder.attach(server.client())
+                expected = [s.name for s in client.scans_api.list().scans]
+                client.get('scans', stream=True).close()
+                client._session.close()
+        with open(fixtures) as f:
+            records = [json.loads(line) for line in f]
+        assert [r['body'] is None for r in records] == [False, True], u'Streamed bodies are not recorded.'
+
+        with MockServer(scans=0, fixtures=fixtures) as server:
+            client = server.client()
+            assert [s.name for s in client.scans_api.list().scans] == expected, u'Recorded responses are replayed.'
+            client._session.close()
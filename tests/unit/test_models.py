@@ -0,0 +1,68 @@
+from tenable_io.api.models import AgentList, Agent, AssetList, ExclusionSchedule, ExclusionRrules, PolicySettings, \
+    ScanDetails, ScanInfo, Vulnerability
+from tests.base import BaseTest
+
+
+class TestBaseModel(BaseTest):
+
+    def test_slots(self):
+        agent = Agent.from_dict({'id': 1, 'name': 'agent'})
+        assert agent.id == 1 and agent.name == 'agent' and agent.ip is None, u'Attributes are accessible.'
+        assert not agent.__dict__, u'Declared attributes are stored in slots.'
+        assert '_agents' in AgentList.__slots__, u'Properties are stored in underscore prefixed slots.'
+
+    def test_undeclared_attribute(self):
+        vulnerability = Vulnerability.from_dict({'plugin_id': 1, 'new_field': 'value'})
+        assert vulnerability.new_field == 'value', u'Undeclared attributes are kept.'
+        assert vulnerability.as_dict()['new_field'] == 'value', u'Undeclared attributes are part of the dict.'
+
+    def test_from_json_list(self):
+        agents = Agent.from_json_list(b'[{"id": 1, "name": "agent"}, {"id": 2}]')
+        assert [a.id for a in agents] == [1, 2] and agents[0].name == 'agent', u'JSON arrays are deserialized.'
+        assert Agent.from_json_list(b'[]') is None, u'Empty arrays are deserialized as None, as from_list.'
+
+    def test_model_list(self):
+        agent_list = AgentList.from_dict({'agents': [{'id': 1}, Agent(id=2)]})
+        assert [a.id for a in agent_list.agents] == [1, 2], u'Elements are coerced into models.'
+        assert all(isinstance(a, Agent) for a in agent_list.agents)
+        assert AgentList.from_dict({'agents': None}).agents == [], u'Non list value is coerced into an empty list.'
+
+    def test_nested_model(self):
+        details = ScanDetails.from_dict({'info': {'name': 'scan', 'pci-can-upload': True}, 'history': [{}]})
+        assert isinstance(details.info, ScanInfo) and details.info.name == 'scan'
+        assert details.info.pci_can_upload is True
+
+    def test_as_payload(self):
+        agent = Agent(id=1, name='agent')
+        payload = agent.as_payload(True)
+        assert payload == {'id': 1, 'name': 'agent'}, u'None values are filtered out of the payload.'
+
+        schedule = ExclusionSchedule(enabled=True, rrules=ExclusionRrules(freq='ONETIME'))
+        payload = schedule.as_payload()
+        assert payload == {'enabled': True, 'rrules': {'freq': 'ONETIME'}}, \
+            u'Payload overrides still see the attributes stored in slots.'
+
+
+class TestBaseModelDeserializer(BaseTest):
+
+    @staticmethod
+    def generic(cls, dict_):
+        instance = cls()
+        for key in dict_:
+            setattr(instance, key, dict_[key])
+        return instance
+
+    def test_same_as_generic(self):
+        dict_ = {'assets': [{'id': 'a', 'fqdn': ['a.example.com'], 'severities': [{'level': 1}], 'extra': 1}]}
+        asset = AssetList.from_dict(dict_).assets[0]
+        expected = self.generic(AssetList, dict_).assets[0]
+        assert asset.as_dict().keys() == expected.as_dict().keys(), u'Same attributes as the generic deserialization.'
+        assert asset.id == 'a' and asset.fqdn == ['a.example.com'] and asset.extra == 1
+        assert asset.severities[0].level == 1 and asset.severities[0].count is None, \
+            u'Nested models are deserialized with their defaults.'
+
+    def test_missing_keys_have_defaults(self):
+        agent_list = AgentList.from_dict({})
+        assert agent_list.agents == [], u'Model lists default to an empty list.'
+        assert agent_list.agents is not AgentList.from_dict({}).agents, u'Default lists are not shared.'
+        assert PolicySettings.from_dict({}).acls == [], u'Non None constructor defaults are kept.'
@@ -0,0 +1,162 @@
+import tempfile
+
+from tenable_io.helpers.workbench import CompactVulnerability, Vulnerability, _vulnerability_from_report_item
+from tenable_io.parser.workbenches import PluginTable, ReportFilter, WorkbenchParser
+from tenable_io.util import IterContentReader
+from tests.base import BaseTest
+
+NESSUS_REPORT = b'''<?xml version="1.0" ?>
+<NessusClientData_v2>
+<Report name="test">
+<ReportHost name="10.0.0.1">
+<HostProperties>
+<tag name="host-ip">10.0.0.1</tag>
+<tag name="host-fqdn">one.example.com</tag>
+</HostProperties>
+<ReportItem port="0" svc_name="general" protocol="tcp" severity="0" pluginID="19506" pluginName="Scan Info"
+ pluginFamily="Settings">
+<description>Scan information.</description>
+<see_also>http://example.com/a</see_also>
+<see_also>http://example.com/b</see_also>
+</ReportItem>
+<ReportItem port="22" svc_name="ssh" protocol="tcp" severity="2" pluginID="70658" pluginName="SSH Weak Ciphers"
+ pluginFamily="Misc.">
+<cvss_base_score>4.3</cvss_base_score>
+</ReportItem>
+</ReportHost>
+<ReportHost name="10.0.0.2">
+<HostProperties>
+<tag name="host-ip">10.0.0.2</tag>
+</HostProperties>
+<ReportItem port="80" svc_name="www" protocol="tcp" severity="3" pluginID="10107" pluginName="HTTP Server Type"
+ pluginFamily="Web Servers">
+</ReportItem>
+</ReportHost>
+</Report>
+</NessusClientData_v2>
+'''
+
+COMPLIANCE_REPORT = NESSUS_REPORT.replace(
+    b'<NessusClientData_v2>\n<Report name="test">',
+    b'<NessusClientData_v2>\n<Policy><policyName>Audit</policyName></Policy>\n'
+    b'<Report name="test" xmlns:cm="http://www.nessus.org/cm">'
+).replace(
+    b'<cvss_base_score>4.3</cvss_base_score>',
+    b'<cm:compliance-check-name>1.1 Ensure ciphers are strong</cm:compliance-check-name>\n'
+    b'<cm:compliance-result>FAILED</cm:compliance-result>'
+)
+
+
+def chunks(content, size=7):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+class TestWorkbenchParser(BaseTest):
+
+    def test_parse_report_host(self):
+        reports = list(WorkbenchParser.parse(IterContentReader(chunks(NESSUS_REPORT))))
+        assert len(reports) == 2, u'One dict per ReportHost.'
+        assert reports[0]['report_host']['name'] == '10.0.0.1'
+        assert reports[0]['host_properties']['host-fqdn'] == 'one.example.com'
+        assert [i['pluginID'] for i in reports[0]['report_items']] == ['19506', '70658']
+        assert reports[0]['report_items'][0]['see_also'] == ['http://example.com/a', 'http://example.com/b'], \
+            u'Repeated tags are collected into a list.'
+        assert [i['pluginID'] for i in reports[1]['report_items']] == ['10107']
+
+    def test_parse_report_item(self):
+        items = list(WorkbenchParser.parse(IterContentReader(chunks(NESSUS_REPORT)), tag=WorkbenchParser.REPORT_ITEM))
+        assert [i['pluginID'] for i in items] == ['19506', '70658', '10107'], u'One dict per ReportItem.'
+        assert items[1]['cvss_base_score'] == '4.3'
+
+    def test_host_offsets(self):
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(NESSUS_REPORT)
+            temp.flush()
+            header, offsets = WorkbenchParser.host_offsets(temp.name)
+        assert header == b'<?xml version="1.0" ?><NessusClientData_v2><Report name="test">', \
+            u'XML declaration and start tags are kept.'
+        assert len(offsets) == 2, u'One offset per ReportHost.'
+        assert all(NESSUS_REPORT[s:e].startswith(b'<ReportHost ') and NESSUS_REPORT[s:e].endswith(b'</ReportHost>')
+                   for (s, e) in offsets)
+        assert list(WorkbenchParser.iter_host_offsets(NESSUS_REPORT)) == offsets, u'Bytes are scanned as files.'
+
+    def test_parse_parallel(self):
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(NESSUS_REPORT)
+            temp.flush()
+            for tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM]:
+                expected = list(WorkbenchParser.parse(temp.name, tag))
+                for processes in [1, 2]:
+                    assert list(WorkbenchParser.parse_parallel(temp.name, tag, processes)) == expected, \
+                        u'Results are in document order.'
+                unordered = list(WorkbenchParser.parse_parallel(temp.name, tag, 2, ordered=False))
+                assert sorted(map(repr, unordered)) == sorted(map(repr, expected)), u'Unordered results are complete.'
+
+            vulnerabilities = list(WorkbenchParser.parse_parallel(temp.name, WorkbenchParser.REPORT_ITEM, 2,
+                                                                  transform=_vulnerability_from_report_item))
+            assert [v.plugin_id for v in vulnerabilities] == ['19506', '70658', '10107'], \
+                u'Transform is applied in the worker processes.'
+
+    def test_parse_parallel_namespaces(self):
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(COMPLIANCE_REPORT)
+            temp.flush()
+            header, offsets = WorkbenchParser.host_offsets(temp.name)
+            expected = list(WorkbenchParser.parse(temp.name, WorkbenchParser.REPORT_ITEM))
+            items = list(WorkbenchParser.parse_parallel(temp.name, WorkbenchParser.REPORT_ITEM, 2))
+        assert header.endswith(b'<Report name="test" xmlns:cm="http://www.nessus.org/cm">'), \
+            u'Namespace declarations are kept.'
+        assert b'Policy' not in header, u'Elements before the report are skipped.'
+        assert items == expected, u'Shards are parsed with the namespaces of the report.'
+        assert items[1]['{http://www.nessus.org/cm}compliance-result'] == 'FAILED'
+
+    def test_parse_report_filter(self):
+        def parse(tag=WorkbenchParser.REPORT_ITEM, **kwargs):
+            return list(WorkbenchParser.parse(IterContentReader(chunks(NESSUS_REPORT)), tag=tag, **kwargs))
+
+        items = parse(report_filter=ReportFilter(severities=[2, 3]))
+        assert [i['pluginID'] for i in items] == ['70658', '10107'], u'Items are filtered by severity.'
+        items = parse(report_filter=ReportFilter(plugin_families=['Misc.'], protocols=['TCP']))
+        assert [i['pluginID'] for i in items] == ['70658'], u'Criteria are combined.'
+        items = parse(report_filter=ReportFilter(hosts=['one.example.com']))
+        assert [i['pluginID'] for i in items] == ['19506', '70658'], u'Hosts are matched by FQDN.'
+
+        reports = parse(WorkbenchParser.REPORT_HOST, report_filter=ReportFilter(ports=[80]))
+        assert [r['report_host']['name'] for r in reports] == ['10.0.0.2'], u'Hosts without matching items are skipped.'
+        reports = parse(WorkbenchParser.REPORT_HOST, report_filter=ReportFilter(hosts=['10.0.0.2']))
+        assert [r['report_host']['name'] for r in reports] == ['10.0.0.2'], u'Hosts are matched by name.'
+
+        items = parse(fields=['cvss_base_score'])
+        assert 'description' not in items[0] and items[1]['cvss_base_score'] == '4.3', u'Only fields are extracted.'
+        assert items[0]['pluginName'] == 'Scan Info', u'Attributes are always extracted.'
+
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(NESSUS_REPORT)
+            temp.flush()
+            items = list(WorkbenchParser.parse_parallel(temp.name, WorkbenchParser.REPORT_ITEM, 2,
+                                                        report_filter=ReportFilter(plugin_ids=['10107'])))
+        assert [i['pluginID'] for i in items] == ['10107'], u'Filter is applied in the worker processes.'
+
+    def test_parse_plugin_table(self):
+        report = NESSUS_REPORT.replace(b'pluginID="10107"', b'pluginID="70658"')
+        expected = list(WorkbenchParser.parse(IterContentReader([report]), tag=WorkbenchParser.REPORT_ITEM))
+        plugins = PluginTable()
+        items = list(WorkbenchParser.parse(IterContentReader([report]), tag=WorkbenchParser.REPORT_ITEM,
+                                           plugins=plugins))
+        assert len(plugins) == 2 and plugins.get('19506')['description'] == 'Scan information.', \
+            u'Plugin level fields are stored once per plugin.'
+        assert items[0] == {'pluginID': '19506', 'port': '0', 'protocol': 'tcp', 'svc_name': 'general',
+                            'severity': '0'}, u'Items only have the fields specific to the finding.'
+        assert items[2]['port'] == '80' and items[2]['severity'] == '3'
+        assert [plugins.merge(i) for i in items[:2]] == expected[:2], u'Merged items have all the fields.'
+        assert plugins.merge(items[1])['pluginName'] is plugins.merge(items[2])['pluginName'], \
+            u'Plugin level values are shared.'
+
+        vulnerability = CompactVulnerability(items[1], plugins)
+        full = Vulnerability().from_report_item(expected[1])
+        assert all(getattr(vulnerability, k) == v for (k, v) in vars(full).items()), \
+            u'Compact vulnerabilities have the attributes of the merged item.'
+        vulnerability.severity = '4'
+        assert vulnerability.severity == '4', u'Assigned attributes take precedence.'
+        assert PluginTable().add({'pluginID': '1', 'svc_name': u'caf\xe9'})['svc_name'] == u'caf\xe9', \
+            u'Non-ASCII values are kept.'
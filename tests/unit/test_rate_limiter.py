@@ -0,0 +1,100 @@
+import threading
+
+from tenable_io.rate_limiter import RateLimitedRetry, RateLimiter
+from tests.base import BaseTest
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.lock = threading.Lock()
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def limiter(*args, **kwargs):
+    clock = FakeClock()
+    rate_limiter = RateLimiter(*args, **kwargs)
+    rate_limiter._clock = clock.time
+    rate_limiter._sleep = clock.sleep
+    rate_limiter._last = clock.now
+    return rate_limiter, clock
+
+
+class TestRateLimiter(BaseTest):
+
+    def test_acquire_rate(self):
+        rate_limiter, clock = limiter(10, burst=1)
+        start = clock.now
+        for _ in range(21):
+            rate_limiter.acquire()
+        assert abs(clock.now - start - 2) < 1e-6, u'Requests are spaced at the rate.'
+
+    def test_burst(self):
+        rate_limiter, clock = limiter(10, burst=5)
+        start = clock.now
+        for _ in range(5):
+            rate_limiter.acquire()
+        assert clock.now == start, u'A full bucket is issued at once.'
+
+    def test_throttled(self):
+        rate_limiter, clock = limiter(10)
+        rate_limiter.throttled('3')
+        assert rate_limiter.rate == 5, u'Rate is decreased on 429.'
+        start = clock.now
+        rate_limiter.acquire()
+        assert clock.now - start >= 3, u'Requests are held for the Retry-After delay.'
+
+        for _ in range(3):
+            clock.sleep(10)
+            rate_limiter.throttled()
+        assert rate_limiter.rate == 1, u'Rate is not decreased below the minimum.'
+
+    def test_throttled_window(self):
+        rate_limiter, clock = limiter(10, burst=10)
+        for _ in range(4):
+            # Concurrent requests are throttled at once.
+            rate_limiter.throttled('2')
+        assert rate_limiter.rate == 5, u'Rate is decreased once per window.'
+        assert rate_limiter._ceiling == 10, u'Ceiling is the rate before the decrease.'
+        clock.sleep(1.5)
+        rate_limiter.throttled()
+        assert rate_limiter.rate == 5, u'Window lasts for the Retry-After delay.'
+        clock.sleep(1)
+        rate_limiter.throttled()
+        assert rate_limiter.rate == 2.5 and rate_limiter._ceiling == 5, u'Rate is decreased after the window.'
+        clock.sleep(1)
+        rate_limiter.throttled()
+        assert rate_limiter.rate == 2.5, u'Without Retry-After, the window is the bucket refill time.'
+
+    def test_success(self):
+        rate_limiter, clock = limiter(8, min_rate=1, max_rate=20)
+        rate_limiter.throttled()
+        for _ in range(500):
+            rate_limiter.success()
+        assert 4 < rate_limiter.rate < 8, u'Rate recovers slowly close to the throttled rate.'
+        for _ in range(100000):
+            rate_limiter.success()
+        assert rate_limiter.rate == 20, u'Rate is not increased above the maximum.'
+
+    def test_parse_retry_after(self):
+        assert RateLimiter._parse_retry_after('2') == 2
+        assert RateLimiter._parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0, u'Past dates are no delay.'
+        assert RateLimiter._parse_retry_after('invalid') is None
+
+    def test_retry(self):
+        rate_limiter, clock = limiter(10)
+        retry = RateLimitedRetry(total=3, status_forcelist={429}, backoff_factor=0)
+        retry.rate_limiter = rate_limiter
+        response = type('Response', (object,), {'status': 429, 'headers': {'Retry-After': '1'},
+                                                'get_redirect_location': lambda self: None,
+                                                'getheader': lambda self, name: self.headers.get(name)})()
+        retry = retry.increment('GET', '/', response)
+        assert retry.rate_limiter is rate_limiter, u'Limiter is kept by new Retry instances.'
+        assert rate_limiter.rate == 5, u'Retried 429 are reported to the limiter.'
@@ -0,0 +1,138 @@
+import time
+
+from requests.exceptions import RequestException
+
+from tenable_io.exceptions import TenableIOException
+from tenable_io.helpers.scan import ScanRef, ScanWaiter
+from tenable_io.util import PollingPolicy
+from tests.base import BaseTest
+from tests.mock_server import MockServer
+
+
+class TestScanBatch(BaseTest):
+
+    polling_policy = PollingPolicy(initial=0.1, deadline=30)
+
+    def test_launch_many_scanner_limit(self):
+        with MockServer(scans=6, scanners=2, scan_duration=1) as server:
+            peaks = {}
+            scan_control = server._scan_control
+
+            def recorded_scan_control(*args):
+                response = scan_control(*args)
+                for scanner in server.scanners:
+                    running = sum(1 for s in server.scans.values()
+                                  if s['scanner_name'] == scanner['name'] and s['status'] == u'running')
+                    peaks[scanner['name']] = max(peaks.get(scanner['name'], 0), running)
+                return response
+            server._scan_control = recorded_scan_control
+
+            client = server.client()
+            scans = client.scan_helper.scans()
+            results = client.scan_helper.launch_many(scans, scanner_limit=2, polling_policy=self.polling_policy)
+            client._session.close()
+
+        assert [r.scan.id for r in results] == [s.id for s in scans], u'Results are in the order of the scans.'
+        assert all(r.ok for r in results), u'All scans are launched.'
+        assert all(r.scanner for r in results), u'Scanners are looked up.'
+        assert all(s['history'] for s in server.scans.values()), u'All scans are launched.'
+        assert max(peaks.values()) == 2, u'Running scans per scanner do not exceed the limit.'
+
+    def test_stop_many_errors(self):
+        with MockServer(scans=3, scan_duration=60) as server:
+            client = server.client()
+            scans = client.scan_helper.scans()
+            client.scan_helper.launch_many(scans[:2], polling_policy=self.polling_policy)
+            results = client.scan_helper.stop_many(scans + [ScanRef(client, 1)], polling_policy=self.polling_policy)
+            client._session.close()
+
+        assert [r.ok for r in results] == [True, True, False, False], u'Failures do not fail the batch.'
+        assert [r.status for r in results[:2]] == [u'canceled', u'canceled'], u'Stopped scans are waited on.'
+        assert results[3].error is not None
+
+    def test_launch_many_timeout(self):
+        with MockServer(scans=3, scan_duration=60) as server:
+            handle = server.handle
+            slow_path = None
+
+            def slow_handle(method, path, *args):
+                if path == slow_path:
+                    time.sleep(1)
+                return handle(method, path, *args)
+            server.handle = slow_handle
+
+            client = server.client(read_timeout=0.5)
+            scans = client.scan_helper.scans()
+            slow_path = 'scans/%d/launch' % scans[1].id
+            results = client.scan_helper.launch_many(scans, polling_policy=self.polling_policy)
+            client._session.close()
+
+        assert [r.ok for r in results] == [True, False, True], u'A timed out request does not fail the batch.'
+        assert isinstance(results[1].error, RequestException), u'The transport error is kept on the result.'
+        assert [results[0].status, results[2].status] == [u'running', u'running'], u'Other scans are waited on.'
+
+    def test_pause_many(self):
+        with MockServer(scans=2, scan_duration=60) as server:
+            client = server.client()
+            scans = client.scan_helper.scans()
+            client.scan_helper.launch_many(scans, polling_policy=self.polling_policy)
+            results = client.scan_helper.pause_many(scans, wait=False, concurrency=1)
+            client._session.close()
+
+        assert all(r.ok and r.status is None for r in results), u'Scans are paused without waiting.'
+        assert [s['status'] for s in server.scans.values()] == [u'paused', u'paused']
+
+    def test_stop_all_errors(self):
+        with MockServer(scans=3, scan_duration=60) as server:
+            client = server.client()
+            scans = client.scan_helper.scans()
+            client.scan_helper.launch_many(scans[:2], polling_policy=self.polling_policy)
+            scan_control = server._scan_control
+
+            def failing_scan_control(query, payload, headers, scan_id, action):
+                if int(scan_id) == scans[0].id:
+                    return 403, {'error': u'Forbidden.'}
+                return scan_control(query, payload, headers, scan_id, action)
+            server._scan_control = failing_scan_control
+
+            try:
+                client.scan_helper.stop_all(polling_policy=self.polling_policy)
+                assert False, u'Running scans failing to stop are reported.'
+            except TenableIOException as e:
+                assert str(e).startswith(u'Failed to stop scans: %s (' % scans[0].id)
+                assert str(scans[2].id) not in str(e), u'Scans failing to stop as they are not running are ignored.'
+            client._session.close()
+
+        assert [server.scans[s.id]['status'] for s in scans] == [u'running', u'canceled', u'empty']
+
+
+class TestScanWaiter(BaseTest):
+
+    def test_wait(self):
+        with MockServer(scans=3, scan_duration=2) as server:
+            client = server.client()
+            scans = client.scan_helper.scans()
+            client.scan_helper.launch_many(scans[:2], wait=False)
+
+            waiter = ScanWaiter(client)
+            callbacks = []
+            for scan in scans:
+                waiter.add(scan, callback=lambda scan, status: callbacks.append((scan.id, status)))
+            polls = [0]
+            poll = waiter.poll
+
+            def counted_poll():
+                polls[0] += 1
+                return poll()
+            waiter.poll = counted_poll
+
+            del server.requests[:]
+            statuses = waiter.wait(PollingPolicy(initial=0.1, deadline=30))
+            client._session.close()
+
+        assert callbacks[0] == (scans[2].id, u'empty'), u'Callbacks fire as soon as the status is terminal.'
+        assert sorted(callbacks[1:]) == [(scans[0].id, u'completed'), (scans[1].id, u'completed')]
+        assert statuses == dict(callbacks), u'Final statuses are returned.'
+        assert not waiter.pending()
+        assert polls[0] > 1 and server.requests == [('GET', 'scans')] * polls[0], \
+            u'The scan list is fetched once per polling cycle.'
@@ -0,0 +1,45 @@
+import time
+
+from tenable_io.helpers.folder import FolderRef
+from tenable_io.helpers.scan import ScanCatalog
+from tests.base import BaseTest
+from tests.mock_server import MockServer
+
+
+class TestScanCatalog(BaseTest):
+
+    def test_scans(self):
+        with MockServer(scans=5) as server:
+            client = server.client()
+            client.scan_helper.catalog = ScanCatalog(client, max_age=60)
+            names = [u'Scan %d' % i for i in range(5)]
+            by_name = [client.scan_helper.scans(name=name) for name in names]
+            folder = client.folder_helper.folders(name=u'My Scans')[0]
+            in_folder = folder.scans()
+            matched = client.scan_helper.scans(name_regex=u'Scan [0-2]$')
+            client._session.close()
+
+        assert [len(scans) for scans in by_name] == [1] * 5, u'Scans are found by name.'
+        assert len(in_folder) == 5, u'Scans are found by folder.'
+        assert len(matched) == 3, u'Scans are found by regular expression.'
+        assert server.requests.count(('GET', 'scans')) == 1, u'Scans are listed once.'
+
+    def test_refresh(self):
+        with MockServer(scans=3) as server:
+            client = server.client()
+            catalog = client.scan_helper.catalog = ScanCatalog(client, max_age=0)
+            scans = client.scan_helper.scans()
+            schedule_ids = catalog.schedule_ids()
+
+            # Modified scans are listed again, after the timestamp of the last list.
+            time.sleep(1)
+            folder_id = client.folders_api.create(u'folder')
+            scans[0].move_to(FolderRef(client, folder_id))
+            in_folder = client.scan_helper.scans(folder_id=folder_id)
+            scans[1].delete()
+            remaining = client.scan_helper.scans()
+            client._session.close()
+
+        assert len(schedule_ids) == 3 and sorted(schedule_ids.values()) == [s.id for s in scans]
+        assert [s.id for s in in_folder] == [scans[0].id], u'Moved scans are updated.'
+        assert [s.id for s in remaining] == [scans[0].id, scans[2].id], u'Deleted scans are removed.'
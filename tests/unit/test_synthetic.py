@@ -0,0 +1,41 @@
+import json
+import os
+import shutil
+import tempfile
+
+from tenable_io.api.models import AssetList, ScanList, ScannerScanList, VulnerabilityList
+from tenable_io.parser.workbenches import WorkbenchParser
+from tenable_io.util import IterContentReader
+from tests.base import BaseTest
+from tests.synthetic import SyntheticData, main
+
+
+class TestSyntheticData(BaseTest):
+
+    def test_nessus(self):
+        data = SyntheticData(hosts=20, items_per_host=5, plugins=8, text_size=50)
+        reports = list(WorkbenchParser.parse(IterContentReader(data.iter_nessus())))
+        assert len(reports) == 20 and all(len(r['report_items']) == 5 for r in reports), u'Sizes are respected.'
+        assert reports[3]['host_properties']['host-uuid'] == data.host(3)['host-uuid']
+        items = [item for report in reports for item in report['report_items']]
+        assert len(set(item['pluginID'] for item in items)) <= 8, u'Plugins are drawn from the plugin cardinality.'
+        assert all(len(item['description']) == 50 for item in items), u'Text sizes are respected.'
+        assert data.nessus() == SyntheticData(hosts=20, items_per_host=5, plugins=8, text_size=50).nessus(), \
+            u'Data is reproducible.'
+
+    def test_json(self):
+        data = SyntheticData(hosts=10, plugins=30, scans=4)
+        assert len(AssetList.from_json(data.json('assets')).assets) == 10
+        assert len(VulnerabilityList.from_json(data.json('vulnerabilities')).vulnerabilities) == 30
+        assert len(ScanList.from_json(data.json('scans')).scans) == 4
+        assert len(ScannerScanList.from_json(data.json('scanner_scans')).scans) == 4
+
+    def test_main(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'assets.json')
+            main(['assets', path, '--hosts', '3'])
+            with open(path) as f:
+                assert json.load(f)['total'] == 3, u'Payload is written.'
+        finally:
+            shutil.rmtree(temp_dir)
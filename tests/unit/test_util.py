@@ -0,0 +1,132 @@
+import io
+import threading
+import time
+
+from tenable_io.exceptions import TenableIOException
+from tenable_io.util import IterContentReader, PollingPolicy, copy_stream, memoize, parallel_map, wait_until
+from tests.base import BaseTest
+
+
+class TestIterContentReader(BaseTest):
+
+    def test_read_sizes(self):
+        reader = IterContentReader(iter([b'abc', b'def', b'g']))
+        assert reader.read(2) == b'ab', u'Reads no more than the requested size.'
+        assert reader.read(4) == b'cdef', u'Reads across chunk boundaries.'
+        assert reader.read(10) == b'g', u'Reads what is left when the iterator is exhausted.'
+        assert reader.read(10) == b'', u'Reads nothing once exhausted.'
+
+    def test_read_large_chunks(self):
+        chunk = bytes(bytearray(range(256))) * 64
+        reader = IterContentReader([b'', chunk, b'', chunk])
+        data = b''.join(iter(lambda: reader.read(100), b''))
+        assert data == chunk * 2, u'Small reads of large chunks, skipping empty chunks.'
+
+    def test_read_all(self):
+        reader = IterContentReader([b'abc', b'def'])
+        assert reader.read(1) == b'a'
+        assert reader.read() == b'bcdef', u'Reads everything left without a size.'
+
+
+class TestParallelMap(BaseTest):
+
+    def test_order_preserved(self):
+        assert parallel_map(lambda x: x * 2, range(20), concurrency=4) == [x * 2 for x in range(20)], \
+            u'Results are in the same order as the items.'
+        assert parallel_map(lambda x: x * 2, range(20), concurrency=1) == [x * 2 for x in range(20)], \
+            u'Results are the same when run sequentially.'
+
+    def test_concurrency_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def f(_):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+
+        parallel_map(f, range(12), concurrency=3)
+        assert 1 < state['max'] <= 3, u'Calls run concurrently up to the concurrency limit.'
+
+    def test_exception_raised(self):
+        def f(x):
+            if x == 3:
+                raise ValueError(x)
+            return x
+        try:
+            parallel_map(f, range(6), concurrency=2)
+            assert False, u'Exception should be raised.'
+        except ValueError:
+            pass
+
+
+class TestMemoize(BaseTest):
+
+    def test_called_once_per_arguments(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            time.sleep(0.01)
+            return x * 2
+
+        memoized = memoize(f)
+        assert parallel_map(memoized, [1, 2, 1, 1, 2, 3], concurrency=6) == [2, 4, 2, 2, 4, 6]
+        assert sorted(calls) == [1, 2, 3], u'Function is called at most once per distinct arguments.'
+
+
+class TestPollingPolicy(BaseTest):
+
+    def test_intervals(self):
+        intervals = PollingPolicy(initial=1, max=5, multiplier=2).intervals()
+        assert [next(intervals) for _ in range(5)] == [1, 2, 4, 5, 5], u'Interval grows up to the maximum.'
+
+    def test_jitter(self):
+        intervals = PollingPolicy(initial=10, jitter=0.5).intervals()
+        assert all(5 <= next(intervals) <= 15 for _ in range(20)), u'Jitter stays within the fraction of the interval.'
+
+        intervals = PollingPolicy(initial=10, max=10, jitter=0.5).intervals()
+        assert all(5 <= next(intervals) <= 10 for _ in range(20)), u'Jitter does not exceed the maximum.'
+
+    def test_wait_until_max_attempts(self):
+        calls = []
+        try:
+            wait_until(lambda: calls.append(1), polling_policy=PollingPolicy(initial=0, max_attempts=3))
+            assert False, u'TenableIOException should be raised.'
+        except TenableIOException:
+            pass
+        assert len(calls) == 3, u'Condition is polled the maximum number of attempts.'
+
+    def test_wait_until_deadline(self):
+        start_time = time.time()
+        try:
+            wait_until(lambda: False, polling_policy=PollingPolicy(initial=0.01, deadline=0.1))
+            assert False, u'TenableIOException should be raised.'
+        except TenableIOException:
+            pass
+        assert time.time() - start_time < 1, u'Waiting stops at the deadline.'
+
+    def test_wait_until_context(self):
+        def condition(context):
+            context['count'] = context.get('count', 0) + 1
+            return context['count'] >= 3
+        assert wait_until(condition, context={}, polling_policy=PollingPolicy(initial=0)), \
+            u'Returns True once the condition is met.'
+
+
+class TestCopyStream(BaseTest):
+
+    def test_copy_stream(self):
+        counts = []
+        destination = io.BytesIO()
+        assert copy_stream(io.BytesIO(b'abcdefg'), destination, 3, counts.append) == 7
+        assert destination.getvalue() == b'abcdefg' and counts == [3, 3, 1], u'Stream is copied by buffer size.'
+
+    def test_copy_without_readinto(self):
+        source = IterContentReader([b'abc', b'defg'])
+        destination = io.BytesIO()
+        assert copy_stream(source, destination, 4) == 7 and destination.getvalue() == b'abcdefg', \
+            u'Sources without readinto are read.'